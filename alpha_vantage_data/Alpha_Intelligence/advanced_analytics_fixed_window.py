@@ -10,7 +10,7 @@ from rich.panel import Panel
 from rich.text import Text 
 console = Console() 
 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -162,7 +162,7 @@ def advanced_analytics_fixed_window():
     analytics_fixed_window_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(analytics_fixed_window_url)  
+    response = av_get(analytics_fixed_window_url)  
     data = response.json() 
     Path('p_sql_two/Analytics_JSON/Fixed_Window').mkdir(parents=True, exist_ok=True) 
 
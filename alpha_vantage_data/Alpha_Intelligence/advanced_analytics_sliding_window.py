@@ -9,7 +9,7 @@ from rich.panel import Panel
 from rich.text import Text 
 console = Console() 
 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -179,7 +179,7 @@ def advanced_analytics_sliding_window():
     analytics_sliding_window_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(analytics_sliding_window_url)  
+    response = av_get(analytics_sliding_window_url)  
     data = response.json() 
     Path('Analytics_JSON/Sliding_Window').mkdir(exist_ok=True) 
 
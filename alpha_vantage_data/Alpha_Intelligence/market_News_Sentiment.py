@@ -11,7 +11,7 @@ from rich.text import Text
 console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json  
 
@@ -355,7 +355,7 @@ def fetch_market_news_and_sentiments():
     print(f"Request URL: {News_Sentiment_Url}")  # For debugging
 
     # Fetch and Format as JSON 
-    response = requests.get(News_Sentiment_Url) 
+    response = av_get(News_Sentiment_Url) 
     data = response.json() 
 
     Path("p_sql_two/News_Sentiment_JSON").mkdir(exist_ok=True) 
@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -38,7 +38,7 @@ def market_movers():
     market_movers_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(market_movers_url)  
+    response = av_get(market_movers_url)  
     data = response.json() 
 
     
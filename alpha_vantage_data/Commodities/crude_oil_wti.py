@@ -11,7 +11,8 @@ from rich.text import Text
 console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
 import pandas as pd 
 
 # ==================================================================================================================== # 
@@ -70,19 +71,10 @@ def wti_crude_oil():
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
     # Download and save the csv
-    response = requests.get(CSV_URL)
+    response = av_get(CSV_URL)
     Path('Commodity_Data').mkdir(exist_ok=True)
 
     filename = f"Commodity_Data/wti_crude_oil_{interval}.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded WTI Crude Oil ({interval}) Data to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
 
     # Define the Column Mapping
     column_mapping = {
@@ -90,13 +82,9 @@ def wti_crude_oil():
         'value': 'WTI Price (USD per Barrel)'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
-
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    df, filename = normalize_csv_response(response, filename, column_mapping)
 
-    print(f'Column names Successfully Converted for {filename}')
+    print(f"Successfully Downloaded WTI Crude Oil ({interval}) Data to {filename}")
 
 if __name__ == '__main__':
     wti_crude_oil()
\ No newline at end of file
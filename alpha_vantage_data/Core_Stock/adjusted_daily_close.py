@@ -6,7 +6,9 @@ from urllib.parse import urlencode
 from pathlib import Path 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 
 def fetch_adjusted_daily_closing(): 
@@ -53,19 +55,10 @@ def fetch_adjusted_daily_closing():
     CSV_URL = f"{base_url}?{urlencode(params)}" 
 
     # Download and save the csv 
-    response = requests.get(CSV_URL) 
+    response = av_get(CSV_URL) 
     Path('Daily_Historical_Data').mkdir(exist_ok=True) 
 
     filename = f"Daily_Historical_Data/{ticker}.csv" 
-    with open(filename, 'w') as file: 
-        file.write(response.text) 
-
-    print(f"Successfully Downloaded Historical ADC for {ticker} to {filename}")  
-
-    # Rename the Column names of the Csv for compatibility with QsTrader Backtesting 
-    print(f'Converting Column names for {filename}...') 
-
-    df = pd.read_csv(filename) 
 
     # Define the Column Mapping 
     column_mapping = { 
@@ -80,13 +73,13 @@ def fetch_adjusted_daily_closing():
         'split_coefficient': 'Split Coefficient'
     } 
 
-    # Rename Column names Using Mapping 
-    df.rename(columns=column_mapping, inplace=True) 
+    df, filename = normalize_csv_response(response, filename, column_mapping)
 
-    # Save Update CSV 
-    df.to_csv(filename, index = False) 
+    print(f"Successfully Downloaded Historical ADC for {ticker} to {filename}")  
 
-    print(f'Column names Sucessfully Converted for {filename}') 
+    # Upsert into the local Parquet store (typed, partitioned by symbol/interval/year) alongside the CSV
+    added = timeseries_store.upsert(ticker, 'daily', df)
+    print(f'Upserted {added} new bars for {ticker} into {timeseries_store.STORE_ROOT}')
     print('')
     print('')
     return True
@@ -11,8 +11,10 @@ from pathlib import Path
 # console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import parse_csv_body, write_frame
 import pandas as pd 
+from concurrent.futures import ThreadPoolExecutor 
 
 # ==================================================================================================================== # 
 # ==================================================================================================================== # 
@@ -47,7 +49,6 @@ from pathlib import Path
 # console = Console() 
 
 import csv 
-import requests 
 import pandas as pd 
 
 # ==================================================================================================================== # 
@@ -70,76 +71,93 @@ import pandas as pd
 
 # ==================================================================================================================== # 
 # ==================================================================================================================== # 
-def realtime_bulk_quotes():
-    load_dotenv() 
-    api_key = os.getenv("ALPHA_VANTAGE_API_KEY") 
-    if not api_key: 
-        print("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory") 
-        exit()
-
-    # Get Symbols Input
-    print("Enter up to 100 stock symbols separated by commas (e.g., AAPL,MSFT,GOOGL):")
-    symbols_input = input("Symbols: ")
-    
-    # Clean up the input and validate
-    symbols = [symbol.strip().upper() for symbol in symbols_input.split(',')]
-    
-    if len(symbols) > 100:
-        print(f"Warning: You entered {len(symbols)} symbols. Only the first 100 will be processed.")
-        symbols = symbols[:100]
-    
-    symbols_string = ','.join(symbols)
-
-    # API url Format with Parameters
+# Column Mapping (adjust based on actual API response columns)
+BULK_QUOTES_COLUMN_MAPPING = {
+    'symbol': 'Symbol',
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'price': 'Price',
+    'volume': 'Volume',
+    'latest_trading_day': 'Latest Trading Day',
+    'previous_close': 'Previous Close',
+    'change': 'Change',
+    'change_percent': 'Change Percent'
+}
+
+MAX_SYMBOLS_PER_CALL = 100
+
+
+def chunk_symbols(symbols, size=MAX_SYMBOLS_PER_CALL):
+    # Clean, de-duplicate (keeping order) and split into API-sized chunks
+    cleaned = list(dict.fromkeys(s.strip().upper() for s in symbols if s and s.strip()))
+    return [cleaned[i:i + size] for i in range(0, len(cleaned), size)]
+
+
+def fetch_bulk_quotes_chunk(symbols, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {
         'function': 'REALTIME_BULK_QUOTES',
-        'symbol': symbols_string,
+        'symbol': ','.join(symbols),
         'apikey': api_key,
         'datatype': 'csv',
         'entitlement': 'realtime'
     }
+    response = av_get(f"{base_url}?{urlencode(params)}")
 
-    # Build CSV URL with params
-    CSV_URL = f"{base_url}?{urlencode(params)}"
+    # Parse straight from memory - no per-chunk CSV written to disk and read back
+    return parse_csv_body(response.content)
 
-    # Download and save the csv
-    response = requests.get(CSV_URL)
-    Path('Bulk_Quotes_Data').mkdir(exist_ok=True)
 
-    filename = f"Bulk_Quotes_Data/bulk_quotes_{len(symbols)}_symbols.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
+def fetch_bulk_quotes(symbols, api_key=None, max_workers=8, as_arrow=False):
+    # Programmatic bulk-quote API: any number of symbols -> 100-symbol chunks fetched concurrently
+    # (paced by the shared rate limiter in av_get) -> one merged DataFrame (or pyarrow Table with as_arrow=True)
+    if api_key is None:
+        load_dotenv()
+        api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
+    if not api_key:
+        raise ValueError("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory")
 
-    print(f"Successfully Downloaded Bulk Quotes for {len(symbols)} symbols to {filename}")
+    chunks = chunk_symbols(symbols)
+    if not chunks:
+        df = pd.DataFrame(columns=list(BULK_QUOTES_COLUMN_MAPPING.values()))
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            frames = list(executor.map(lambda chunk: fetch_bulk_quotes_chunk(chunk, api_key), chunks))
+        df = pd.concat(frames, ignore_index=True)
+        df.rename(columns=BULK_QUOTES_COLUMN_MAPPING, inplace=True)
 
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
-
-    # Define the Column Mapping (adjust based on actual API response columns)
-    column_mapping = {
-        'symbol': 'Symbol',
-        'open': 'Open',
-        'high': 'High',
-        'low': 'Low',
-        'price': 'Price',
-        'volume': 'Volume',
-        'latest_trading_day': 'Latest Trading Day',
-        'previous_close': 'Previous Close',
-        'change': 'Change',
-        'change_percent': 'Change Percent'
-    }
+    if as_arrow:
+        import pyarrow as pa
+        return pa.Table.from_pandas(df, preserve_index=False)
+    return df
+
+
+def realtime_bulk_quotes():
+    load_dotenv() 
+    api_key = os.getenv("ALPHA_VANTAGE_API_KEY") 
+    if not api_key: 
+        print("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory") 
+        exit()
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
+    # Get Symbols Input
+    print("Enter stock symbols separated by commas (e.g., AAPL,MSFT,GOOGL):")
+    print(f"Lists longer than {MAX_SYMBOLS_PER_CALL} symbols are split into {MAX_SYMBOLS_PER_CALL}-symbol requests sent in parallel.")
+    symbols_input = input("Symbols: ")
+    
+    # Clean up the input
+    symbols = [symbol.strip().upper() for symbol in symbols_input.split(',') if symbol.strip()]
+    chunks = chunk_symbols(symbols)
+    print(f"Fetching {sum(len(c) for c in chunks)} symbols in {len(chunks)} request(s)...")
+
+    # Download, merge and rename in memory
+    df = fetch_bulk_quotes(symbols, api_key=api_key)
 
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    # Save the final file once
+    filename = write_frame(df, f"Bulk_Quotes_Data/bulk_quotes_{len(symbols)}_symbols.csv")
 
-    print(f'Column names Successfully Converted for {filename}')
+    print(f"Successfully Downloaded Bulk Quotes for {len(symbols)} symbols to {filename}")
 
 
 if __name__ == '__main__':
-    realtime_bulk_quotes()
\ No newline at end of file
+    realtime_bulk_quotes()
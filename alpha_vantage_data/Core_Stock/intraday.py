@@ -4,9 +4,17 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import download_csv, parse_csv_body
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 
+load_dotenv() 
+
+# ALPHA_VANTAGE_INTRADAY_DIR - where fetch_intraday_stocks writes its {ticker}_{interval}.csv files (default Intraday_Data)
+INTRADAY_DIR = Path(os.getenv('ALPHA_VANTAGE_INTRADAY_DIR', 'Intraday_Data'))
+INTRADAY_INTERVALS = ('1min', '5min', '15min', '30min', '60min')
+
 
 # ==================================================================================================================== # 
 # ==================================================================================================================== # 
@@ -34,6 +42,35 @@ import pandas as pd
 
 # ==================================================================================================================== #
 # ==================================================================================================================== # 
+def intraday_params(ticker, interval, api_key, outputsize='compact', month=None, adjusted=True, extended_hours=True): 
+    params = {
+        'function': 'TIME_SERIES_INTRADAY',
+        'symbol': ticker,
+        'interval': interval,
+        'apikey': api_key,
+        'datatype': 'csv',
+        'outputsize': outputsize,
+        'adjusted': 'true' if adjusted else 'false',
+        'extended_hours': 'true' if extended_hours else 'false',
+        'entitlement': 'realtime'
+    }
+    if month: 
+        params['month'] = month  # YYYY-MM - with outputsize=full returns that whole month 
+    return params 
+
+
+def download_intraday(ticker, interval, api_key=None, outputsize='compact', month=None, adjusted=True, extended_hours=True, 
+                      use_cache=True): 
+    # Programmatic fetch: parsed bars as a DataFrame straight from memory (nothing written to disk) 
+    # NOTE: use_cache=False keeps one-off bulk pulls (e.g. the month backfill) out of the response cache 
+    api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY") 
+    if interval not in INTRADAY_INTERVALS: 
+        raise ValueError(f"interval must be one of {', '.join(INTRADAY_INTERVALS)}") 
+    params = intraday_params(ticker, interval, api_key, outputsize, month, adjusted, extended_hours) 
+    response = av_get('https://www.alphavantage.co/query', params=params, use_cache=use_cache) 
+    return parse_csv_body(response.content) 
+
+
 def fetch_intraday_stocks(): 
     load_dotenv() 
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")  
@@ -79,35 +116,14 @@ def fetch_intraday_stocks():
 
     # API url Format with Parameters
     base_url = 'https://www.alphavantage.co/query'
-    params = {
-        'function': 'TIME_SERIES_INTRADAY',
-        'symbol': ticker,
-        'interval': interval,
-        'apikey': api_key,
-        'datatype': 'csv',
-        'outputsize': output_size,
-        'adjusted': 'true',
-        'extended_hours': 'true',
-        'entitlement': 'realtime'
-    }
+    # Raw (as-traded) bars, the same basis intraday_backfill / intraday_refresh store - adjusted bars come from
+    # price_adjustments.read_adjusted(ticker, interval) so the store never mixes split bases
+    params = intraday_params(ticker, interval, api_key, outputsize=output_size, adjusted=False)
 
     # Build CSV URL with params
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
-    # Download and save the csv
-    response = requests.get(CSV_URL)
-    Path('p_sql_two/Intraday_Data').mkdir(exist_ok=True)
-
-    filename = f"p_sql_two/Intraday_Data/{ticker}_{interval}.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded Intraday Data for {ticker} ({interval}) to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
+    filename = INTRADAY_DIR / f"{ticker}_{interval}.csv"
 
     # Define the Column Mapping
     column_mapping = {
@@ -119,13 +135,14 @@ def fetch_intraday_stocks():
         'volume': 'Volume'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
-
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    # Stream the body to disk, then parse / rename / write the final file in typed batches (flat memory for full
+    # histories); each batch is also upserted into the local Parquet store (partitioned by symbol/interval/year)
+    added = []
+    rows, filename = download_csv(CSV_URL, filename, column_mapping,
+                                  on_batch=lambda batch: added.append(timeseries_store.upsert(ticker, interval, batch)))
 
-    print(f'Column names Successfully Converted for {filename}')
+    print(f"Successfully Downloaded Intraday Data for {ticker} ({interval}) to {filename}")
+    print(f'Upserted {sum(added)} new bars for {ticker} into {timeseries_store.STORE_ROOT}')
 
 
 if __name__ == '__main__':
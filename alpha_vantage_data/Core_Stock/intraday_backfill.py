@@ -0,0 +1,164 @@
+# ==================================================================================================================== #
+# Intraday Backfill: Years of intraday history pulled month by month (TIME_SERIES_INTRADAY month=YYYY-MM,
+# outputsize=full) across many symbols in parallel and upserted into the Time Series Store.
+# Every finished (symbol, interval, month) partition is checkpointed in SQLite, so an interrupted run picks up exactly
+# where it stopped instead of starting over. The month still in progress is never checkpointed - it is re-pulled on
+# every run until it is over.
+# Bars are stored raw (adjusted=false): each month pulled with adjusted=true would be on the split basis of the day it
+# was pulled, so a later split would leave the store mixing bases. Read adjusted bars through
+# price_adjustments.read_adjusted(symbol, interval) instead. Backfill pulls bypass the response cache - every month is
+# fetched once and would only churn the LRU.
+# ==================================================================================================================== #
+
+import os
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dotenv import load_dotenv
+
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Core_Stock.intraday import INTRADAY_INTERVALS, download_intraday
+
+load_dotenv()
+
+# ALPHA_VANTAGE_BACKFILL_DB - checkpoint file of completed partitions (default ~/.alpha_vantage/intraday_backfill.db)
+BACKFILL_DB = Path(os.getenv('ALPHA_VANTAGE_BACKFILL_DB', Path.home() / '.alpha_vantage' / 'intraday_backfill.db'))
+FIRST_MONTH = '2000-01'  # earliest month the API serves
+
+_db_lock = threading.Lock()
+
+
+# ==================================================================================================================== #
+# Checkpoints
+# ==================================================================================================================== #
+
+def _connect():
+    BACKFILL_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(BACKFILL_DB, timeout=30, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS partitions ('
+        'symbol TEXT, interval TEXT, month TEXT, bars INTEGER, completed REAL, '
+        'PRIMARY KEY (symbol, interval, month))'
+    )
+    return conn
+
+
+def completed_months(symbol, interval):
+    conn = _connect()
+    try:
+        rows = conn.execute('SELECT month FROM partitions WHERE symbol = ? AND interval = ?',
+                            (symbol.upper(), interval)).fetchall()
+        return {month for (month,) in rows}
+    finally:
+        conn.close()
+
+
+def mark_completed(symbol, interval, month, bars):
+    with _db_lock:
+        conn = _connect()
+        try:
+            conn.execute('INSERT OR REPLACE INTO partitions (symbol, interval, month, bars, completed) VALUES (?, ?, ?, ?, ?)',
+                         (symbol.upper(), interval, month, bars, time.time()))
+        finally:
+            conn.close()
+
+
+def reset(symbol=None, interval=None):
+    # Forget checkpoints (all, one symbol, or one symbol/interval) so those months are pulled again
+    conn = _connect()
+    try:
+        clauses, params = [], []
+        if symbol:
+            clauses.append('symbol = ?')
+            params.append(symbol.upper())
+        if interval:
+            clauses.append('interval = ?')
+            params.append(interval)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        conn.execute(f'DELETE FROM partitions{where}', params)
+    finally:
+        conn.close()
+
+
+def progress(symbols, interval, start=FIRST_MONTH, end=None):
+    # {symbol: (completed months, total months)} for a planned backfill
+    months = month_range(start, end)
+    return {s.upper(): (len(completed_months(s, interval) & set(months)), len(months)) for s in symbols}
+
+
+# ==================================================================================================================== #
+# Backfill
+# ==================================================================================================================== #
+
+def month_range(start=FIRST_MONTH, end=None):
+    # 'YYYY-MM' strings from start through end (default: the current month), oldest first
+    end = end or pd.Timestamp.today().strftime('%Y-%m')
+    return [p.strftime('%Y-%m') for p in pd.period_range(max(start, FIRST_MONTH), end, freq='M')]
+
+
+def pending_partitions(symbols, interval, start=FIRST_MONTH, end=None):
+    months = month_range(start, end)
+    pending = []
+    for symbol in symbols:
+        done = completed_months(symbol, interval)
+        pending.extend((symbol.upper(), month) for month in months if month not in done)
+    return pending
+
+
+def backfill_partition(symbol, interval, month, api_key=None, adjusted=False, extended_hours=True):
+    # One month of one symbol: download -> upsert -> checkpoint. Returns the number of new bars stored.
+    df = download_intraday(symbol, interval, api_key=api_key, outputsize='full', month=month,
+                           adjusted=adjusted, extended_hours=extended_hours, use_cache=False)
+    added = timeseries_store.upsert(symbol, interval, df) if not df.empty else 0
+    if month < pd.Timestamp.today().strftime('%Y-%m'):
+        mark_completed(symbol, interval, month, len(df))
+    return added
+
+
+def backfill(symbols, interval='1min', start=FIRST_MONTH, end=None, max_workers=8, api_key=None,
+             adjusted=False, extended_hours=True):
+    # Fan every pending (symbol, month) out over a worker pool - request pacing comes from the shared rate limiter in
+    # av_get. Failed partitions are reported and simply stay pending for the next run.
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"interval must be one of {', '.join(INTRADAY_INTERVALS)}")
+    api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
+    if not api_key:
+        raise ValueError("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory")
+
+    symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+    pending = pending_partitions(symbols, interval, start, end)
+    print(f'{len(pending)} (symbol, month) partitions pending for {len(symbols)} symbols at {interval}')
+
+    bars, failed = 0, []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending) or 1))) as executor:
+        futures = {
+            executor.submit(backfill_partition, symbol, interval, month, api_key, adjusted, extended_hours): (symbol, month)
+            for symbol, month in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            symbol, month = futures[future]
+            try:
+                bars += future.result()
+            except Exception as e:
+                failed.append((symbol, month))
+                print(f'FAILED {symbol} {month}: {e}')
+            if done % 50 == 0 or done == len(futures):
+                print(f'{done}/{len(futures)} partitions processed, {bars} bars upserted')
+
+    if failed:
+        print(f'{len(failed)} partitions failed - run the backfill again to retry them')
+    return {'partitions': len(pending), 'bars': bars, 'failed': failed}
+
+
+if __name__ == '__main__':
+    tickers = input('Enter Tickers separated by commas: ')
+    symbols = [t.strip().upper() for t in tickers.split(',') if t.strip()]
+    interval = input(f'Interval ({", ".join(INTRADAY_INTERVALS)}): ') or '1min'
+    start = input(f'First month to backfill (YYYY-MM, default {FIRST_MONTH}): ') or FIRST_MONTH
+    end = input('Last month (YYYY-MM, blank = current month): ') or None
+    backfill(symbols, interval, start=start, end=end)
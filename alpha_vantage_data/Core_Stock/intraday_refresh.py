@@ -0,0 +1,99 @@
+# ==================================================================================================================== #
+# Intraday Refresh: Keeps stored intraday series current with outputsize=compact pulls (latest 100 bars) instead of
+# re-downloading the whole series. Each pull is cut at the newest stored timestamp - that bar is re-written, since it
+# may have been stored while still forming - and only the rest are new. A symbol whose gap is wider than one compact
+# window (or has nothing stored yet) gets a single full pull (trailing ~30 days); a gap wider than that is filled
+# month by month through the backfill. Bars are stored raw, like the backfill's.
+# run_schedule() repeats the refresh for a whole watchlist every N seconds on a bounded worker pool.
+# ==================================================================================================================== #
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Core_Stock.intraday import INTRADAY_INTERVALS, download_intraday
+from alpha_vantage_data.Core_Stock.intraday_backfill import backfill_partition, month_range
+
+load_dotenv()
+
+
+def refresh_symbol(symbol, interval='1min', api_key=None, adjusted=False, extended_hours=True):
+    # Returns the number of new bars appended to the store
+    symbol = symbol.upper()
+    last = timeseries_store.last_timestamp(symbol, interval)
+    outputsize = 'full' if last is None else 'compact'
+    # Every pull bypasses the response cache - a cached tail (same TTL as the schedule) would append nothing
+    df = download_intraday(symbol, interval, api_key=api_key, outputsize=outputsize,
+                           adjusted=adjusted, extended_hours=extended_hours, use_cache=False)
+    if df.empty:
+        return 0
+
+    added = 0
+    if last is not None:
+        if df['timestamp'].min() > last:
+            # More than 100 bars behind - the compact window doesn't reach the stored tail, so fill the gap once
+            df = download_intraday(symbol, interval, api_key=api_key, outputsize='full',
+                                   adjusted=adjusted, extended_hours=extended_hours, use_cache=False)
+            if df.empty or df['timestamp'].min() > last:
+                # Even the trailing ~30 days don't reach back - pull the months in between instead of leaving a hole
+                end = (df['timestamp'].min() if not df.empty else pd.Timestamp.today()).strftime('%Y-%m')
+                months = month_range(last.strftime('%Y-%m'), end)
+                print(f'{symbol} {interval}: stored tail {last} is older than the trailing window - '
+                      f'backfilling {months[0]} to {months[-1]}')
+                added = sum(backfill_partition(symbol, interval, month, api_key, adjusted, extended_hours)
+                            for month in months)
+        # >= so the newest stored bar (possibly a partial one) is replaced by its final values
+        df = df[df['timestamp'] >= last]
+    if df.empty:
+        return added
+    return added + timeseries_store.upsert(symbol, interval, df)
+
+
+def refresh(symbols, interval='1min', max_workers=8, api_key=None, adjusted=False, extended_hours=True):
+    # One pass over a watchlist on a bounded pool: {symbol: new bars} (None for symbols that failed this cycle)
+    api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
+    if not api_key:
+        raise ValueError("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory")
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f"interval must be one of {', '.join(INTRADAY_INTERVALS)}")
+
+    def task(symbol):
+        try:
+            return refresh_symbol(symbol, interval, api_key, adjusted, extended_hours)
+        except Exception as e:
+            print(f'FAILED {symbol} {interval}: {e}')
+            return None
+
+    symbols = [s.upper() for s in symbols]
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols) or 1))) as executor:
+        return dict(zip(symbols, executor.map(task, symbols)))
+
+
+def run_schedule(symbols, interval='1min', every=60, cycles=None, max_workers=8, api_key=None, adjusted=False,
+                 extended_hours=True):
+    # Refresh the watchlist every `every` seconds (aligned to the start of each cycle) until `cycles` have run
+    # (forever when None). A cycle that overruns starts the next one immediately rather than stacking up.
+    cycle = 0
+    while cycles is None or cycle < cycles:
+        started = time.monotonic()
+        results = refresh(symbols, interval, max_workers=max_workers, api_key=api_key, adjusted=adjusted,
+                          extended_hours=extended_hours)
+        added = sum(n for n in results.values() if n)
+        failed = sum(n is None for n in results.values())
+        print(f'[{time.strftime("%H:%M:%S")}] {interval} refresh: {added} new bars across {len(results)} symbols'
+              + (f', {failed} failed' if failed else ''))
+        cycle += 1
+        if cycles is None or cycle < cycles:
+            time.sleep(max(0.0, every - (time.monotonic() - started)))
+
+
+if __name__ == '__main__':
+    tickers = input('Enter Tickers separated by commas: ')
+    symbols = [t.strip().upper() for t in tickers.split(',') if t.strip()]
+    interval = input(f'Interval ({", ".join(INTRADAY_INTERVALS)}): ') or '1min'
+    every = int(input('Refresh every N seconds (default 60): ') or 60)
+    run_schedule(symbols, interval, every=every)
@@ -11,7 +11,8 @@ from rich.text import Text
 console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
 import pandas as pd 
 # ==================================================================================================================== # 
 
@@ -55,22 +56,13 @@ def ticker_search_tool():
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
     # Download and save the csv
-    response = requests.get(CSV_URL)
+    response = av_get(CSV_URL)
     Path('Search_Results').mkdir(exist_ok=True)
 
     # Clean keywords for filename
     clean_keywords = re.sub(r'[^\w\s-]', '', keywords).strip().replace(' ', '_')
     filename = f"Search_Results/search_{clean_keywords}.csv"
     
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded Search Results for '{keywords}' to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
 
     # Define the Column Mapping
     column_mapping = {
@@ -85,13 +77,9 @@ def ticker_search_tool():
         'matchScore': 'Match Score'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
-
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    df, filename = normalize_csv_response(response, filename, column_mapping)
 
-    print(f'Column names Successfully Converted for {filename}')
+    print(f"Successfully Downloaded Search Results for '{keywords}' to {filename}")
 
     # Display results using Rich
     if not df.empty:
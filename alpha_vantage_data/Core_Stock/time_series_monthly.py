@@ -11,7 +11,9 @@ from pathlib import Path
 # console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 
 
@@ -57,19 +59,10 @@ def time_series_monthly_adjusted():
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
     # Download and save the csv
-    response = requests.get(CSV_URL)
+    response = av_get(CSV_URL)
     Path('Monthly_Adjusted').mkdir(exist_ok=True)
 
     filename = f"Monthly_Adjusted/{ticker}_monthly_adjusted.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded Monthly Adjusted Data for {ticker} to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
 
     # Define the Column Mapping
     column_mapping = {
@@ -81,13 +74,13 @@ def time_series_monthly_adjusted():
         'volume': 'Volume'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
+    df, filename = normalize_csv_response(response, filename, column_mapping)
 
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    print(f"Successfully Downloaded Monthly Adjusted Data for {ticker} to {filename}")
 
-    print(f'Column names Successfully Converted for {filename}')
+    # Upsert into the local Parquet store (typed, partitioned by symbol/interval/year) alongside the CSV
+    added = timeseries_store.upsert(ticker, 'monthly', df)
+    print(f'Upserted {added} new bars for {ticker} into {timeseries_store.STORE_ROOT}')
 # ==================================================================================================================== # 
 # ==================================================================================================================== # 
 
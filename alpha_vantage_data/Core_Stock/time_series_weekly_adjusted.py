@@ -11,7 +11,9 @@ from pathlib import Path
 # console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 
 
@@ -58,19 +60,10 @@ def time_series_weekly_adjusted():
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
     # Download and save the csv
-    response = requests.get(CSV_URL)
+    response = av_get(CSV_URL)
     Path('Weekly_Data_Adjusted').mkdir(exist_ok=True)
 
     filename = f"Weekly_Data_Adjusted/{ticker}_weekly_adjusted.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded Weekly Adjusted Data for {ticker} to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
 
     # Define the Column Mapping
     column_mapping = {
@@ -82,13 +75,13 @@ def time_series_weekly_adjusted():
         'volume': 'Volume'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
+    df, filename = normalize_csv_response(response, filename, column_mapping)
 
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    print(f"Successfully Downloaded Weekly Adjusted Data for {ticker} to {filename}")
 
-    print(f'Column names Successfully Converted for {filename}')
+    # Upsert into the local Parquet store (typed, partitioned by symbol/interval/year) alongside the CSV
+    added = timeseries_store.upsert(ticker, 'weekly', df)
+    print(f'Upserted {added} new bars for {ticker} into {timeseries_store.STORE_ROOT}')
 # ==================================================================================================================== # 
 # ==================================================================================================================== # 
 
@@ -12,7 +12,7 @@ console = Console()
 
 import csv 
 import json 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 
 # ==================================================================================================================== # 
@@ -56,7 +56,7 @@ def crypto_exchange_rates():
     API_URL = f"{base_url}?{urlencode(params)}"
 
     # Make API request
-    response = requests.get(API_URL)
+    response = av_get(API_URL)
     data = response.json()
 
     # Create directories
@@ -3,7 +3,8 @@ import os
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.csv_normalizer import FRACTIONAL_VOLUME, download_csv
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 import csv 
 
@@ -63,15 +64,15 @@ def crypto_intraday():
     # Build Request URL 
     crypto_intraday_url = f'{base_url}?{urlencode(params)}' 
 
-    # Fetch and Save Data 
-    response = requests.get(crypto_intraday_url) 
-    Path('Crypto_Intraday_CSV').mkdir(exist_ok=True)  
-
-    filename = f'Crypto_Intraday_CSV/{crypto_ticker}_{fn}.csv' 
-    with open (filename, 'w') as csv_file: 
-        csv_file.write(response.text) 
+    # Fetch and Save Data - streamed to disk, and each typed batch is upserted into the local Parquet store under 
+    # <SYMBOL>-<MARKET> (partitioned by symbol/interval/year) as it is parsed 
+    added = [] 
+    rows, filename = download_csv(crypto_intraday_url, f'Crypto_Intraday_CSV/{crypto_ticker}_{fn}.csv', dtypes=FRACTIONAL_VOLUME, 
+                                  on_batch=lambda batch: added.append(timeseries_store.upsert(f'{crypto_ticker}-{market}', data_interval, batch))) 
 
     print(f'Successfully Saved Realtime Options Data for {crypto_ticker} as {filename}')  
 
+    print(f'Upserted {sum(added)} new bars for {crypto_ticker}-{market} into {timeseries_store.STORE_ROOT}')
+
 if __name__ == '__main__': 
     crypto_intraday()
\ No newline at end of file
@@ -3,7 +3,9 @@ import os
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import FRACTIONAL_VOLUME, parse_csv_body
+from alpha_vantage_data import timeseries_store
 import pandas as pd 
 import csv 
 
@@ -53,7 +55,7 @@ def crypto_weekly():
     crypto_weekly_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(crypto_weekly_url) 
+    response = av_get(crypto_weekly_url) 
     Path('Crypto_Weekly_Data').mkdir(exist_ok=True)  
 
     filename = f'Crypto_Weekly_Data/{crypto_ticker}_{fn}.csv' 
@@ -62,5 +64,9 @@ def crypto_weekly():
 
     print(f'Successfully Saved Weekly Crypto Data for {crypto_ticker} as {filename}')  
 
+    # Upsert into the local Parquet store under <SYMBOL>-<MARKET> (typed, partitioned by symbol/interval/year)
+    added = timeseries_store.upsert(f'{crypto_ticker}-{market}', 'weekly', parse_csv_body(response.content, dtypes=FRACTIONAL_VOLUME))
+    print(f'Upserted {added} new bars for {crypto_ticker}-{market} into {timeseries_store.STORE_ROOT}')
+
 if __name__ == '__main__': 
     crypto_weekly()
\ No newline at end of file
@@ -5,7 +5,8 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+import numpy as np 
 import pandas as pd  
 import json 
 
@@ -77,7 +78,7 @@ def fetch_risk_free_rate():
     TR_URL = f"{base_url}?{urlencode(params)}" 
 
     # Download and Save the json file 
-    response = requests.get(TR_URL)
+    response = av_get(TR_URL)
     data = response.json() 
 
     Path("Treasury_Yield_Data").mkdir(exist_ok=True) 
@@ -88,6 +89,46 @@ def fetch_risk_free_rate():
 
     print(f'Successfully Saved the {interval_choice} Treasury Yield Rates Historical Data to {filename}') 
 
+# ==================================================================================================================== # 
+# Non-interactive access for pricing code (Options/option_pricing.py): the treasury yield as a decimal rate series. 
+# Goes through av_get, so repeated lookups are served from the response cache instead of new API calls. 
+# ==================================================================================================================== # 
+TREASURY_MATURITIES = ('3month', '2year', '5year', '7year', '10year', '30year') 
+
+def treasury_yield_series(interval='daily', maturity='3month', api_key=None): 
+    load_dotenv() 
+    api_key = api_key or os.getenv("ALPHA_VANTAGE_API_KEY") 
+    if maturity not in TREASURY_MATURITIES: 
+        raise ValueError(f"maturity must be one of {', '.join(TREASURY_MATURITIES)}") 
+
+    params = { 
+        'function': 'TREASURY_YIELD', 
+        'interval': interval, 
+        'maturity': maturity, 
+        'apikey': api_key 
+    } 
+    data = av_get('https://www.alphavantage.co/query', params=params).json() 
+    if 'data' not in data: 
+        raise ValueError(f'Unexpected TREASURY_YIELD response: {str(data)[:200]}') 
+
+    # Percent strings ('.' on market holidays) -> decimal rates, oldest first 
+    series = pd.Series( 
+        pd.to_numeric([row['value'] for row in data['data']], errors='coerce') / 100.0, 
+        index=pd.to_datetime([row['date'] for row in data['data']]) 
+    ) 
+    return series.dropna().sort_index() 
+
+def risk_free_rate(as_of=None, maturity='3month', interval='daily', api_key=None): 
+    # Latest published yield on or before as_of (default: most recent), as a continuously compounded decimal rate - 
+    # the series is a bond-equivalent (semiannually compounded) yield (4.33% -> 0.0433), converted with 
+    # 2 * log(1 + y / 2) so it drops straight into Black-Scholes' exp(-r t) discounting 
+    series = treasury_yield_series(interval=interval, maturity=maturity, api_key=api_key) 
+    if as_of is not None: 
+        series = series.loc[:pd.Timestamp(as_of)] 
+    if series.empty: 
+        raise ValueError(f'No {maturity} treasury yield published on or before {as_of}') 
+    return float(2.0 * np.log1p(series.iloc[-1] / 2.0)) 
+
 if __name__ == '__main__': 
     fetch_risk_free_rate()
 
@@ -11,7 +11,7 @@ from rich.text import Text
 console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.csv_normalizer import FRACTIONAL_VOLUME, download_csv
 import pandas as pd 
 
 # ==================================================================================================================== # 
@@ -98,20 +98,7 @@ def fx_intraday():
     # Build CSV URL with params
     CSV_URL = f"{base_url}?{urlencode(params)}"
 
-    # Download and save the csv
-    response = requests.get(CSV_URL)
-    Path('Forex_Data').mkdir(exist_ok=True)
-
     filename = f"Forex_Data/{from_symbol}_{to_symbol}_{interval}_intraday.csv"
-    with open(filename, 'w') as file:
-        file.write(response.text)
-
-    print(f"Successfully Downloaded FX Intraday Data for {from_symbol}/{to_symbol} ({interval}) to {filename}")
-
-    # Rename the Column names of the CSV
-    print(f'Converting Column names for {filename}...')
-
-    df = pd.read_csv(filename)
 
     # Define the Column Mapping
     column_mapping = {
@@ -122,13 +109,10 @@ def fx_intraday():
         'close': 'Close'
     }
 
-    # Rename Column names Using Mapping
-    df.rename(columns=column_mapping, inplace=True)
-
-    # Save Updated CSV
-    df.to_csv(filename, index=False)
+    # Stream the body to disk, then parse / rename / write the final file in typed batches (flat memory for full histories)
+    rows, filename = download_csv(CSV_URL, filename, column_mapping, dtypes=FRACTIONAL_VOLUME)
 
-    print(f'Column names Successfully Converted for {filename}')
+    print(f"Successfully Downloaded FX Intraday Data for {from_symbol}/{to_symbol} ({interval}) to {filename}")
 
 
 if __name__ == '__main__':
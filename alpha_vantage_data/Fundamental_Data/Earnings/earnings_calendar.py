@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import csv 
 
@@ -48,7 +48,7 @@ def fetch_earnings_calendar():
     earnings_calendar_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(earnings_calendar_url)  
+    response = av_get(earnings_calendar_url)  
 
     Path('p_sql_two/Earnings_Calendar_CSV').mkdir(exist_ok=True) 
 
@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -41,7 +41,7 @@ def fetch_fetch_earnings_estimates():
     earnings_estimates_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(earnings_estimates_url)  
+    response = av_get(earnings_estimates_url)  
     data = response.json() 
     Path('p_sql_two/Earnings_JSON').mkdir(exist_ok=True) 
 
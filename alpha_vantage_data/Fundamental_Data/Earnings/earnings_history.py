@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -42,7 +42,7 @@ def fetch_earnings_history():
     earnings_history_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(earnings_history_url)  
+    response = av_get(earnings_history_url)  
     data = response.json() 
     Path('Earnings_CSV/Earnings_History').mkdir(exist_ok=True) 
 
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -38,7 +38,7 @@ def fetch_balance_sheet():
     Balance_Sheet_URL = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Format Data 
-    response = requests.get(Balance_Sheet_URL) 
+    response = av_get(Balance_Sheet_URL) 
     data = response.json() 
 
     # Store it 
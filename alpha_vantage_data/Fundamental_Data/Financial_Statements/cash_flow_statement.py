@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json   
 
@@ -39,7 +39,7 @@ def fetch_cash_flow_statement():
     Cash_Flow_URL = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Format as JSON 
-    response = requests.get(Cash_Flow_URL) 
+    response = av_get(Cash_Flow_URL) 
     data = response.json() 
 
     Path("Cash_Flow_Statements_JSON").mkdir(exist_ok=True) 
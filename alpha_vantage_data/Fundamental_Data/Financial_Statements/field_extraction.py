@@ -2,8 +2,8 @@ import streamlit as st
 import pandas as pd
 import json
 import os
-import requests
 from pathlib import Path
+from alpha_vantage_data.av_client import av_get_json
 from dotenv import load_dotenv
 from urllib.parse import urlencode
 import plotly.express as px
@@ -150,8 +150,8 @@ with col1:
                     base_url = 'https://www.alphavantage.co/query'
                     params['apikey'] = api_key
                     
-                    response = requests.get(f'{base_url}?{urlencode(params)}')
-                    data = response.json()
+                    # Concurrent sessions asking for the same query share one call and one parsed payload
+                    data = av_get_json(f'{base_url}?{urlencode(params)}')
                     
                     # Save to session state
                     st.session_state.api_data = data
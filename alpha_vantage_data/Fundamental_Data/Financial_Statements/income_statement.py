@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json 
 
@@ -36,7 +36,7 @@ def fetch_income_statement():
     Income_Statement_URL = f'{base_url}?{urlencode(params)}' 
 
     # Download and Save Data As JSON File 
-    response = requests.get(Income_Statement_URL) 
+    response = av_get(Income_Statement_URL) 
     data = response.json()  
 
     Path('p_sql_two/Income_Statements_JSON').mkdir(exist_ok=True) 
@@ -11,7 +11,7 @@ from rich.text import Text
 console = Console() 
 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -116,7 +116,7 @@ def fetch_company_overview():
     Overview_URL = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Format as JSON 
-    response = requests.get(Overview_URL) 
+    response = av_get(Overview_URL) 
     data = response.json() 
 
     Path('Company_Overviews_JSON').mkdir(exist_ok=True) 
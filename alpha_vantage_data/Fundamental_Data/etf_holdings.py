@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -42,7 +42,7 @@ def fetch_etf_holdings():
     etf_holdings_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(etf_holdings_url)  
+    response = av_get(etf_holdings_url)  
     data = response.json() 
     Path('ETF_Holdings_JSON').mkdir(exist_ok=True) 
 
@@ -3,7 +3,7 @@ import email.mime
 from dotenv import load_dotenv 
 from urllib.parse import urlencode 
 from pathlib import Path 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd 
 import json 
 
@@ -37,7 +37,7 @@ def upcoming_ipos():
     ipo_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(ipo_url)   
+    response = av_get(ipo_url)   
     Path('IPO_Calendar_CSV').mkdir(exist_ok=True) 
 
     filename = f'IPO_Calendar_CSV/{fn}.csv' 
@@ -0,0 +1,221 @@
+# ==================================================================================================================== #
+# Option Pricing: Vectorized Black-Scholes-Merton prices, greeks and implied volatility for whole option chains.
+# Works on the chains realtime_options.py / historical_options.py download (strike, type, mark, expiration, date ...)
+# and recomputes implied_volatility / delta / gamma / theta / vega / rho in the same units the API reports - every
+# function is NumPy array math, so re-marking tens of thousands of contracts on a new underlying price is one call.
+# ==================================================================================================================== #
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data.Economic_Indicators.risk_free_rate_data_fetch import risk_free_rate
+
+DAYS_PER_YEAR = 365.0
+
+# Implied-volatility solver settings
+IV_LOWER = 1e-4
+IV_UPPER = 10.0
+IV_TOLERANCE = 1e-10
+IV_MAX_ITERATIONS = 60
+
+# Quotes at or below this are placeholders (no market) - skipped when inferring the underlying price
+MIN_QUOTE = 0.05
+
+GREEK_COLUMNS = ['implied_volatility', 'delta', 'gamma', 'theta', 'vega', 'rho']
+
+
+# ==================================================================================================================== #
+# Normal distribution (no scipy) - Hart's double-precision algorithm as given by West (2005), ~1e-14 accurate
+# ==================================================================================================================== #
+
+def norm_pdf(x):
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def norm_cdf(x):
+    x = np.asarray(x, dtype='float64')
+    z = np.abs(x)
+    exponential = np.exp(-0.5 * z * z)
+
+    numerator = 3.52624965998911e-02 * z + 0.700383064443688
+    for c in (6.37396220353165, 33.912866078383, 112.079291497871, 221.213596169931, 220.206867912376):
+        numerator = numerator * z + c
+    denominator = 8.83883476483184e-02 * z + 1.75566716318264
+    for c in (16.064177579207, 86.7807322029461, 296.564248779674, 637.333633378831, 793.826512519948,
+              440.413735824752):
+        denominator = denominator * z + c
+    near = exponential * numerator / denominator
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = z + 0.65
+        for c in (4.0, 3.0, 2.0, 1.0):
+            fraction = z + c / fraction
+        far = exponential / fraction / 2.506628274631
+
+    tail = np.where(z < 7.07106781186547, near, far)
+    tail = np.where(z > 37.0, 0.0, tail)
+    return np.where(x > 0, 1.0 - tail, tail)
+
+
+# ==================================================================================================================== #
+# Black-Scholes-Merton (continuous dividend yield q). is_call: boolean array; t: years to expiry
+# ==================================================================================================================== #
+
+def _d1_d2(spot, strike, t, rate, vol, dividend_yield):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sqrt_t = np.sqrt(t)
+        d1 = (np.log(spot / strike) + (rate - dividend_yield + 0.5 * vol * vol) * t) / (vol * sqrt_t)
+    return d1, d1 - vol * sqrt_t
+
+
+def bs_price(spot, strike, t, rate, vol, is_call, dividend_yield=0.0):
+    d1, d2 = _d1_d2(spot, strike, t, rate, vol, dividend_yield)
+    discounted_spot = spot * np.exp(-dividend_yield * t)
+    discounted_strike = strike * np.exp(-rate * t)
+    call = discounted_spot * norm_cdf(d1) - discounted_strike * norm_cdf(d2)
+    put = discounted_strike * norm_cdf(-d2) - discounted_spot * norm_cdf(-d1)
+    return np.where(is_call, call, put)
+
+
+def bs_vega(spot, strike, t, rate, vol, dividend_yield=0.0):
+    # Per 1.00 of volatility (the solver's derivative) - greeks() reports it per vol point like the API
+    d1, _ = _d1_d2(spot, strike, t, rate, vol, dividend_yield)
+    return spot * np.exp(-dividend_yield * t) * norm_pdf(d1) * np.sqrt(t)
+
+
+def greeks(spot, strike, t, rate, vol, is_call, dividend_yield=0.0):
+    # Same conventions as the API chains: theta per calendar day, vega and rho per 1% move
+    d1, d2 = _d1_d2(spot, strike, t, rate, vol, dividend_yield)
+    carry = np.exp(-dividend_yield * t)
+    discount = np.exp(-rate * t)
+    pdf_d1 = norm_pdf(d1)
+    sqrt_t = np.sqrt(t)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.where(is_call, carry * norm_cdf(d1), carry * (norm_cdf(d1) - 1.0))
+        gamma = carry * pdf_d1 / (spot * vol * sqrt_t)
+        decay = -spot * carry * pdf_d1 * vol / (2.0 * sqrt_t)
+    theta_call = decay - rate * strike * discount * norm_cdf(d2) + dividend_yield * spot * carry * norm_cdf(d1)
+    theta_put = decay + rate * strike * discount * norm_cdf(-d2) - dividend_yield * spot * carry * norm_cdf(-d1)
+    rho = np.where(is_call, strike * t * discount * norm_cdf(d2), -strike * t * discount * norm_cdf(-d2))
+
+    return {
+        'delta': delta,
+        'gamma': gamma,
+        'theta': np.where(is_call, theta_call, theta_put) / DAYS_PER_YEAR,
+        'vega': spot * carry * pdf_d1 * sqrt_t / 100.0,
+        'rho': rho / 100.0,
+    }
+
+
+def implied_volatility(price, spot, strike, t, rate, is_call, dividend_yield=0.0):
+    # Batched safeguarded Newton: every contract takes a Newton step on vega, and any step that leaves its current
+    # [low, high] bracket (or has a vanishing vega) falls back to bisection. Prices outside the no-arbitrage bounds, and
+    # contracts still unconverged after IV_MAX_ITERATIONS, -> NaN.
+    price, spot, strike, t, rate = np.broadcast_arrays(*(np.asarray(x, dtype='float64')
+                                                         for x in (price, spot, strike, t, rate)))
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), price.shape)
+
+    carry = spot * np.exp(-dividend_yield * t)
+    discounted_strike = strike * np.exp(-rate * t)
+    lower_bound = np.where(is_call, np.maximum(carry - discounted_strike, 0.0), np.maximum(discounted_strike - carry, 0.0))
+    upper_bound = np.where(is_call, carry, discounted_strike)
+    solvable = np.isfinite(price) & (t > 0) & (price > lower_bound) & (price < upper_bound)
+
+    # In-the-money premiums are mostly intrinsic value, which swamps the vol information - solve the out-of-the-money
+    # side instead via put-call parity (same vol, far better conditioned)
+    in_the_money = np.where(is_call, carry > discounted_strike, discounted_strike > carry)
+    parity = np.where(is_call, discounted_strike - carry, carry - discounted_strike)
+    otm_price = np.where(in_the_money, price + parity, price)
+    otm_call = is_call ^ in_the_money
+
+    result = np.full(price.shape, np.nan)
+    idx = np.flatnonzero(solvable)
+    target, s, k, tt, r, call = (x.ravel()[idx] for x in (otm_price, spot, strike, t, rate, otm_call))
+    low = np.full(len(idx), IV_LOWER)
+    high = np.full(len(idx), IV_UPPER)
+    # Brenner-Subrahmanyam ATM approximation as the starting point
+    vol = np.clip(np.sqrt(2.0 * np.pi / tt) * target / s, 0.05, 3.0)
+
+    for _ in range(IV_MAX_ITERATIONS):
+        if not len(idx):
+            break
+        diff = bs_price(s, k, tt, r, vol, call, dividend_yield) - target
+        # Price increases with vol: shrink the bracket around the root
+        high = np.where(diff > 0, vol, high)
+        low = np.where(diff < 0, vol, low)
+
+        vega = bs_vega(s, k, tt, r, vol, dividend_yield)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            newton = vol - diff / vega
+        use_newton = np.isfinite(newton) & (newton > low) & (newton < high)
+        step = np.where(use_newton, newton, 0.5 * (low + high))
+
+        # Relative price tolerance so far out-of-the-money (near-zero) premiums still get solved
+        done = (np.abs(diff) <= IV_TOLERANCE * target) | ((high - low) <= IV_TOLERANCE)
+        result.ravel()[idx[done]] = vol[done]
+        # Only the contracts still searching carry on - later iterations shrink with the unsolved set
+        keep = ~done
+        idx, target, s, k, tt, r, call = idx[keep], target[keep], s[keep], k[keep], tt[keep], r[keep], call[keep]
+        low, high, vol = low[keep], high[keep], step[keep]
+
+    # Whatever is left in idx never met the tolerance - leave it NaN rather than report a half-solved vol
+    return result
+
+
+# ==================================================================================================================== #
+# Chains
+# ==================================================================================================================== #
+
+def years_to_expiry(expiration, valuation_date):
+    days = (pd.to_datetime(expiration) - pd.to_datetime(valuation_date)) / pd.Timedelta(days=1)
+    return np.maximum(np.asarray(days, dtype='float64'), 0.0) / DAYS_PER_YEAR
+
+
+def implied_spot(chain, rate, valuation_date=None, price_column='mark'):
+    # Underlying price implied by put-call parity (C - P = S - K e^(-rT)) at the strikes closest to the money -
+    # historical chains don't carry the underlying price, so this keeps the greeks self-consistent
+    chain = chain.copy()
+    chain['date'] = chain['date'] if 'date' in chain.columns else valuation_date
+    pairs = chain.pivot_table(index=['expiration', 'strike', 'date'], columns='type', values=price_column).dropna()
+    pairs = pairs[(pairs['call'] > MIN_QUOTE) & (pairs['put'] > MIN_QUOTE)]
+    if pairs.empty:
+        raise ValueError('Chain has no call/put pairs at a common strike - pass spot explicitly')
+    pairs = pairs.reset_index()
+    t = years_to_expiry(pairs['expiration'], pairs['date'])
+    spot = pairs['call'] - pairs['put'] + pairs['strike'] * np.exp(-rate * t)
+    # The smallest |C - P| marks the strikes nearest the money, where quotes are tightest
+    nearest = (pairs['call'] - pairs['put']).abs().nsmallest(max(3, len(pairs) // 10)).index
+    return float(np.median(spot.loc[nearest]))
+
+
+def price_chain(chain, spot=None, rate=None, valuation_date=None, dividend_yield=0.0, price_column='mark'):
+    # Recompute implied_volatility + greeks for every contract of a chain DataFrame in one vectorized pass.
+    # rate defaults to the 3-month treasury yield on the valuation date (risk_free_rate_data_fetch.risk_free_rate).
+    chain = chain.copy()
+    if valuation_date is None:
+        valuation_date = chain['date'].max() if 'date' in chain.columns else pd.Timestamp.today().normalize()
+    if rate is None:
+        rate = risk_free_rate(as_of=valuation_date)
+    if spot is None:
+        spot = implied_spot(chain, rate, valuation_date, price_column)
+
+    dates = chain['date'] if 'date' in chain.columns else valuation_date
+    t = years_to_expiry(chain['expiration'], dates)
+    strike = chain['strike'].to_numpy(dtype='float64')
+    is_call = chain['type'].str.lower().str.startswith('c').to_numpy()
+    price = chain[price_column].to_numpy(dtype='float64')
+
+    vol = implied_volatility(price, spot, strike, t, rate, is_call, dividend_yield)
+    chain['implied_volatility'] = vol
+    for name, values in greeks(spot, strike, t, rate, vol, is_call, dividend_yield).items():
+        chain[name] = values
+    return chain
+
+
+if __name__ == '__main__':
+    csv_path = input('Path to an options chain CSV (e.g. Historical_Options_CSV/BLSH_HISTORICAL_OPTIONS.csv): ')
+    chain = pd.read_csv(csv_path)
+    rate = float(input('Risk-free rate as a decimal (blank = 3-month treasury yield): ') or 'nan')
+    priced = price_chain(chain, rate=None if np.isnan(rate) else rate)
+    print(priced[['contractID', 'strike', 'type', 'mark'] + GREEK_COLUMNS].head(20).to_string(index=False))
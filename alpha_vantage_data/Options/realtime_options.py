@@ -10,7 +10,7 @@ from rich.panel import Panel
 from rich.text import Text 
 console = Console() 
 
-import requests 
+from alpha_vantage_data.av_client import av_download
 import pandas as pd 
 import csv 
 import json 
@@ -135,12 +135,9 @@ def fetch_live_options_chain():
     realtime_options_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch and Save Data 
-    response = requests.get(realtime_options_url) 
-    Path('Realtime_Options_CSV').mkdir(exist_ok=True) 
-
+    # Streamed straight to disk - a full chain for a large underlying never sits in memory 
     filename = f'Realtime_Options_CSV/{ticker}_{fn}.csv' 
-    with open (filename, 'w') as csv_file: 
-        csv_file.write(response.text) 
+    av_download(filename, realtime_options_url) 
 
     print(f'Successfully Saved Realtime Options Data for {ticker} as {filename}')  
     # ==================================================================================================================== # 
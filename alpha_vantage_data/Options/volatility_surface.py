@@ -0,0 +1,229 @@
+# ==================================================================================================================== #
+# Volatility Surface: Implied-volatility surfaces assembled from the option chains historical_options.py /
+# realtime_options.py download. Each (underlying, date) surface is a (tenor x strike) grid - one row per expiration,
+# fitted once - held in memory and on disk, so risk runs can query millions of (strike, expiry) points with a handful
+# of array ops. A new chain snapshot only refits the expiration slices whose quotes actually changed; slices are keyed
+# by strike, so a new spot doesn't invalidate them - moneyness is only derived from the spot at lookup / display time.
+# ==================================================================================================================== #
+
+import os
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from dotenv import load_dotenv
+
+from alpha_vantage_data.Options.option_pricing import DAYS_PER_YEAR, MIN_QUOTE, implied_spot, years_to_expiry
+from alpha_vantage_data.Economic_Indicators.risk_free_rate_data_fetch import risk_free_rate
+
+load_dotenv()
+
+# ==== Tunables (override in .env) ==== #
+# ALPHA_VANTAGE_SURFACE_DIR - where fitted surfaces are cached as .npz (default alpha_vantage_data/Options/Surface_Cache)
+SURFACE_DIR = Path(os.getenv('ALPHA_VANTAGE_SURFACE_DIR', Path(__file__).resolve().parent / 'Surface_Cache'))
+
+# Moneyness span (strike / spot) of the strike axis, laid out around the spot a surface is first built with - uniform,
+# so lookups find their column arithmetically
+MONEYNESS_GRID = np.round(np.linspace(0.5, 1.5, 101), 10)
+
+# In-memory surfaces: (SYMBOL, 'YYYY-MM-DD') -> VolatilitySurface
+_SURFACES = {}
+
+
+def _signature(*arrays):
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array, dtype='float64').tobytes())
+    return digest.hexdigest()
+
+
+def _smile_quotes(rows, spot, iv_column):
+    # One IV per strike: the out-of-the-money side when both are quoted (calls above spot, puts below), dropping
+    # placeholder quotes and missing IVs
+    rows = rows[np.isfinite(rows[iv_column]) & (rows[iv_column] > 0)]
+    if 'mark' in rows.columns:
+        rows = rows[rows['mark'] > MIN_QUOTE]
+    is_call = rows['type'].str.lower().str.startswith('c')
+    out_of_the_money = np.where(is_call, rows['strike'] >= spot, rows['strike'] < spot)
+    rows = rows.assign(_otm=out_of_the_money).sort_values(['strike', '_otm'], ascending=[True, False])
+    rows = rows.drop_duplicates('strike')
+    return rows['strike'].to_numpy(dtype='float64'), rows[iv_column].to_numpy(dtype='float64')
+
+
+class VolatilitySurface:
+    # Grid rows are expirations (sorted), columns are a fixed strike axis (spot at creation x MONEYNESS_GRID). Lookups
+    # interpolate linearly in strike and linearly in total variance (vol^2 * tenor) across expirations; outside the
+    # grid the nearest edge vol is used.
+    def __init__(self, symbol, date, spot, moneyness=MONEYNESS_GRID, strikes=None):
+        self.symbol = symbol.upper()
+        self.date = pd.Timestamp(date).strftime('%Y-%m-%d')
+        self.spot = float(spot)
+        self.strikes = np.asarray(strikes if strikes is not None else self.spot * np.asarray(moneyness), dtype='float64')
+        self.slices = {}      # expiration -> fitted vol row on the strike axis
+        self.signatures = {}  # expiration -> hash of the quotes the row was fitted from
+        self._grid = None
+
+    @property
+    def moneyness(self):
+        # Strike axis as strike / current spot
+        return self.strikes / self.spot
+
+    # ---- Building ---- #
+
+    def _fit_slice(self, strikes, vols):
+        # Resample one expiration's smile onto the strike axis (flat beyond the quoted strikes)
+        return np.interp(self.strikes, strikes, vols)
+
+    def update(self, chain, spot=None, iv_column='implied_volatility'):
+        # Fold a chain snapshot into the surface; returns the expirations that were (re)fitted. Slices live on the
+        # strike axis, so a new spot alone refits nothing - only slices whose quotes changed are touched.
+        if spot is not None:
+            self.spot = float(spot)
+        changed = []
+        for expiration, rows in chain.groupby('expiration', sort=False):
+            expiration = pd.Timestamp(expiration).strftime('%Y-%m-%d')
+            if expiration <= self.date:
+                continue
+            strikes, vols = _smile_quotes(rows, self.spot, iv_column)
+            if len(strikes) == 0:
+                continue
+            signature = _signature(strikes, vols)
+            if self.signatures.get(expiration) == signature:
+                continue
+            self.slices[expiration] = self._fit_slice(strikes, vols)
+            self.signatures[expiration] = signature
+            changed.append(expiration)
+        if changed:
+            self._grid = None
+        return changed
+
+    def _arrays(self):
+        # (expirations, tenors, total-variance grid) - rebuilt lazily after an update
+        if self._grid is None:
+            if not self.slices:
+                raise ValueError(f'Surface for {self.symbol} on {self.date} has no expirations with usable quotes')
+            expirations = sorted(self.slices)
+            tenors = years_to_expiry(expirations, self.date)
+            vols = np.vstack([self.slices[e] for e in expirations])
+            if len(expirations) == 1:
+                # Single expiry: duplicate it so the tenor interpolation below still has two nodes (flat in tenor)
+                expirations, tenors, vols = expirations * 2, np.r_[tenors, tenors[0] + 1.0], np.vstack([vols, vols])
+            self._grid = (expirations, tenors, vols ** 2 * tenors[:, None])
+        return self._grid
+
+    # ---- Lookups ---- #
+
+    def lookup(self, strike, tenor):
+        # Implied vol at arbitrary strikes (price units) and tenors (years) - any broadcastable shapes
+        _, tenors, total_variance = self._arrays()
+        strike, tenor = np.broadcast_arrays(np.asarray(strike, dtype='float64'), np.asarray(tenor, dtype='float64'))
+
+        # Strike column: uniform axis, so the index is arithmetic rather than a search
+        k = self.strikes
+        position = np.clip((strike - k[0]) / (k[1] - k[0]), 0.0, len(k) - 1)
+        j = np.minimum(position.astype('int64'), len(k) - 2)
+        wj = position - j
+
+        # Tenor row: clamp to the quoted range so extrapolation keeps the edge slice's vol
+        t = np.clip(tenor, tenors[0], tenors[-1])
+        i = np.clip(np.searchsorted(tenors, t, side='right') - 1, 0, len(tenors) - 2)
+        wi = (t - tenors[i]) / (tenors[i + 1] - tenors[i])
+
+        near = total_variance[i, j] * (1.0 - wj) + total_variance[i, j + 1] * wj
+        far = total_variance[i + 1, j] * (1.0 - wj) + total_variance[i + 1, j + 1] * wj
+        return np.sqrt((near * (1.0 - wi) + far * wi) / t)
+
+    def lookup_expiry(self, strike, expiration):
+        # Same as lookup() with expiration dates instead of tenors
+        return self.lookup(strike, years_to_expiry(expiration, self.date))
+
+    def lookup_moneyness(self, moneyness, tenor):
+        # Same as lookup() with moneyness (strike / current spot) instead of strikes
+        return self.lookup(np.asarray(moneyness, dtype='float64') * self.spot, tenor)
+
+    def to_frame(self):
+        # Fitted grid as a DataFrame: rows = expirations, columns = moneyness at the current spot
+        expirations = sorted(self.slices)
+        return pd.DataFrame(np.vstack([self.slices[e] for e in expirations]), index=expirations,
+                            columns=self.moneyness)
+
+
+# ==================================================================================================================== #
+# Cache - memory first, then SURFACE_DIR
+# ==================================================================================================================== #
+
+def surface_path(symbol, date):
+    return SURFACE_DIR / f'{symbol.upper()}_{pd.Timestamp(date).strftime("%Y-%m-%d")}_SURFACE.npz'
+
+
+def save_surface(surface):
+    SURFACE_DIR.mkdir(parents=True, exist_ok=True)
+    path = surface_path(surface.symbol, surface.date)
+    expirations = sorted(surface.slices)
+    tmp = path.with_suffix('.tmp.npz')
+    np.savez(tmp, symbol=surface.symbol, date=surface.date, spot=surface.spot, strikes=surface.strikes,
+             expirations=np.array(expirations, dtype='U10'),
+             signatures=np.array([surface.signatures[e] for e in expirations], dtype='U40'),
+             vols=np.vstack([surface.slices[e] for e in expirations]) if expirations else np.empty((0, 0)))
+    os.replace(tmp, path)
+    return path
+
+
+def load_surface(symbol, date):
+    path = surface_path(symbol, date)
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        surface = VolatilitySurface(str(data['symbol']), str(data['date']), float(data['spot']), strikes=data['strikes'])
+        for expiration, signature, vols in zip(data['expirations'], data['signatures'], data['vols']):
+            surface.slices[str(expiration)] = vols
+            surface.signatures[str(expiration)] = str(signature)
+    return surface
+
+
+def get_surface(symbol, date):
+    key = (symbol.upper(), pd.Timestamp(date).strftime('%Y-%m-%d'))
+    if key not in _SURFACES:
+        surface = load_surface(*key)
+        if surface is None:
+            return None
+        _SURFACES[key] = surface
+    return _SURFACES[key]
+
+
+def build_surface(chain, symbol=None, spot=None, rate=None, iv_column='implied_volatility', save=True):
+    # Build (or incrementally update) the cached surface of every date in a chain DataFrame; returns
+    # {date: VolatilitySurface}. Without a spot the underlying is inferred from put-call parity at `rate`, which
+    # defaults to the 3-month treasury yield on each date - the same rate option_pricing.price_chain uses.
+    symbol = (symbol or chain['symbol'].iloc[0]).upper()
+    surfaces = {}
+    for date, rows in chain.groupby('date'):
+        date = pd.Timestamp(date).strftime('%Y-%m-%d')
+        if spot is not None:
+            date_spot = spot
+        else:
+            date_spot = implied_spot(rows, rate if rate is not None else risk_free_rate(as_of=date), date)
+        surface = get_surface(symbol, date)
+        if surface is None:
+            surface = _SURFACES[(symbol, date)] = VolatilitySurface(symbol, date, date_spot)
+        changed = surface.update(rows, spot=date_spot, iv_column=iv_column)
+        if changed:
+            print(f'{symbol} {date}: refitted {len(changed)} of {len(surface.slices)} expiration slices')
+            if save:
+                save_surface(surface)
+        surfaces[date] = surface
+    return surfaces
+
+
+def surface_from_csv(csv_path, symbol=None, spot=None, rate=None):
+    # Convenience for the Historical_Options_CSV files: one surface per date in the file
+    return build_surface(pd.read_csv(csv_path), symbol=symbol, spot=spot, rate=rate)
+
+
+if __name__ == '__main__':
+    csv_path = input('Path to an options chain CSV (e.g. Historical_Options_CSV/BLSH_HISTORICAL_OPTIONS.csv): ')
+    for date, surface in surface_from_csv(csv_path).items():
+        print(f'\n{surface.symbol} implied-volatility surface on {date} (spot {surface.spot:.2f}):')
+        frame = surface.to_frame()
+        print(frame.iloc[:, ::10].round(4).to_string())
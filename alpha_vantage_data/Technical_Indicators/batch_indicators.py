@@ -0,0 +1,196 @@
+# ==================================================================================================================== #
+# Batch Indicators: BBANDS / STOCH / STOCHRSI / WILLR / ADX computed locally for a whole universe at once.
+# Inputs are time x symbol matrices (NumPy arrays or DataFrames from timeseries_store.read_wide), so a nightly scan of
+# thousands of names is a handful of sliding-window array ops instead of one API call per symbol. The smoothing
+# moving averages take the same matype codes as the API (see macdext.get_ma_type / moving_averages.MA_TYPES).
+# ==================================================================================================================== #
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Technical_Indicators.moving_averages import (
+    _KERNELS, _as_matrix, _check_function, _check_period, _recursive, _window_sums
+)
+
+
+# ==================================================================================================================== #
+# Helpers
+# ==================================================================================================================== #
+
+def _matrix(values):
+    # (time, symbols) float64 plus a function that gives results back in the caller's shape / DataFrame labels
+    if isinstance(values, pd.DataFrame):
+        matrix = values.to_numpy(dtype='float64')
+        return matrix, lambda out: pd.DataFrame(out, index=values.index, columns=values.columns)
+    if isinstance(values, pd.Series):
+        matrix = values.to_numpy(dtype='float64')[:, None]
+        return matrix, lambda out: pd.Series(out[:, 0], index=values.index, name=values.name)
+    matrix, squeeze = _as_matrix(values)
+    return matrix, lambda out: out[:, 0] if squeeze else out
+
+
+def _defined(like, values):
+    # Keep values only where `like` is defined (np.where on a NaN comparison would otherwise yield a fake 0)
+    return np.where(np.isnan(like), np.nan, values)
+
+
+def _ma(values, time_period, matype):
+    return _KERNELS[_check_function(matype)](values, _check_period(time_period))
+
+
+def _rolling(values, time_period, reducer):
+    # Reduce each trailing window along time (sliding-window view - no copies); windows with a NaN come back NaN
+    out = np.full(values.shape, np.nan)
+    if time_period <= len(values):
+        windows = np.lib.stride_tricks.sliding_window_view(values, time_period, axis=0)
+        out[time_period - 1:] = reducer(windows, axis=-1)
+    return out
+
+
+def _window_std(values, time_period):
+    # Population std of each trailing window from deviations about that window's own mean. A running
+    # E[x^2] - E[x]^2 over cumulative sums cancels catastrophically on long or high-priced series. One vector op per
+    # window offset (time_period of them), so no (time, symbols, window) copy is ever built.
+    out = np.full(values.shape, np.nan)
+    if time_period <= len(values):
+        offsets = [values[k:len(values) - time_period + 1 + k] for k in range(time_period)]
+        mean = sum(offsets) / time_period
+        out[time_period - 1:] = np.sqrt(sum((x - mean) ** 2 for x in offsets) / time_period)
+    return out
+
+
+def _stochastic_k(close, high, low, time_period):
+    highest = _rolling(high, time_period, np.max)
+    lowest = _rolling(low, time_period, np.min)
+    span = highest - lowest
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _defined(span, np.where(span > 0, 100.0 * (close - lowest) / span, 0.0))
+
+
+def _rsi(close, time_period):
+    # Wilder RSI: SMA-seeded averages of gains / losses, smoothed with alpha = 1 / n
+    change = np.full(close.shape, np.nan)
+    change[1:] = np.diff(close, axis=0)
+    gain, loss = np.where(change > 0, change, 0.0), np.where(change < 0, -change, 0.0)
+    gain[np.isnan(change)] = np.nan
+    loss[np.isnan(change)] = np.nan
+    avg_gain = _recursive(gain, 1.0 / time_period, _window_sums(gain, time_period) / time_period)
+    avg_loss = _recursive(loss, 1.0 / time_period, _window_sums(loss, time_period) / time_period)
+    total = avg_gain + avg_loss
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return _defined(total, np.where(total > 0, 100.0 * avg_gain / total, 0.0))
+
+
+# ==================================================================================================================== #
+# Indicators - arguments and defaults mirror the API parameters; output keys are the API's CSV column names
+# ==================================================================================================================== #
+
+def bbands(close, time_period=20, nbdevup=2, nbdevdn=2, matype=0):
+    values, restore = _matrix(close)
+    time_period = _check_period(time_period)
+    middle = _ma(values, time_period, matype)
+    # Band width always uses the population standard deviation of the last time_period prices
+    std = _window_std(values, time_period)
+    return {
+        'Real Upper Band': restore(middle + nbdevup * std),
+        'Real Middle Band': restore(middle),
+        'Real Lower Band': restore(middle - nbdevdn * std),
+    }
+
+
+def stoch(high, low, close, fastkperiod=5, slowkperiod=3, slowdperiod=3, slowkmatype=0, slowdmatype=0):
+    close_values, restore = _matrix(close)
+    fast_k = _stochastic_k(close_values, _matrix(high)[0], _matrix(low)[0], _check_period(fastkperiod))
+    slow_k = _ma(fast_k, slowkperiod, slowkmatype)
+    slow_d = _ma(slow_k, slowdperiod, slowdmatype)
+    return {'SlowK': restore(slow_k), 'SlowD': restore(slow_d)}
+
+
+def stochrsi(close, time_period=14, fastkperiod=5, fastdperiod=3, fastdmatype=0):
+    values, restore = _matrix(close)
+    rsi = _rsi(values, _check_period(time_period))
+    fast_k = _stochastic_k(rsi, rsi, rsi, _check_period(fastkperiod))
+    fast_d = _ma(fast_k, fastdperiod, fastdmatype)
+    return {'FastK': restore(fast_k), 'FastD': restore(fast_d)}
+
+
+def willr(high, low, close, time_period=14):
+    close_values, restore = _matrix(close)
+    time_period = _check_period(time_period)
+    highest = _rolling(_matrix(high)[0], time_period, np.max)
+    lowest = _rolling(_matrix(low)[0], time_period, np.min)
+    span = highest - lowest
+    with np.errstate(invalid='ignore', divide='ignore'):
+        value = _defined(span, np.where(span > 0, -100.0 * (highest - close_values) / span, 0.0))
+    return {'WILLR': restore(value)}
+
+
+def adx(high, low, close, time_period=14):
+    # Wilder's ADX: smoothed +DM / -DM / true range -> DI -> DX, then ADX = Wilder average of DX
+    close_values, restore = _matrix(close)
+    high_values, low_values = _matrix(high)[0], _matrix(low)[0]
+    n = _check_period(time_period)
+
+    up = np.full(close_values.shape, np.nan)
+    down = np.full(close_values.shape, np.nan)
+    up[1:] = np.diff(high_values, axis=0)
+    down[1:] = -np.diff(low_values, axis=0)
+    plus_dm = _defined(up, np.where((up > down) & (up > 0), up, 0.0))
+    minus_dm = _defined(down, np.where((down > up) & (down > 0), down, 0.0))
+
+    prev_close = np.full(close_values.shape, np.nan)
+    prev_close[1:] = close_values[:-1]
+    true_range = np.fmax(high_values - low_values,
+                         np.fmax(np.abs(high_values - prev_close), np.abs(low_values - prev_close)))
+    # No previous close (first bar, or a symbol's leading NaNs before it starts trading) -> no true range yet
+    true_range[np.isnan(prev_close)] = np.nan
+
+    def wilder(x):
+        # Seeded with the sum of the first n - 1 values (scaled to an average - DI is a ratio so the scale cancels)
+        return _recursive(x, 1.0 / n, _window_sums(x, n - 1) / n if n > 1 else x)
+
+    smoothed_tr = wilder(true_range)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        plus_di = 100.0 * wilder(plus_dm) / smoothed_tr
+        minus_di = 100.0 * wilder(minus_dm) / smoothed_tr
+        di_total = plus_di + minus_di
+        dx = np.where(di_total > 0, 100.0 * np.abs(plus_di - minus_di) / di_total, 0.0)
+    dx = _defined(di_total, dx)
+    if n > 1:
+        # The seed bar of the Wilder sums isn't a DX bar yet (DX starts n bars after each symbol's first close) - drop
+        # each column's first defined DX rather than a fixed number of rows, so leading NaNs shift it too
+        defined = ~np.isnan(dx)
+        columns = np.flatnonzero(defined.any(axis=0))
+        dx[defined.argmax(axis=0)[columns], columns] = np.nan
+    return {'ADX': restore(_recursive(dx, 1.0 / n, _window_sums(dx, n) / n))}
+
+
+# ==================================================================================================================== #
+# Store-backed scan
+# ==================================================================================================================== #
+
+def load_ohlc(symbols, interval='daily', start=None, end=None):
+    # {'open', 'high', 'low', 'close', 'volume'} -> time x symbol frames sharing one index
+    long = timeseries_store.read(symbols, interval, start=start, end=end,
+                                 columns=['open', 'high', 'low', 'close', 'volume'])
+    if long.empty:
+        raise ValueError(f'No {interval} bars stored for {symbols} - fetch the time series first')
+    order = [s.upper() for s in ([symbols] if isinstance(symbols, str) else symbols)]
+    return {
+        field: long.pivot(index='timestamp', columns='symbol', values=field).reindex(columns=order)
+        for field in ('open', 'high', 'low', 'close', 'volume')
+    }
+
+
+def scan(symbols, interval='daily', start=None, end=None, time_period=14, bbands_period=20, matype=0):
+    # Every indicator in this module for a whole universe: {indicator column: time x symbol DataFrame}
+    ohlc = load_ohlc(symbols, interval, start=start, end=end)
+    high, low, close = ohlc['high'], ohlc['low'], ohlc['close']
+    results = {}
+    results.update(bbands(close, time_period=bbands_period, matype=matype))
+    results.update(stoch(high, low, close, slowkmatype=matype, slowdmatype=matype))
+    results.update(stochrsi(close, time_period=time_period, fastdmatype=matype))
+    results.update(willr(high, low, close, time_period=time_period))
+    results.update(adx(high, low, close, time_period=time_period))
+    return results
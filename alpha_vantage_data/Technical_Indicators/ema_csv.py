@@ -5,7 +5,8 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
+from alpha_vantage_data.csv_normalizer import normalize_csv_response
 import pandas as pd  
 import json  
 
@@ -68,18 +69,14 @@ def fetch_ema():
     # Build URL 
     ema_csv_url = f'{base_url}?{urlencode(params)}' 
 
-    response = requests.get(ema_csv_url) 
+    response = av_get(ema_csv_url) 
 
     Path('Technical_Indicators_CSV').mkdir(exist_ok=True)  
 
     filename = f'Technical_Indicators_CSV/{ticker}_{days}_{fn}.csv' 
-    with open (filename, 'w') as csv_file: 
-        csv_file.write(response.text)  
 
-    # Rename Columns 'time' and 'value' to 'Date' and 'EMA{days} 
-    df = pd.read_csv(filename) 
-    df = df.rename(columns={'time': 'Date', 'EMA': f'EMA{days}'}) 
-    df.to_csv(filename, index=False)
+    # Rename Columns 'time' and 'value' to 'Date' and 'EMA{days} - parsed once from memory, written once 
+    df, filename = normalize_csv_response(response, filename, {'time': 'Date', 'EMA': f'EMA{days}'}) 
 
 if __name__ == '__main__': 
     fetch_ema() 
\ No newline at end of file
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
 
@@ -65,7 +65,7 @@ params = {
 # Build URL 
 ema_url = f'{base_url}?{urlencode(params)}' 
 
-response = requests.get(ema_url) 
+response = av_get(ema_url) 
 data=response.json() 
 
 Path('Technical_Indicators_JSON').mkdir(exist_ok=True) 
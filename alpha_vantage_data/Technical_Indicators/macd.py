@@ -6,7 +6,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
 
@@ -71,7 +71,7 @@ def get_macd():
     macd_url = f'{base_url}?{urlencode(params)}' 
 
     # Download and Save CSV 
-    response = requests.get(macd_url) 
+    response = av_get(macd_url) 
     Path('Technical_Indicators_CSV').mkdir(exist_ok="True") 
 
     filename = f'Technical_Indicators_CSV/{ticker}_daily_{fn}.csv' 
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
 
@@ -64,7 +64,7 @@ def mama_indicator():
 
     mama_url = f'{base_url}?{urlencode(params)}' 
 
-    response = requests.get(mama_url) 
+    response = av_get(mama_url) 
     data = response.json() 
 
     Path('Technical_Indicators_JSON').mkdir(exist_ok=True)
@@ -0,0 +1,304 @@
+# ==================================================================================================================== #
+# Moving Averages: Local NumPy engine for SMA / EMA / WMA / DEMA / TEMA / TRIMA / KAMA / T3.
+# Computes the same series the API's moving-average functions return (TA-Lib conventions: SMA-seeded EMAs, same
+# warm-up lengths) from OHLCV bars already in the local Time Series Store - no API call per (symbol, period) pair.
+# Every function takes a 1-D price array or a 2-D time x symbol matrix, so one pass covers a whole universe.
+# ==================================================================================================================== #
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+
+MOVING_AVERAGES = ('SMA', 'EMA', 'WMA', 'DEMA', 'TEMA', 'TRIMA', 'KAMA', 'T3')
+
+# The API's matype codes (MACDEXT fast/slow/signal matype, BBANDS, STOCH ...) - see macdext.get_ma_type
+MA_TYPES = {0: 'SMA', 1: 'EMA', 2: 'WMA', 3: 'DEMA', 4: 'TEMA', 5: 'TRIMA', 6: 'T3', 7: 'KAMA', 8: 'MAMA'}
+
+# KAMA fast / slow smoothing constants and the T3 volume factor the API uses by default
+KAMA_FAST = 2
+KAMA_SLOW = 30
+T3_VFACTOR = 0.7
+
+
+# ==================================================================================================================== #
+# Array helpers - internal functions take (time, columns) arrays and either one time_period or one per column
+# ==================================================================================================================== #
+
+def _as_matrix(prices):
+    # Work on (time, symbols) float64; remember whether to hand back a 1-D result
+    values = np.asarray(prices, dtype='float64')
+    if values.ndim == 1:
+        return values[:, None], True
+    if values.ndim != 2:
+        raise ValueError(f'Expected a 1-D series or 2-D time x symbol matrix, got shape {values.shape}')
+    return values, False
+
+
+def _restore(values, squeeze):
+    return values[:, 0] if squeeze else values
+
+
+def _check_period(time_period):
+    time_period = int(time_period)
+    if time_period < 1:
+        raise ValueError('time_period must be a positive integer')
+    return time_period
+
+
+def _window_sums(values, time_period):
+    # Cumulative-sum difference -> sum over each trailing window; windows containing a NaN come back NaN
+    # (so symbols with a later listing date or gaps just start later instead of poisoning the column).
+    # time_period may be one int or one period per column - the cumulative sums are shared by every period.
+    periods = np.broadcast_to(np.asarray(time_period), (values.shape[1],))
+    valid = np.isfinite(values)
+    zeros = np.zeros((1, values.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+
+    out = np.full(values.shape, np.nan)
+    for period in np.unique(periods):
+        period = int(period)
+        if period > len(values):
+            continue
+        cols = periods == period
+        window = sums[period:, cols] - sums[:-period, cols]
+        full = (counts[period:, cols] - counts[:-period, cols]) == period
+        out[period - 1:, cols] = np.where(full, window, np.nan)
+    return out
+
+
+def _lag(values, time_period):
+    # values shifted down by time_period rows (per column when given one period per column)
+    periods = np.broadcast_to(np.asarray(time_period), (values.shape[1],))
+    out = np.full(values.shape, np.nan)
+    for period in np.unique(periods):
+        period = int(period)
+        cols = periods == period
+        if period < len(values):
+            out[period:, cols] = values[:-period, cols]
+    return out
+
+
+def _recursive(values, alpha, seed):
+    # out[t] = out[t-1] + alpha * (x[t] - out[t-1]), restarting from seed[t] wherever the previous value is missing.
+    # The loop runs over time only - each step is one vector op across every symbol column.
+    alpha = np.broadcast_to(alpha, values.shape)
+    out = np.full(values.shape, np.nan)
+    prev = np.full(values.shape[1], np.nan)
+    for t in range(len(values)):
+        step = prev + alpha[t] * (values[t] - prev)
+        prev = np.where(np.isnan(prev), seed[t], step)
+        out[t] = prev
+    return out
+
+
+# ==================================================================================================================== #
+# Moving averages - each accepts 1-D or (time, symbols) arrays, oldest bar first
+# ==================================================================================================================== #
+
+def _sma(values, time_period):
+    return _window_sums(values, time_period) / time_period
+
+
+def _ema(values, time_period):
+    # Seeded with the SMA of the first window, alpha = 2 / (n + 1)
+    return _recursive(values, 2.0 / (time_period + 1), _sma(values, time_period))
+
+
+def _wma(values, time_period):
+    # Linear weights 1..n via two cumulative sums: sum(i * x_i) over the window minus (t - n) * sum(x_i)
+    index = np.arange(len(values), dtype='float64')[:, None]
+    weighted = _window_sums(values * index, time_period)
+    plain = _window_sums(values, time_period)
+    return (weighted - (index - time_period) * plain) / (time_period * (time_period + 1) / 2)
+
+
+def _dema(values, time_period):
+    e1 = _ema(values, time_period)
+    return 2 * e1 - _ema(e1, time_period)
+
+
+def _tema(values, time_period):
+    e1 = _ema(values, time_period)
+    e2 = _ema(e1, time_period)
+    return 3 * e1 - 3 * e2 + _ema(e2, time_period)
+
+
+def _trima(values, time_period):
+    # SMA of an SMA: odd n -> two windows of (n + 1) / 2, even n -> n / 2 then n / 2 + 1
+    period = np.asarray(time_period)
+    first = np.where(period % 2, (period + 1) // 2, period // 2)
+    second = period + 1 - first
+    return _sma(_sma(values, first), second)
+
+
+def _kama(values, time_period):
+    # Kaufman adaptive MA: efficiency ratio scales the smoothing constant between the fast and slow EMA rates
+    change = np.abs(values - _lag(values, time_period))
+    step = np.full(values.shape, np.nan)
+    step[1:] = np.abs(np.diff(values, axis=0))
+    volatility = _window_sums(step, time_period)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.where((volatility <= change) | (volatility == 0), 1.0, change / volatility)
+    ratio = np.where(np.isnan(change) | np.isnan(volatility), np.nan, ratio)
+
+    fast, slow = 2.0 / (KAMA_FAST + 1), 2.0 / (KAMA_SLOW + 1)
+    smoothing = (ratio * (fast - slow) + slow) ** 2
+
+    previous = _lag(values, 1)
+    seed = previous + smoothing * (values - previous)
+    return _recursive(values, np.nan_to_num(smoothing), np.where(np.isnan(smoothing), np.nan, seed))
+
+
+def _t3(values, time_period, vfactor=T3_VFACTOR):
+    # Tillson T3: six chained EMAs combined with volume-factor weights
+    e1 = _ema(values, time_period)
+    e2 = _ema(e1, time_period)
+    e3 = _ema(e2, time_period)
+    e4 = _ema(e3, time_period)
+    e5 = _ema(e4, time_period)
+    e6 = _ema(e5, time_period)
+    a = vfactor
+    c1 = -a ** 3
+    c2 = 3 * a ** 2 + 3 * a ** 3
+    c3 = -6 * a ** 2 - 3 * a - 3 * a ** 3
+    c4 = 1 + 3 * a + a ** 3 + 3 * a ** 2
+    return c1 * e6 + c2 * e5 + c3 * e4 + c4 * e3
+
+
+def sma(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_sma(values, _check_period(time_period)), squeeze)
+
+
+def ema(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_ema(values, _check_period(time_period)), squeeze)
+
+
+def wma(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_wma(values, _check_period(time_period)), squeeze)
+
+
+def dema(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_dema(values, _check_period(time_period)), squeeze)
+
+
+def tema(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_tema(values, _check_period(time_period)), squeeze)
+
+
+def trima(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_trima(values, _check_period(time_period)), squeeze)
+
+
+def kama(prices, time_period):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_kama(values, _check_period(time_period)), squeeze)
+
+
+def t3(prices, time_period, vfactor=T3_VFACTOR):
+    values, squeeze = _as_matrix(prices)
+    return _restore(_t3(values, _check_period(time_period), vfactor), squeeze)
+
+
+MA_FUNCTIONS = {
+    'SMA': sma, 'EMA': ema, 'WMA': wma, 'DEMA': dema,
+    'TEMA': tema, 'TRIMA': trima, 'KAMA': kama, 'T3': t3,
+}
+
+
+# Internal (time, columns) kernels - the same kernels serve single calls and multi-period sweeps
+_KERNELS = {
+    'SMA': _sma, 'EMA': _ema, 'WMA': _wma, 'DEMA': _dema,
+    'TEMA': _tema, 'TRIMA': _trima, 'KAMA': _kama, 'T3': _t3,
+}
+
+
+def _check_function(function):
+    # A name like 'EMA' or one of the API's integer matype codes
+    function = MA_TYPES.get(function, function) if isinstance(function, int) else str(function).upper()
+    if function not in MA_FUNCTIONS:
+        raise ValueError(f"Unsupported moving average '{function}' - choose from {', '.join(MOVING_AVERAGES)}")
+    return function
+
+
+def moving_average(function, prices, time_period):
+    return MA_FUNCTIONS[_check_function(function)](prices, time_period)
+
+
+# ==================================================================================================================== #
+# Multi-period sweep - every period of one function in a single pass
+# Each (series, period) pair becomes one column, so SMA/WMA/TRIMA share one set of cumulative sums and the EMA family /
+# KAMA / T3 run one recursive loop over time for all periods at once: O(n * k) instead of k separate calls.
+# ==================================================================================================================== #
+
+def sweep(function, prices, periods):
+    # 1-D prices -> (time, len(periods)) matrix; 2-D time x symbol prices -> (time, symbols, len(periods))
+    function = _check_function(function)
+    periods = np.array([_check_period(p) for p in periods], dtype='int64')
+    if periods.size == 0:
+        raise ValueError('periods must contain at least one time_period')
+
+    values, squeeze = _as_matrix(prices)
+    n_time, n_symbols = values.shape
+    # Column layout: symbol-major, period-minor -> reshapes straight to (time, symbols, periods)
+    tiled = np.repeat(values, len(periods), axis=1)
+    column_periods = np.tile(periods, n_symbols)
+
+    result = _KERNELS[function](tiled, column_periods).reshape(n_time, n_symbols, len(periods))
+    return result[:, 0, :] if squeeze else result
+
+
+# ==================================================================================================================== #
+# Store-backed helpers - same shape as the endpoint scripts' CSV output
+# ==================================================================================================================== #
+
+def indicator_frame(function, symbol, time_period, interval='daily', series_type='close', start=None, end=None):
+    # One symbol, API-style output: Date + {FUNCTION}_{time_period}, newest first, warm-up rows dropped
+    bars = timeseries_store.read(symbol, interval, start=start, end=end, columns=[series_type])
+    if bars.empty:
+        raise ValueError(f'No {interval} bars stored for {symbol.upper()} - fetch the time series first')
+
+    column = f'{function.upper()}_{time_period}'
+    values = moving_average(function, bars[series_type].to_numpy(), time_period)
+    df = pd.DataFrame({'Date': bars['timestamp'], column: values}).dropna(subset=[column])
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def indicator_matrix(function, symbols, time_period, interval='daily', series_type='close', start=None, end=None):
+    # Many symbols at once: time x symbol frame of the indicator, computed in a single vectorized pass
+    prices = timeseries_store.read_wide(symbols, interval, column=series_type, start=start, end=end)
+    if prices.empty:
+        return prices
+    return pd.DataFrame(moving_average(function, prices.to_numpy(), time_period),
+                        index=prices.index, columns=prices.columns)
+
+
+def sweep_frame(function, symbol, periods, interval='daily', series_type='close', start=None, end=None):
+    # One symbol, many periods: Date + one {FUNCTION}_{time_period} column per period, newest first
+    bars = timeseries_store.read(symbol, interval, start=start, end=end, columns=[series_type])
+    if bars.empty:
+        raise ValueError(f'No {interval} bars stored for {symbol.upper()} - fetch the time series first')
+
+    function = _check_function(function)
+    matrix = sweep(function, bars[series_type].to_numpy(), periods)
+    df = pd.DataFrame(matrix, columns=[f'{function}_{p}' for p in periods])
+    df.insert(0, 'Date', bars['timestamp'])
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    symbol = input('Enter Symbol: ').upper()
+    function = input(f'Moving Average ({"/".join(MOVING_AVERAGES)}): ').upper()
+    time_period = int(input('Enter Time Period (common: 20, 50, 200): '))
+
+    df = indicator_frame(function, symbol, time_period)
+    print(f'\n{function}({time_period}) for {symbol} computed locally from {len(df)} stored daily bars:')
+    print(df.head(10).to_string(index=False))
@@ -0,0 +1,178 @@
+# ==================================================================================================================== #
+# Session VWAP: Volume Weighted Average Price computed locally from intraday bars (Core_Stock/intraday.py -> store).
+# Like the API's VWAP it uses the typical price (high + low + close) / 3 and resets at every session boundary (each
+# trading day). Batch mode covers a time x symbol matrix in one cumulative-sum pass; streaming mode keeps running
+# price*volume / volume sums per symbol so every new bar is an O(1) update instead of an API round trip.
+# ==================================================================================================================== #
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Technical_Indicators.streaming_indicators import StreamingIndicator
+
+INTRADAY_INTERVALS = ('1min', '5min', '15min', '30min', '60min')
+
+# Regular US trading hours (Alpha Vantage intraday timestamps are US/Eastern)
+REGULAR_OPEN = pd.Timedelta(hours=9, minutes=30)
+REGULAR_CLOSE = pd.Timedelta(hours=16)
+
+
+def _session_keys(timestamps):
+    # One key per bar - the bar's trading day (int64 days since epoch)
+    return pd.DatetimeIndex(timestamps).values.astype('datetime64[D]').astype('int64')
+
+
+def _regular_hours(timestamps):
+    # Bars starting inside 09:30 <= t < 16:00 (bar timestamps are the bar's open time)
+    index = pd.DatetimeIndex(timestamps)
+    time_of_day = index - index.normalize()
+    return np.asarray((time_of_day >= REGULAR_OPEN) & (time_of_day < REGULAR_CLOSE))
+
+
+# ==================================================================================================================== #
+# Batch - whole history for many symbols at once
+# ==================================================================================================================== #
+
+def session_vwap(high, low, close, volume, timestamps, regular_hours=False):
+    # high / low / close / volume: (time, symbols) arrays or DataFrames; timestamps: one per row.
+    # Returns VWAP with the same shape; rows where a symbol has no bar (or outside regular hours) are NaN.
+    frame = close if isinstance(close, pd.DataFrame) else None
+    high, low, close, volume = (np.asarray(x, dtype='float64') for x in (high, low, close, volume))
+    squeeze = close.ndim == 1
+    if squeeze:
+        high, low, close, volume = (x[:, None] for x in (high, low, close, volume))
+
+    present = np.isfinite(close) & np.isfinite(volume)
+    if regular_hours:
+        present &= _regular_hours(timestamps)[:, None]
+
+    typical = (high + low + close) / 3.0
+    price_volume = np.where(present, typical * volume, 0.0)
+    volume = np.where(present, volume, 0.0)
+
+    # Running sums reset per session: cumulative sum minus the cumulative sum just before the session started
+    keys = _session_keys(timestamps)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    first_row = np.repeat(starts, np.diff(np.r_[starts, len(keys)]))
+
+    cum_pv = np.cumsum(price_volume, axis=0)
+    cum_v = np.cumsum(volume, axis=0)
+    before_pv = np.where((first_row > 0)[:, None], cum_pv[first_row - 1], 0.0)
+    before_v = np.where((first_row > 0)[:, None], cum_v[first_row - 1], 0.0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        vwap = (cum_pv - before_pv) / (cum_v - before_v)
+    vwap = np.where(present, vwap, np.nan)
+
+    if frame is not None:
+        return pd.DataFrame(vwap, index=frame.index, columns=frame.columns)
+    return vwap[:, 0] if squeeze else vwap
+
+
+def vwap_from_store(symbols, interval='5min', start=None, end=None, regular_hours=False):
+    # Time x symbol VWAP frame from intraday bars already in the local store
+    if interval not in INTRADAY_INTERVALS:
+        raise ValueError(f'VWAP is an intraday indicator - interval must be one of {", ".join(INTRADAY_INTERVALS)}')
+    long = timeseries_store.read(symbols, interval, start=start, end=end, columns=['high', 'low', 'close', 'volume'])
+    if long.empty:
+        raise ValueError(f'No {interval} bars stored for {symbols} - run Core_Stock/intraday.py first')
+    order = [s.upper() for s in ([symbols] if isinstance(symbols, str) else symbols)]
+    wide = {f: long.pivot(index='timestamp', columns='symbol', values=f).reindex(columns=order)
+            for f in ('high', 'low', 'close', 'volume')}
+    return session_vwap(wide['high'], wide['low'], wide['close'], wide['volume'], wide['close'].index,
+                        regular_hours=regular_hours)
+
+
+def vwap_frame(symbol, interval='5min', start=None, end=None, regular_hours=False):
+    # One symbol, API-style output: Date + VWAP, newest first
+    vwap = vwap_from_store(symbol, interval, start=start, end=end, regular_hours=regular_hours)[symbol.upper()]
+    df = pd.DataFrame({'Date': vwap.index, 'VWAP': vwap.to_numpy()}).dropna(subset=['VWAP'])
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+# ==================================================================================================================== #
+# Streaming - bars as they arrive
+# ==================================================================================================================== #
+
+class StreamingVWAP(StreamingIndicator):
+    # Single symbol: update({'timestamp', 'high', 'low', 'close', 'volume'}) -> session VWAP so far
+    def __init__(self, regular_hours=False):
+        self.regular_hours = regular_hours
+        self.session = None
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+        self.value = None
+
+    def update(self, bar):
+        timestamp = pd.Timestamp(bar['timestamp'])
+        if self.regular_hours and not _regular_hours([timestamp])[0]:
+            return self.value
+
+        session = timestamp.strftime('%Y-%m-%d')
+        if session != self.session:
+            self.session, self.cum_pv, self.cum_v, self.value = session, 0.0, 0.0, None
+
+        volume = float(bar['volume'])
+        self.cum_pv += (float(bar['high']) + float(bar['low']) + float(bar['close'])) / 3.0 * volume
+        self.cum_v += volume
+        if self.cum_v > 0:
+            self.value = self.cum_pv / self.cum_v
+        return self.value
+
+
+class StreamingVWAPBatch(StreamingIndicator):
+    # Many symbols in lock-step: update(timestamp, high, low, close, volume) with one value per symbol (NaN = no bar)
+    # is a few vector ops however many symbols are tracked. Each symbol resets at its own first bar of a new session.
+    def __init__(self, symbols, regular_hours=False):
+        self.symbols = [s.upper() for s in symbols]
+        self.regular_hours = regular_hours
+        self.session = np.full(len(self.symbols), -1, dtype='int64')
+        self.cum_pv = np.zeros(len(self.symbols))
+        self.cum_v = np.zeros(len(self.symbols))
+        self.value = None
+
+    def update(self, timestamp, high=None, low=None, close=None, volume=None):
+        if isinstance(timestamp, dict):
+            bar = timestamp
+            timestamp, high, low, close, volume = (bar[k] for k in ('timestamp', 'high', 'low', 'close', 'volume'))
+        timestamp = np.datetime64(pd.Timestamp(timestamp))
+        high, low, close, volume = (np.asarray(x, dtype='float64') for x in (high, low, close, volume))
+
+        present = np.isfinite(close) & np.isfinite(volume)
+        if self.regular_hours and not _regular_hours([timestamp])[0]:
+            present[:] = False
+
+        session = int(timestamp.astype('datetime64[D]').astype('int64'))
+        reset = present & (self.session != session)
+        self.cum_pv[reset] = 0.0
+        self.cum_v[reset] = 0.0
+        self.session[present] = session
+
+        self.cum_pv += np.where(present, (high + low + close) / 3.0 * volume, 0.0)
+        self.cum_v += np.where(present, volume, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vwap = np.where(self.session == session, self.cum_pv / self.cum_v, np.nan)
+        self.value = vwap
+        return vwap
+
+    def seed(self, history):
+        # history: a long-format DataFrame (timestamp, symbol, high, low, close, volume) e.g. timeseries_store.read
+        for timestamp, rows in history.groupby('timestamp', sort=True):
+            rows = rows.set_index('symbol').reindex(self.symbols)
+            self.update(timestamp, rows['high'], rows['low'], rows['close'], rows['volume'])
+        return self.value
+
+    def as_dict(self):
+        # {symbol: latest VWAP} (None for symbols with no bar yet this session)
+        if self.value is None:
+            return {}
+        return {s: None if np.isnan(v) else float(v) for s, v in zip(self.symbols, self.value)}
+
+
+if __name__ == '__main__':
+    symbol = input('Enter Ticker for VWAP: ').upper()
+    interval = input(f'Interval ({", ".join(INTRADAY_INTERVALS)}): ') or '5min'
+    df = vwap_frame(symbol, interval)
+    print(f'\nSession VWAP for {symbol} ({interval}) computed locally from stored intraday bars:')
+    print(df.head(10).to_string(index=False))
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json   
 
@@ -83,7 +83,7 @@ def stoch_indicator():
     stoch_csv_url = f'{base_url}?{urlencode(params)}' 
 
     # Download and Save CSV 
-    response = requests.get(stoch_csv_url)  
+    response = av_get(stoch_csv_url)  
     Path('Technical_Indicators_CSV').mkdir(exist_ok="True") 
 
     filename = f'Technical_Indicators_CSV/{ticker}_daily_{fn}.csv' 
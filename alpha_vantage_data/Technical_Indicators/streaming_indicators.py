@@ -0,0 +1,425 @@
+# ==================================================================================================================== #
+# Streaming Indicators: Stateful, O(1)-per-bar versions of the moving averages, RSI, MACD / MACDEXT, OBV and AD.
+# Seed an indicator once from history (the local Time Series Store or any list of bars), then call update(bar) as each
+# new bar arrives - only the newest value is computed, nothing is re-downloaded. State is plain JSON so a monitor can
+# checkpoint it and pick up where it left off after a restart. Bars with a missing (NaN / infinite) price are skipped -
+# the indicator keeps its last value instead of carrying the NaN into every later bar and the checkpoint.
+# ==================================================================================================================== #
+
+import os
+import json
+import math
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Technical_Indicators.moving_averages import MA_TYPES, KAMA_FAST, KAMA_SLOW, T3_VFACTOR
+
+_REGISTRY = {}
+
+# Running sums (SMA / WMA) are recomputed from their window every RESYNC_EVERY updates so float drift can't build up
+RESYNC_EVERY = 1000
+
+
+def _price(bar, series_type='close'):
+    # A bar is either a bare price or any mapping / row with open, high, low, close, volume
+    if isinstance(bar, (int, float)):
+        return float(bar)
+    try:
+        return float(bar[series_type])
+    except (TypeError, IndexError):
+        return float(bar)
+
+
+def _missing(*values):
+    return not all(math.isfinite(v) for v in values)
+
+
+class StreamingIndicator:
+    # Base class: update(bar) -> newest value (None while warming up), seed(history), JSON-able to_dict / from_dict
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _REGISTRY[cls.__name__] = cls
+
+    def update(self, bar):
+        raise NotImplementedError
+
+    def seed(self, history):
+        # Warm up from history once - e.g. a DataFrame's records or a list of prices
+        for bar in history:
+            self.update(bar)
+        return self.value
+
+    @property
+    def ready(self):
+        return self.value is not None
+
+    def to_dict(self):
+        state = {}
+        for name, value in vars(self).items():
+            if isinstance(value, StreamingIndicator):
+                value = {'indicator': value.to_dict()}
+            elif isinstance(value, list) and value and isinstance(value[0], StreamingIndicator):
+                value = {'indicators': [v.to_dict() for v in value]}
+            elif isinstance(value, deque):
+                value = {'deque': list(value)}
+            elif isinstance(value, np.ndarray):
+                value = {'array': value.tolist(), 'dtype': str(value.dtype)}
+            state[name] = value
+        return {'type': type(self).__name__, 'state': state}
+
+    @staticmethod
+    def from_dict(data):
+        cls = _REGISTRY.get(data.get('type'))
+        if cls is None:
+            raise ValueError(f"Unknown streaming indicator type '{data.get('type')}'")
+        indicator = cls.__new__(cls)
+        for name, value in data['state'].items():
+            if isinstance(value, dict) and 'indicator' in value:
+                value = StreamingIndicator.from_dict(value['indicator'])
+            elif isinstance(value, dict) and 'indicators' in value:
+                value = [StreamingIndicator.from_dict(v) for v in value['indicators']]
+            elif isinstance(value, dict) and 'deque' in value:
+                value = deque(value['deque'])
+            elif isinstance(value, dict) and 'array' in value:
+                value = np.array(value['array'], dtype=value['dtype'])
+            setattr(indicator, name, value)
+        return indicator
+
+
+# ==================================================================================================================== #
+# Moving averages (used on their own and as MACD / MACDEXT legs)
+# ==================================================================================================================== #
+
+class StreamingSMA(StreamingIndicator):
+    def __init__(self, time_period, series_type='close'):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.window = deque()
+        self.total = 0.0
+        self.updates = 0
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        self.window.append(price)
+        self.total += price
+        if len(self.window) > self.time_period:
+            self.total -= self.window.popleft()
+        self.updates += 1
+        if self.updates % RESYNC_EVERY == 0:
+            self.total = float(sum(self.window))
+        if len(self.window) == self.time_period:
+            self.value = self.total / self.time_period
+        return self.value
+
+
+class StreamingEMA(StreamingIndicator):
+    # Seeded with the SMA of the first time_period prices, then alpha = 2 / (n + 1) - same as the API
+    def __init__(self, time_period, series_type='close', alpha=None):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.alpha = alpha if alpha is not None else 2.0 / (self.time_period + 1)
+        self.count = 0
+        self.seed_total = 0.0
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        if self.value is None:
+            self.count += 1
+            self.seed_total += price
+            if self.count == self.time_period:
+                self.value = self.seed_total / self.time_period
+        else:
+            self.value += self.alpha * (price - self.value)
+        return self.value
+
+
+class StreamingWMA(StreamingIndicator):
+    # Running plain and weighted sums: dropping the oldest price lowers every remaining weight by one.
+    # The sums are resynced from the window like StreamingSMA's
+    def __init__(self, time_period, series_type='close'):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.window = deque()
+        self.total = 0.0
+        self.weighted = 0.0
+        self.updates = 0
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        n = self.time_period
+        if len(self.window) == n:
+            self.weighted += n * price - self.total
+            self.total += price - self.window.popleft()
+        else:
+            self.weighted += (len(self.window) + 1) * price
+            self.total += price
+        self.window.append(price)
+        self.updates += 1
+        if self.updates % RESYNC_EVERY == 0:
+            self.total = float(sum(self.window))
+            self.weighted = float(sum(weight * p for weight, p in enumerate(self.window, start=1)))
+        if len(self.window) == n:
+            self.value = self.weighted / (n * (n + 1) / 2)
+        return self.value
+
+
+class _Chained(StreamingIndicator):
+    # Each stage smooths the previous stage's output; combine() mixes the stage values once all are warm
+    def _advance(self, bar):
+        value = _price(bar, self.series_type)
+        if _missing(value):
+            return None  # skipped here, so no stage sees the bar twice
+        outputs = []
+        for stage in self.stages:
+            value = stage.update(value)
+            if value is None:
+                return None
+            outputs.append(value)
+        return outputs
+
+    def update(self, bar):
+        outputs = self._advance(bar)
+        if outputs is not None:
+            self.value = self.combine(outputs)
+        return self.value
+
+
+class StreamingDEMA(_Chained):
+    def __init__(self, time_period, series_type='close'):
+        self.series_type = series_type
+        self.stages = [StreamingEMA(time_period), StreamingEMA(time_period)]
+        self.value = None
+
+    def combine(self, outputs):
+        return 2 * outputs[0] - outputs[1]
+
+
+class StreamingTEMA(_Chained):
+    def __init__(self, time_period, series_type='close'):
+        self.series_type = series_type
+        self.stages = [StreamingEMA(time_period) for _ in range(3)]
+        self.value = None
+
+    def combine(self, outputs):
+        return 3 * outputs[0] - 3 * outputs[1] + outputs[2]
+
+
+class StreamingTRIMA(_Chained):
+    def __init__(self, time_period, series_type='close'):
+        time_period = int(time_period)
+        first = (time_period + 1) // 2 if time_period % 2 else time_period // 2
+        self.series_type = series_type
+        self.stages = [StreamingSMA(first), StreamingSMA(time_period + 1 - first)]
+        self.value = None
+
+    def combine(self, outputs):
+        return outputs[-1]
+
+
+class StreamingT3(_Chained):
+    def __init__(self, time_period, series_type='close', vfactor=T3_VFACTOR):
+        self.series_type = series_type
+        self.vfactor = vfactor
+        self.stages = [StreamingEMA(time_period) for _ in range(6)]
+        self.value = None
+
+    def combine(self, outputs):
+        a = self.vfactor
+        e3, e4, e5, e6 = outputs[2:]
+        return (-a ** 3) * e6 + (3 * a ** 2 + 3 * a ** 3) * e5 + (-6 * a ** 2 - 3 * a - 3 * a ** 3) * e4 \
+            + (1 + 3 * a + a ** 3 + 3 * a ** 2) * e3
+
+
+class StreamingKAMA(StreamingIndicator):
+    def __init__(self, time_period, series_type='close'):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.window = deque()      # last time_period + 1 prices
+        self.volatility = 0.0      # running sum of |price change| across the window
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        if self.window:
+            self.volatility += abs(price - self.window[-1])
+        self.window.append(price)
+        if len(self.window) > self.time_period + 1:
+            oldest = self.window.popleft()
+            self.volatility -= abs(self.window[0] - oldest)
+        if len(self.window) < self.time_period + 1:
+            return self.value
+
+        change = abs(price - self.window[0])
+        ratio = 1.0 if self.volatility <= change or self.volatility == 0 else change / self.volatility
+        fast, slow = 2.0 / (KAMA_FAST + 1), 2.0 / (KAMA_SLOW + 1)
+        smoothing = (ratio * (fast - slow) + slow) ** 2
+        previous = self.window[-2] if self.value is None else self.value
+        self.value = previous + smoothing * (price - previous)
+        return self.value
+
+
+STREAMING_MA = {
+    'SMA': StreamingSMA, 'EMA': StreamingEMA, 'WMA': StreamingWMA, 'DEMA': StreamingDEMA,
+    'TEMA': StreamingTEMA, 'TRIMA': StreamingTRIMA, 'KAMA': StreamingKAMA, 'T3': StreamingT3,
+}
+
+
+def streaming_ma(matype, time_period):
+    # matype: the API's integer code (see moving_averages.MA_TYPES) or a name like 'EMA'
+    name = MA_TYPES.get(matype, matype) if isinstance(matype, int) else str(matype).upper()
+    if name not in STREAMING_MA:
+        raise ValueError(f"Moving average type '{name}' has no streaming version - use one of {', '.join(STREAMING_MA)}")
+    return STREAMING_MA[name](time_period)
+
+
+# ==================================================================================================================== #
+# Oscillators & volume indicators
+# ==================================================================================================================== #
+
+class StreamingRSI(StreamingIndicator):
+    # Wilder RSI: simple average of the first time_period gains/losses, Wilder smoothing afterwards
+    def __init__(self, time_period=14, series_type='close'):
+        self.time_period = int(time_period)
+        self.series_type = series_type
+        self.prev_price = None
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        if self.prev_price is None:
+            self.prev_price = price
+            return self.value
+
+        change = price - self.prev_price
+        self.prev_price = price
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        n = self.time_period
+        if self.count < n:
+            self.count += 1
+            self.avg_gain += gain / n
+            self.avg_loss += loss / n
+            if self.count < n:
+                return self.value
+        else:
+            self.avg_gain = (self.avg_gain * (n - 1) + gain) / n
+            self.avg_loss = (self.avg_loss * (n - 1) + loss) / n
+
+        total = self.avg_gain + self.avg_loss
+        self.value = 100.0 * self.avg_gain / total if total else 0.0
+        return self.value
+
+
+class StreamingMACD(StreamingIndicator):
+    # MACD = fast MA - slow MA, signal = MA of MACD. matypes default to EMA (MACD); pass 0 (SMA) etc. for MACDEXT.
+    # NOTE: Both legs seed on the first bar, so the first few values differ slightly from the API's aligned seeding
+    # before converging - seed with a few hundred bars of history
+    def __init__(self, fastperiod=12, slowperiod=26, signalperiod=9, fastmatype=1, slowmatype=1, signalmatype=1,
+                 series_type='close'):
+        self.series_type = series_type
+        self.fast = streaming_ma(fastmatype, fastperiod)
+        self.slow = streaming_ma(slowmatype, slowperiod)
+        self.signal = streaming_ma(signalmatype, signalperiod)
+        self.value = None
+
+    def update(self, bar):
+        price = _price(bar, self.series_type)
+        if _missing(price):
+            return self.value
+        fast, slow = self.fast.update(price), self.slow.update(price)
+        if fast is None or slow is None:
+            return self.value
+        macd = fast - slow
+        signal = self.signal.update(macd)
+        if signal is not None:
+            # Same keys as the API's MACD / MACDEXT CSV columns
+            self.value = {'MACD': macd, 'MACD_Hist': macd - signal, 'MACD_Signal': signal}
+        return self.value
+
+
+def streaming_macdext(fastperiod=12, slowperiod=26, signalperiod=9, fastmatype=0, slowmatype=0, signalmatype=0,
+                      series_type='close'):
+    # MACDEXT defaults: SMA legs (matype 0), like the API
+    return StreamingMACD(fastperiod, slowperiod, signalperiod, fastmatype, slowmatype, signalmatype, series_type)
+
+
+class StreamingOBV(StreamingIndicator):
+    # On Balance Volume - starts at the first bar's volume
+    def __init__(self):
+        self.prev_close = None
+        self.value = None
+
+    def update(self, bar):
+        close, volume = float(bar['close']), float(bar['volume'])
+        if _missing(close, volume):
+            return self.value
+        if self.prev_close is None:
+            self.value = volume
+        elif close > self.prev_close:
+            self.value += volume
+        elif close < self.prev_close:
+            self.value -= volume
+        self.prev_close = close
+        return self.value
+
+
+class StreamingAD(StreamingIndicator):
+    # Chaikin Accumulation/Distribution line
+    def __init__(self):
+        self.value = None
+
+    def update(self, bar):
+        high, low, close, volume = (float(bar[k]) for k in ('high', 'low', 'close', 'volume'))
+        if _missing(high, low, close, volume):
+            return self.value
+        flow = ((close - low) - (high - close)) / (high - low) * volume if high > low else 0.0
+        self.value = (self.value or 0.0) + flow
+        return self.value
+
+
+# ==================================================================================================================== #
+# Seeding & checkpoints
+# ==================================================================================================================== #
+
+def seed_from_store(indicator, symbol, interval, start=None, end=None):
+    # Warm an indicator from bars already in the local Time Series Store; returns the newest stored timestamp so the
+    # caller knows where live updates should continue from
+    bars = timeseries_store.read(symbol, interval, start=start, end=end)
+    if bars.empty:
+        raise ValueError(f'No {interval} bars stored for {symbol.upper()} - fetch the time series first')
+    indicator.seed(bars.to_dict('records'))
+    return bars['timestamp'].iloc[-1]
+
+
+def save_checkpoint(path, indicators):
+    # indicators: {name: StreamingIndicator}; written atomically so a crash never leaves a half-written checkpoint
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump({name: indicator.to_dict() for name, indicator in indicators.items()}, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    with open(path, 'r') as f:
+        return {name: StreamingIndicator.from_dict(data) for name, data in json.load(f).items()}
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
 
@@ -70,7 +70,7 @@ def trima_indicator():
 
     trima_url = f'{base_url}?{urlencode(params)}' 
 
-    response = requests.get(trima_url) 
+    response = av_get(trima_url) 
     data = response.json() 
 
     Path('Technical_Indicators_JSON').mkdir(exist_ok=True)
@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
  
@@ -90,7 +90,7 @@ def vwap_indicator():
     vwap_csv_url = f'{base_url}?{urlencode(params)}' 
 
     # Fetch Data and Save as CSV 
-    response = requests.get(vwap_csv_url) 
+    response = av_get(vwap_csv_url) 
     Path('Technical_Indicators_CSV').mkdir(exist_ok=True)  
 
     filename = f'Technical_Indicators_CSV/{ticker}_{interval_choice}_{fn}.csv' 
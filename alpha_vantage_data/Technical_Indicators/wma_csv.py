@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from urllib.parse import urlencode 
 from pathlib import Path 
 import csv 
-import requests 
+from alpha_vantage_data.av_client import av_get
 import pandas as pd  
 import json  
 
@@ -69,7 +69,7 @@ def wma_indicator():
 
     wma_csv_url = f'{base_url}?{urlencode(params)}' 
 
-    response = requests.get(wma_csv_url) 
+    response = av_get(wma_csv_url) 
 
 
     Path('Technical_Indicators_CSV').mkdir(exist_ok=True)
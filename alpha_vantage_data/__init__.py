@@ -1 +1,5 @@
-# This file can be empty
\ No newline at end of file
+# This file can be empty
+# Endpoint scripts import the shared modules as alpha_vantage_data.*, so run them as modules from the repo root, e.g.
+#   python -m alpha_vantage_data.Core_Stock.intraday
+#   python -m streamlit run alpha_vantage_data/Fundamental_Data/Financial_Statements/field_extraction.py
+# (stock-analysis_pipeline scripts put the repo root on sys.path themselves - see stock-analysis_pipeline/repo_path.py)
@@ -0,0 +1,250 @@
+# ==================================================================================================================== #
+# Alpha Vantage Client: Shared pooled HTTP session used by every endpoint module in this repo.
+# One keep-alive connection pool to alphavantage.co (no fresh TCP/TLS handshake per call), gzip/deflate
+# transfer compression, and default connect/read timeouts so a stalled call can't hang a bulk job.
+# ==================================================================================================================== #
+
+import os
+import copy
+import time
+import threading
+from pathlib import Path
+from dotenv import load_dotenv
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from alpha_vantage_data import rate_limiter
+from alpha_vantage_data import response_cache
+from alpha_vantage_data.rate_limiter import DailyQuotaExceeded, RateLimitError
+
+load_dotenv()
+
+BASE_URL = 'https://www.alphavantage.co/query'
+
+# ==== Tunables (override in .env) ==== #
+# ALPHA_VANTAGE_POOL_SIZE       - max keep-alive connections held open per host (default 16)
+# ALPHA_VANTAGE_CONNECT_TIMEOUT - seconds to wait for the TCP/TLS connect (default 5)
+# ALPHA_VANTAGE_READ_TIMEOUT    - seconds to wait between bytes of the response (default 60)
+# ALPHA_VANTAGE_MAX_RETRIES     - retries on connection errors and 502/503/504 responses (default 2)
+# ALPHA_VANTAGE_THROTTLE_RETRIES - retries after the API answers with a rate-limit notice (default 3)
+# ALPHA_VANTAGE_CHUNK_KB        - read size for streamed downloads written straight to disk (default 256)
+# ALPHA_VANTAGE_COALESCE        - set to 0 to stop identical concurrent calls from sharing one request (default 1)
+# Per-minute / per-day budgets are set in rate_limiter.py, cache TTLs and size cap in response_cache.py
+POOL_SIZE = int(os.getenv('ALPHA_VANTAGE_POOL_SIZE', 16))
+CONNECT_TIMEOUT = float(os.getenv('ALPHA_VANTAGE_CONNECT_TIMEOUT', 5))
+READ_TIMEOUT = float(os.getenv('ALPHA_VANTAGE_READ_TIMEOUT', 60))
+MAX_RETRIES = int(os.getenv('ALPHA_VANTAGE_MAX_RETRIES', 2))
+THROTTLE_RETRIES = int(os.getenv('ALPHA_VANTAGE_THROTTLE_RETRIES', 3))
+CHUNK_SIZE = int(os.getenv('ALPHA_VANTAGE_CHUNK_KB', 256)) * 1024
+COALESCE = os.getenv('ALPHA_VANTAGE_COALESCE', '1') not in ('0', 'false', 'False', 'no')
+
+_session = None
+_session_lock = threading.Lock()
+
+# Single-flight registry: request key -> the call currently fetching it
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+def _build_session():
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=['GET']
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'User-Agent': 'API_Showcase/alpha_vantage_data'
+    })
+    return session
+
+
+def get_session():
+    # Lazily create one Session per process - requests.Session is safe to share across worker threads for GETs
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure(pool_size=None, connect_timeout=None, read_timeout=None, max_retries=None):
+    # Re-tune the shared pool at runtime (e.g. a batch job raising pool_size to match its worker count)
+    global POOL_SIZE, CONNECT_TIMEOUT, READ_TIMEOUT, MAX_RETRIES, _session
+    with _session_lock:
+        if pool_size is not None:
+            POOL_SIZE = int(pool_size)
+        if connect_timeout is not None:
+            CONNECT_TIMEOUT = float(connect_timeout)
+        if read_timeout is not None:
+            READ_TIMEOUT = float(read_timeout)
+        if max_retries is not None:
+            MAX_RETRIES = int(max_retries)
+
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def _cached_response(url, body):
+    # Rebuild a requests.Response around a cached body so callers can keep using .text / .json() / .content
+    response = requests.Response()
+    response._content = body
+    response.status_code = 200
+    response.encoding = 'utf-8'
+    response.url = url
+    response.headers['X-Cache'] = 'HIT'
+    return response
+
+
+class _Flight:
+    # One in-progress call that identical concurrent calls wait on instead of repeating
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _single_flight(key, fetch):
+    # The first caller for a key runs fetch(); callers arriving while it is in flight block and share its result
+    # (or its exception). Returns (result, shared). The key is released as soon as the call finishes - later
+    # callers are served by the response cache rather than by this registry.
+    with _in_flight_lock:
+        flight = _in_flight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _in_flight[key] = _Flight()
+
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result, True
+
+    try:
+        flight.result = fetch()
+        return flight.result, False
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+        flight.done.set()
+
+
+def av_get(url=BASE_URL, params=None, timeout=None, use_cache=True, **kwargs):
+    # Drop-in replacement for requests.get(url) - accepts either a fully built URL or base url + params dict
+    # Fresh cached responses are served from disk without touching the network or the rate limiter;
+    # otherwise the call takes a token from the shared cross-process rate limiter first
+    # Identical calls (same function + params, apikey ignored) already in flight on another thread share that one
+    # network call - e.g. several dashboard sessions asking for the same symbol at once
+    # NOTE: use_cache=False bypasses the response cache for this call (ALPHA_VANTAGE_CACHE=0 bypasses it everywhere)
+    if not COALESCE or kwargs:
+        return _fetch(url, params, timeout, use_cache, **kwargs)
+    key = ('response', use_cache, response_cache.cache_key(url, params)[1])
+    response, shared = _single_flight(key, lambda: _fetch(url, params, timeout, use_cache))
+    # Followers get their own Response object around the same body bytes
+    return copy.copy(response) if shared else response
+
+
+def av_get_json(url=BASE_URL, params=None, timeout=None, use_cache=True):
+    # av_get(...).json() with the parse coalesced too: concurrent identical calls share one request and one parsed
+    # payload. NOTE: the payload object is shared between those callers - treat it as read-only
+    if not COALESCE:
+        return _fetch(url, params, timeout, use_cache).json()
+    key = ('json', use_cache, response_cache.cache_key(url, params)[1])
+    payload, _ = _single_flight(key, lambda: av_get(url, params, timeout, use_cache).json())
+    return payload
+
+
+def _fetch(url, params=None, timeout=None, use_cache=True, **kwargs):
+    use_cache = use_cache and response_cache.CACHE_ENABLED
+    if use_cache:
+        function, key = response_cache.cache_key(url, params)
+        body = response_cache.get(key)
+        if body is not None:
+            return _cached_response(url, body)
+
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+
+    for attempt in range(THROTTLE_RETRIES + 1):
+        rate_limiter.acquire()
+        response = get_session().get(url, params=params, timeout=timeout, **kwargs)
+        if not rate_limiter.is_rate_limit_response(response):
+            if use_cache and response_cache.is_cacheable(response):
+                ttl = response_cache.ttl_for(function, response_cache.request_params(url, params))
+                response_cache.put(key, function, response.content, ttl)
+            return response
+        if rate_limiter.is_daily_quota_response(response):
+            raise DailyQuotaExceeded(f'Alpha Vantage daily quota is spent: {response.text[:200]}')
+
+        # Over quota anyway - back off instead of handing the "Note"/"Information" body back to be saved as data
+        rate_limiter.penalize()
+        time.sleep(min(2 ** attempt, 30))
+
+    raise RateLimitError(f'Alpha Vantage rate limit still exceeded after {THROTTLE_RETRIES} retries: {response.text[:200]}')
+
+
+def av_download(path, url=BASE_URL, params=None, timeout=None, use_cache=True, compress=True, chunk_size=None):
+    # Streaming counterpart of av_get for large CSV bodies (full option chains, full intraday histories): the body is
+    # written to `path` chunk by chunk as it arrives (decompressed on the fly when the server gzips it), so memory
+    # stays flat whatever the response size. Written to a temp file and renamed, so a failed download never leaves a
+    # truncated file behind. Returns the Path written.
+    # NOTE: Cache hits are served from the response cache, but streamed bodies are not added to it (that would mean
+    # holding the whole body in memory again)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.part')
+
+    if use_cache and response_cache.CACHE_ENABLED:
+        body = response_cache.get(response_cache.cache_key(url, params)[1])
+        if body is not None:
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+            return path
+
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    headers = None if compress else {'Accept-Encoding': 'identity'}
+
+    for attempt in range(THROTTLE_RETRIES + 1):
+        rate_limiter.acquire()
+        try:
+            with get_session().get(url, params=params, timeout=timeout, headers=headers, stream=True) as response:
+                chunks = response.iter_content(chunk_size=chunk_size or CHUNK_SIZE)
+                first = next(chunks, b'')
+                if first.lstrip().startswith(b'{'):
+                    # JSON instead of CSV - an error or rate-limit notice, always small, so it's safe to read in full
+                    response._content = first + b''.join(chunks)
+                    if rate_limiter.is_daily_quota_response(response):
+                        raise DailyQuotaExceeded(f'Alpha Vantage daily quota is spent: {response.text[:200]}')
+                    if rate_limiter.is_rate_limit_response(response):
+                        rate_limiter.penalize()
+                        time.sleep(min(2 ** attempt, 30))
+                        continue
+                    tmp_path.write_bytes(response._content)
+                else:
+                    with open(tmp_path, 'wb') as f:
+                        f.write(first)
+                        for chunk in chunks:
+                            f.write(chunk)
+        except BaseException:
+            # A stream that dies midway leaves no partial .part file behind
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, path)
+        return path
+
+    raise RateLimitError(f'Alpha Vantage rate limit still exceeded after {THROTTLE_RETRIES} retries: {response.text[:200]}')
@@ -0,0 +1,181 @@
+# ==================================================================================================================== #
+# CSV Normalizer: Shared response-normalization stage for every datatype=csv endpoint script.
+# Parses the HTTP body once straight from memory with explicit dtypes, applies the script's column mapping, and writes
+# the final artifact exactly once - replacing the old write response.text -> pd.read_csv -> rename -> df.to_csv cycle.
+# ==================================================================================================================== #
+
+import os
+from io import BytesIO
+from pathlib import Path
+from dotenv import load_dotenv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from alpha_vantage_data.av_client import av_download
+
+load_dotenv()
+
+# ALPHA_VANTAGE_OUTPUT_FORMAT - default artifact format for the endpoint scripts: csv or parquet (default csv)
+# ALPHA_VANTAGE_CSV_BATCH_ROWS - rows per typed batch when streamed downloads are parsed incrementally (default 100000)
+OUTPUT_FORMAT = os.getenv('ALPHA_VANTAGE_OUTPUT_FORMAT', 'csv').lower()
+CSV_BATCH_ROWS = int(os.getenv('ALPHA_VANTAGE_CSV_BATCH_ROWS', 100_000))
+
+# Explicit dtypes for the raw Alpha Vantage CSV headers - skips pandas' type sniffing and keeps columns stable
+# (volume is nullable Int64 so equity share counts stay whole numbers and missing values still fit)
+CSV_DTYPES = {
+    'open': 'float64', 'high': 'float64', 'low': 'float64', 'close': 'float64',
+    'adjusted_close': 'float64', 'adjusted close': 'float64',
+    'volume': 'Int64',
+    'dividend_amount': 'float64', 'dividend amount': 'float64',
+    'split_coefficient': 'float64',
+    'price': 'float64', 'previous_close': 'float64', 'change': 'float64',
+    'value': 'float64',
+    'symbol': 'string', 'name': 'string', 'type': 'string', 'region': 'string',
+    'timezone': 'string', 'currency': 'string', 'matchScore': 'float64',
+}
+DATE_COLUMNS = ('timestamp', 'time', 'date')
+
+# dtypes override for the crypto / FX scripts, whose volumes really are fractional
+FRACTIONAL_VOLUME = {'volume': 'float64'}
+
+# Alpha Vantage uses '.' for missing observations in economic series
+NA_VALUES = ['.', 'None', '-', '']
+
+
+def parse_csv_body(body, dtypes=None, parse_dates=True):
+    # Parse a CSV response body (bytes or str) once, in memory
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if body.lstrip().startswith(b'{'):
+        # datatype=csv requests still answer errors ("Error Message", "Information") as JSON
+        raise ValueError(f'Expected CSV but Alpha Vantage returned: {body[:300].decode("utf-8", "replace")}')
+
+    header = body.split(b'\n', 1)[0].decode('utf-8', 'replace').strip().split(',')
+    column_dtypes = {c: t for c, t in {**CSV_DTYPES, **(dtypes or {})}.items() if c in header}
+    date_columns = [c for c in header if c in DATE_COLUMNS] if parse_dates else []
+
+    return pd.read_csv(
+        BytesIO(body),
+        dtype=column_dtypes,
+        parse_dates=date_columns,
+        na_values=NA_VALUES,
+        keep_default_na=True
+    )
+
+
+def write_frame(df, filename, fmt=None):
+    # Write the final artifact once; parquet swaps the file suffix. Returns the path actually written.
+    fmt = (fmt or OUTPUT_FORMAT).lower()
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == 'parquet':
+        path = path.with_suffix('.parquet')
+        df.to_parquet(path, index=False)
+    elif fmt == 'csv':
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported output format '{fmt}' - use 'csv' or 'parquet'")
+    return path
+
+
+def normalize_csv_response(response, filename, column_mapping=None, dtypes=None, fmt=None, parse_dates=False):
+    # Parse -> rename -> write once. Returns (DataFrame, path written).
+    # NOTE: Date columns stay as the API's strings unless parse_dates=True, so the scripts' console output is unchanged
+    df = parse_csv_body(response.content, dtypes=dtypes, parse_dates=parse_dates)
+    if column_mapping:
+        df.rename(columns=column_mapping, inplace=True)
+    return df, write_frame(df, filename, fmt=fmt)
+
+
+# ==================================================================================================================== #
+# Streaming path - for bodies too large to hold in memory (full option chains, full 1-min histories)
+# ==================================================================================================================== #
+
+def iter_csv_batches(path, dtypes=None, parse_dates=True, batch_rows=None):
+    # Parse a CSV file on disk incrementally: yields typed DataFrames of at most batch_rows rows each
+    path = Path(path)
+    with open(path, 'rb') as f:
+        head = f.read(300)
+    if head.lstrip().startswith(b'{'):
+        raise ValueError(f'Expected CSV but Alpha Vantage returned: {head.decode("utf-8", "replace")}')
+    if not head.strip():
+        return
+
+    header = head.split(b'\n', 1)[0].decode('utf-8', 'replace').strip().split(',')
+    column_dtypes = {c: t for c, t in {**CSV_DTYPES, **(dtypes or {})}.items() if c in header}
+    date_columns = [c for c in header if c in DATE_COLUMNS] if parse_dates else []
+
+    yield from pd.read_csv(
+        path,
+        dtype=column_dtypes,
+        parse_dates=date_columns,
+        na_values=NA_VALUES,
+        keep_default_na=True,
+        chunksize=batch_rows or CSV_BATCH_ROWS
+    )
+
+
+def normalize_csv_file(source, filename, column_mapping=None, dtypes=None, fmt=None, parse_dates=False, on_batch=None):
+    # File-to-file version of normalize_csv_response: parse -> rename -> append one batch at a time, so only a single
+    # batch is ever in memory. on_batch(raw_batch) sees each typed batch before renaming (e.g. to upsert it into the
+    # time series store). A header-only body still writes a header-only file, and an empty body removes any stale
+    # artifact from an earlier run. Returns (rows written, path written).
+    fmt = (fmt or OUTPUT_FORMAT).lower()
+    path = Path(filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == 'parquet':
+        path = path.with_suffix('.parquet')
+    elif fmt != 'csv':
+        raise ValueError(f"Unsupported output format '{fmt}' - use 'csv' or 'parquet'")
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    rows, writer, written = 0, None, False
+    try:
+        for batch in iter_csv_batches(source, dtypes=dtypes, parse_dates=parse_dates):
+            if on_batch is not None:
+                on_batch(batch)
+            if column_mapping:
+                batch = batch.rename(columns=column_mapping)
+            if fmt == 'parquet':
+                table = pa.Table.from_pandas(batch, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+            else:
+                batch.to_csv(tmp_path, mode='a' if written else 'w', header=not written, index=False)
+            rows += len(batch)
+            written = True
+    finally:
+        if writer is not None:
+            writer.close()
+    if written:
+        os.replace(tmp_path, path)
+    else:
+        path.unlink(missing_ok=True)
+    return rows, path
+
+
+def download_csv(url, filename, column_mapping=None, params=None, dtypes=None, fmt=None, on_batch=None):
+    # Streamed replacement for av_get + normalize_csv_response: body -> disk -> batched parse/rename -> final artifact.
+    # With no column mapping and csv output the streamed body already is the artifact, so it is kept as is (and only
+    # parsed when on_batch needs the rows - rows comes back None otherwise).
+    fmt = (fmt or OUTPUT_FORMAT).lower()
+    path = Path(filename)
+    if not column_mapping and fmt == 'csv':
+        av_download(path, url, params=params)
+        if on_batch is None:
+            return None, path
+        rows = 0
+        for batch in iter_csv_batches(path, dtypes=dtypes):
+            on_batch(batch)
+            rows += len(batch)
+        return rows, path
+
+    raw_path = path.with_name(path.name + '.download')
+    try:
+        av_download(raw_path, url, params=params)
+        return normalize_csv_file(raw_path, path, column_mapping, dtypes=dtypes, fmt=fmt, on_batch=on_batch)
+    finally:
+        raw_path.unlink(missing_ok=True)
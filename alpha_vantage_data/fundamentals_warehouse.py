@@ -0,0 +1,307 @@
+# ==================================================================================================================== #
+# Fundamentals Warehouse: Embedded SQLite warehouse replacing the one-JSON-file-per-ticker fundamentals layout.
+# Normalized tables for the company overview, annual & quarterly statements, earnings and dividends, keyed by
+# (symbol, fiscalDateEnding), with a bulk-ingest path from the existing JSON files - so a cross-ticker screen is one
+# indexed query instead of thousands of json.load calls.
+# ==================================================================================================================== #
+
+import os
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from dotenv import load_dotenv
+
+import pandas as pd
+
+load_dotenv()
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# ALPHA_VANTAGE_WAREHOUSE - SQLite file of the warehouse (default alpha_vantage_data/fundamentals.db)
+WAREHOUSE_DB = Path(os.getenv('ALPHA_VANTAGE_WAREHOUSE', Path(__file__).resolve().parent / 'fundamentals.db'))
+
+# ==== Table Layout ==== #
+# table name -> primary key columns; every other column is created on first sight of a field (schema grows with the API)
+TABLE_KEYS = {
+    'overview': ['symbol'],
+    'income_statement_annual': ['symbol', 'fiscalDateEnding'],
+    'income_statement_quarterly': ['symbol', 'fiscalDateEnding'],
+    'balance_sheet_annual': ['symbol', 'fiscalDateEnding'],
+    'balance_sheet_quarterly': ['symbol', 'fiscalDateEnding'],
+    'cash_flow_annual': ['symbol', 'fiscalDateEnding'],
+    'cash_flow_quarterly': ['symbol', 'fiscalDateEnding'],
+    'earnings_annual': ['symbol', 'fiscalDateEnding'],
+    'earnings_quarterly': ['symbol', 'fiscalDateEnding'],
+    'dividends': ['symbol', 'ex_dividend_date'],
+}
+
+# Known text fields (identifiers, labels, dates). Every other field is declared NUMERIC: SQLite then stores numbers as
+# numbers and anything non-numeric as text, whatever the first batch of a new column happened to contain ('None' -> NULL)
+TEXT_COLUMNS = {
+    'symbol', 'Symbol', 'CIK', 'FiscalYearEnd', 'reportedCurrency', 'Currency',
+    'AssetType', 'Name', 'Description', 'Exchange', 'Country', 'Sector', 'Industry', 'Address', 'OfficialSite',
+    'LatestQuarter', 'DividendDate', 'ExDividendDate',
+    'fiscalDateEnding', 'reportedDate', 'reportTime',
+    'ex_dividend_date', 'declaration_date', 'record_date', 'payment_date',
+}
+
+# Marker fields used to tell the statement types apart when ingesting loose JSON files
+STATEMENT_MARKERS = {
+    'balance_sheet': 'totalAssets',
+    'income_statement': 'totalRevenue',
+    'cash_flow': 'operatingCashflow',
+}
+
+def connect(db_path=None):
+    db_path = Path(db_path or WAREHOUSE_DB)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=60)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+# ==================================================================================================================== #
+# Schema helpers
+# ==================================================================================================================== #
+
+def _to_value(column, value):
+    # Alpha Vantage sends every number as a string and uses 'None' / '-' for missing values. Text fields are kept as
+    # sent - a CIK like '0000051143' must not lose its leading zeros to float()
+    if value is None or value in ('None', '-', ''):
+        return None
+    if column in TEXT_COLUMNS:
+        return value
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _column_type(column):
+    return 'TEXT' if column in TEXT_COLUMNS else 'NUMERIC'
+
+
+def _ensure_table(conn, table, rows):
+    # Create the table / add any columns not seen before. The schema read and the DDL run under SQLite's write lock
+    # (BEGIN IMMEDIATE unless the caller's transaction already holds it), so concurrent writers on separate
+    # connections serialize inside SQLite instead of racing to add the same column.
+    keys = TABLE_KEYS[table]
+    if not conn.in_transaction:
+        conn.execute('BEGIN IMMEDIATE')
+    existing = {r[1] for r in conn.execute(f'PRAGMA table_info("{table}")')}
+    columns = list(dict.fromkeys(c for row in rows for c in row))
+
+    if not existing:
+        column_defs = ', '.join(f'"{c}" {"TEXT" if c in keys else _column_type(c)}' for c in columns)
+        key_def = ', '.join(f'"{k}"' for k in keys)
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({column_defs}, PRIMARY KEY ({key_def}))')
+        if len(keys) > 1:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_{keys[1]}" ON "{table}" ("{keys[1]}")')
+        return columns
+
+    for c in columns:
+        if c not in existing:
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{c}" {_column_type(c)}')
+    return columns
+
+
+def _upsert_rows(conn, table, rows):
+    if not rows:
+        return 0
+    columns = _ensure_table(conn, table, rows)
+    column_list = ', '.join(f'"{c}"' for c in columns)
+    placeholders = ', '.join('?' for _ in columns)
+    conn.executemany(
+        f'INSERT OR REPLACE INTO "{table}" ({column_list}) VALUES ({placeholders})',
+        [tuple(row.get(c) for c in columns) for row in rows]
+    )
+    return len(rows)
+
+
+def _rows(symbol, reports):
+    # One typed row per report, symbol first so it lands as the first column
+    return [{'symbol': symbol, **{k: _to_value(k, v) for k, v in report.items()}} for report in reports or []]
+
+
+# ==================================================================================================================== #
+# Ingest - accepts the same dicts the API returns
+# ==================================================================================================================== #
+
+def ingest_overview(conn, overview):
+    if not overview or 'Symbol' not in overview:
+        return 0
+    row = {'symbol': overview['Symbol'].upper()}
+    row.update({k: _to_value(k, v) for k, v in overview.items() if k != 'Symbol'})
+    return _upsert_rows(conn, 'overview', [row])
+
+
+def ingest_statement(conn, kind, symbol, statement):
+    # kind: 'income_statement' | 'balance_sheet' | 'cash_flow'
+    if not statement:
+        return 0
+    symbol = (statement.get('symbol') or symbol).upper()
+    count = _upsert_rows(conn, f'{kind}_annual', _rows(symbol, statement.get('annualReports')))
+    count += _upsert_rows(conn, f'{kind}_quarterly', _rows(symbol, statement.get('quarterlyReports')))
+    return count
+
+
+def ingest_earnings(conn, symbol, earnings):
+    if not earnings:
+        return 0
+    symbol = (earnings.get('symbol') or symbol).upper()
+    count = _upsert_rows(conn, 'earnings_annual', _rows(symbol, earnings.get('annualEarnings')))
+    count += _upsert_rows(conn, 'earnings_quarterly', _rows(symbol, earnings.get('quarterlyEarnings')))
+    return count
+
+
+def ingest_dividends(conn, symbol, dividends):
+    if not dividends:
+        return 0
+    symbol = (dividends.get('symbol') or symbol).upper()
+    return _upsert_rows(conn, 'dividends', _rows(symbol, dividends.get('data')))
+
+
+def ingest_raw_data(ticker, raw_data, conn=None):
+    # Ingest one pipeline bundle (the all_data dict from stock-analysis_pipeline/data_fetcher.fetch_all_data)
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        if not conn.in_transaction:
+            # Take the write lock before the first schema read - a worker never holds it while waiting on another
+            conn.execute('BEGIN IMMEDIATE')
+        count = ingest_overview(conn, raw_data.get('overview'))
+        count += ingest_statement(conn, 'income_statement', ticker, raw_data.get('income_statement'))
+        count += ingest_statement(conn, 'balance_sheet', ticker, raw_data.get('balance_sheet'))
+        count += ingest_statement(conn, 'cash_flow', ticker, raw_data.get('cash_flows'))
+        count += ingest_earnings(conn, ticker, raw_data.get('earnings_history'))
+        count += ingest_dividends(conn, ticker, raw_data.get('dividends'))
+        if own_conn:
+            conn.commit()
+        return count
+    finally:
+        if own_conn:
+            conn.close()
+
+
+def ingest_json_file(conn, path):
+    # Detect the payload type from its shape so pipeline bundles and the per-statement folders share one path
+    path = Path(path)
+    with open(path, 'r') as f:
+        payload = json.load(f)
+    if not isinstance(payload, dict):
+        return 0
+
+    ticker = path.name.split('_', 1)[0].upper()
+    if 'overview' in payload and 'balance_sheet' in payload:
+        return ingest_raw_data(ticker, payload, conn=conn)
+    if 'AssetType' in payload and 'Symbol' in payload:
+        return ingest_overview(conn, payload)
+    if 'annualEarnings' in payload or 'quarterlyEarnings' in payload:
+        return ingest_earnings(conn, ticker, payload)
+    if 'annualReports' in payload or 'quarterlyReports' in payload:
+        sample = (payload.get('annualReports') or payload.get('quarterlyReports') or [{}])[0]
+        for kind, marker in STATEMENT_MARKERS.items():
+            if marker in sample:
+                return ingest_statement(conn, kind, ticker, payload)
+    if isinstance(payload.get('data'), list) and payload['data'] and 'ex_dividend_date' in payload['data'][0]:
+        return ingest_dividends(conn, ticker, payload)
+    return 0
+
+
+def default_json_paths():
+    # Every fundamentals JSON the repo's fetchers write today
+    paths = list(REPO_ROOT.glob('data/*_raw_data.json'))
+    paths += REPO_ROOT.glob('stock-analysis_pipeline/data/*_raw_data.json')
+    paths += REPO_ROOT.glob('alpha_vantage_data/Fundamental_Data/**/*_JSON/*.json')
+    paths += REPO_ROOT.glob('alpha_vantage_data/**/p_sql_two/*_JSON/*.json')
+    return sorted(p for p in set(paths) if '.ipynb_checkpoints' not in p.parts)
+
+
+def bulk_ingest(paths=None, batch_size=500):
+    # Ingest many files in large transactions (one commit per batch_size files, not per row)
+    paths = default_json_paths() if paths is None else [Path(p) for p in paths]
+    conn = connect()
+    summary = {'files': 0, 'rows': 0, 'skipped': []}
+    try:
+        for i, path in enumerate(paths, start=1):
+            try:
+                rows = ingest_json_file(conn, path)
+            except (OSError, ValueError) as e:
+                summary['skipped'].append(f'{path}: {e}')
+                continue
+            if rows:
+                summary['files'] += 1
+                summary['rows'] += rows
+            else:
+                summary['skipped'].append(str(path))
+            if i % batch_size == 0:
+                conn.commit()
+        conn.commit()
+    finally:
+        conn.close()
+    return summary
+
+
+# ==================================================================================================================== #
+# Query
+# ==================================================================================================================== #
+
+SCREEN_OPERATORS = {'>', '>=', '<', '<=', '=', '!='}
+
+
+def create_index(table, column):
+    # Index a field you screen on often (e.g. balance_sheet_annual.totalAssets)
+    conn = connect()
+    try:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_{column}" ON "{table}" ("{column}")')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def query(sql, params=()):
+    conn = connect()
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def screen(table, column, op, value, latest_only=True, columns=None):
+    # e.g. screen('balance_sheet_annual', 'totalAssets', '>', 1e9) -> latest annual report per symbol that passes
+    if table not in TABLE_KEYS:
+        raise ValueError(f"Unknown table '{table}' - choose from {sorted(TABLE_KEYS)}")
+    if op not in SCREEN_OPERATORS:
+        raise ValueError(f"Unsupported operator '{op}' - choose from {sorted(SCREEN_OPERATORS)}")
+
+    conn = connect()
+    try:
+        known = {r[1] for r in conn.execute(f'PRAGMA table_info("{table}")')}
+        wanted = list(columns) if columns else None
+        for c in [column] + (wanted or []):
+            if c not in known:
+                raise ValueError(f"Unknown column '{c}' in {table}")
+        select = ', '.join(f't."{c}"' for c in TABLE_KEYS[table] + [c for c in (wanted or []) if c not in TABLE_KEYS[table]]) \
+            if wanted else 't.*'
+
+        sql = f'SELECT {select} FROM "{table}" t'
+        if latest_only and 'fiscalDateEnding' in TABLE_KEYS[table]:
+            # MAX per symbol is answered from the (symbol, fiscalDateEnding) primary-key index
+            sql += (f' JOIN (SELECT symbol, MAX(fiscalDateEnding) AS latest FROM "{table}" GROUP BY symbol) l'
+                    f' ON t.symbol = l.symbol AND t.fiscalDateEnding = l.latest')
+        sql += f' WHERE t."{column}" {op} ? ORDER BY t."{column}" DESC'
+        return pd.read_sql_query(sql, conn, params=(value,))
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    # Bulk-ingest every fundamentals JSON in the repo (or the files passed on the command line)
+    summary = bulk_ingest(sys.argv[1:] or None)
+    print(f"√ Ingested {summary['rows']} rows from {summary['files']} files into {WAREHOUSE_DB}")
+    if summary['skipped']:
+        print(f"Skipped {len(summary['skipped'])} files with no recognised fundamentals payload")
@@ -0,0 +1,546 @@
+# ==================================================================================================================== #
+# Local Analytics: ANALYTICS_FIXED_WINDOW and ANALYTICS_SLIDING_WINDOW computed locally from prices already in the
+# Time Series Store. Accepts the same CALCULATIONS grammar as the API (MEAN, VARIANCE(annualized=True),
+# CORRELATION(method=SPEARMAN), ...) and returns a payload shaped like the API's JSON, but for any number of symbols:
+# every metric is a vectorized op on one time x symbol returns matrix, fixed-window covariance / correlation matrices
+# are a single matrix product, and sliding windows are updated with running sums instead of recomputing each window.
+# ==================================================================================================================== #
+
+import re
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+
+CALCULATIONS = (
+    'MIN', 'MAX', 'MEAN', 'MEDIAN', 'CUMULATIVE_RETURN', 'VARIANCE', 'STDDEV',
+    'MAX_DRAWDOWN', 'HISTOGRAM', 'AUTOCORRELATION', 'COVARIANCE', 'CORRELATION',
+)
+CORRELATION_METHODS = ('PEARSON', 'SPEARMAN', 'KENDALL')
+
+# Bars per year used by annualized=True
+PERIODS_PER_YEAR = {
+    'DAILY': 252, 'WEEKLY': 52, 'MONTHLY': 12,
+    '1MIN': 252 * 390, '5MIN': 252 * 78, '15MIN': 252 * 26, '30MIN': 252 * 13, '60MIN': 252 * 6.5,
+}
+
+
+# ==================================================================================================================== #
+# CALCULATIONS grammar
+# ==================================================================================================================== #
+
+def parse_calculations(calculations):
+    # 'MEAN, VARIANCE(annualized=True), CORRELATION(method=SPEARMAN)' ->
+    # [('MEAN', 'MEAN', {}), ('VARIANCE(ANNUALIZED=TRUE)', 'VARIANCE', {'annualized': True}), ...]
+    if isinstance(calculations, str):
+        calculations = re.split(r',(?![^(]*\))', calculations)
+
+    parsed = []
+    for spec in calculations:
+        spec = spec.strip()
+        if not spec:
+            continue
+        match = re.fullmatch(r'([A-Za-z_]+)\s*(?:\((.*)\))?', spec)
+        if not match or match.group(1).upper() not in CALCULATIONS:
+            raise ValueError(f"Unknown calculation '{spec}' - choose from {', '.join(CALCULATIONS)}")
+
+        name = match.group(1).upper()
+        options = {}
+        for option in filter(None, (o.strip() for o in (match.group(2) or '').split(','))):
+            key, _, value = option.partition('=')
+            options[key.strip().lower()] = _option_value(value.strip())
+        parsed.append((re.sub(r'\s+', '', spec).upper(), name, options))
+    return parsed
+
+
+def _option_value(value):
+    if value.lower() in ('true', 'false'):
+        return value.lower() == 'true'
+    try:
+        return int(value)
+    except ValueError:
+        return value.upper()
+
+
+def periods_per_year(interval):
+    return PERIODS_PER_YEAR.get(str(interval).upper(), 252)
+
+
+# ==================================================================================================================== #
+# Vectorized metrics - each takes a (time, symbols) returns array with NaN for missing bars
+# ==================================================================================================================== #
+
+def _cumulative_return(prices):
+    first = prices.bfill().iloc[0]
+    last = prices.ffill().iloc[-1]
+    return (last / first - 1).to_numpy()
+
+
+def _max_drawdown(prices):
+    # Per symbol: worst peak-to-trough fall of the price path and the dates it spans
+    out = {}
+    filled = prices.ffill()
+    drawdown = filled / filled.cummax() - 1
+    for symbol in prices.columns:
+        series = drawdown[symbol].dropna()
+        if series.empty:
+            out[symbol] = None
+            continue
+        trough = series.idxmin()
+        peak = filled[symbol].loc[:trough].idxmax()
+        out[symbol] = {
+            'max_drawdown': float(series.min()),
+            'drawdown_range': {'start_drawdown': _date(peak), 'end_drawdown': _date(trough)}
+        }
+    return out
+
+
+def _histogram(returns, symbols, bins=10):
+    out = {}
+    for i, symbol in enumerate(symbols):
+        column = returns[:, i]
+        counts, edges = np.histogram(column[np.isfinite(column)], bins=int(bins))
+        out[symbol] = {'bin_count': counts.tolist(), 'bin_edges': edges.tolist()}
+    return out
+
+
+def _check_lag(lag, length):
+    # A lag of 0 would slice returns[:-0] (empty) and one >= length leaves no pairs to correlate
+    lag = int(lag)
+    if not 1 <= lag < length:
+        raise ValueError(f'AUTOCORRELATION lag must be between 1 and {length - 1}, got {lag}')
+    return lag
+
+
+def _autocorrelation(returns, lag=1):
+    # Pearson correlation of each column with itself shifted by lag, over pairs where both values exist
+    lag = _check_lag(lag, len(returns))
+    head, tail = returns[:-lag], returns[lag:]
+    both = np.isfinite(head) & np.isfinite(tail)
+    head, tail = np.where(both, head, 0.0), np.where(both, tail, 0.0)
+    count = both.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        head_c = np.where(both, head - head.sum(axis=0) / count, 0.0)
+        tail_c = np.where(both, tail - tail.sum(axis=0) / count, 0.0)
+        return (head_c * tail_c).sum(axis=0) / np.sqrt((head_c ** 2).sum(axis=0) * (tail_c ** 2).sum(axis=0))
+
+
+def covariance_matrix(returns):
+    # Population covariance of every symbol pair: one X'X matrix product (BLAS) on the demeaned matrix.
+    # Missing bars are zeroed after demeaning and each pair is divided by its own count of overlapping bars.
+    valid = np.isfinite(returns)
+    means = np.nanmean(returns, axis=0)
+    centered = np.where(valid, returns - means, 0.0)
+    overlap = valid.T.astype('float64') @ valid.astype('float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (centered.T @ centered) / overlap
+
+
+def correlation_matrix(returns, method='PEARSON'):
+    method = method.upper()
+    if method == 'SPEARMAN':
+        # Spearman = Pearson on ranks
+        returns = pd.DataFrame(returns).rank().to_numpy()
+    elif method == 'KENDALL':
+        try:
+            return pd.DataFrame(returns).corr(method='kendall').to_numpy()
+        except ImportError:
+            raise ValueError('CORRELATION(method=KENDALL) needs scipy installed - use PEARSON or SPEARMAN')
+    elif method != 'PEARSON':
+        raise ValueError(f"Unsupported correlation method '{method}' - choose from {', '.join(CORRELATION_METHODS)}")
+
+    cov = covariance_matrix(returns)
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = cov / np.outer(std, std)
+    np.fill_diagonal(corr, 1.0)
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _date(timestamp):
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.strftime('%Y-%m-%d') if timestamp == timestamp.normalize() else timestamp.isoformat()
+
+
+def _clean(values):
+    # NaN is not valid JSON - missing results come back as null like the API
+    if isinstance(values, dict):
+        return {k: _clean(v) for k, v in values.items()}
+    if isinstance(values, (list, tuple)):
+        return [_clean(v) for v in values]
+    if isinstance(values, (float, np.floating)):
+        return None if not np.isfinite(values) else float(values)
+    if isinstance(values, np.integer):
+        return int(values)
+    return values
+
+
+# ==================================================================================================================== #
+# Fixed window
+# ==================================================================================================================== #
+
+def fixed_window(prices, calculations, interval='DAILY', ohlc='close'):
+    # prices: time x symbol DataFrame (e.g. timeseries_store.read_wide). Returns the API-shaped dict.
+    prices = prices.sort_index()
+    symbols = [str(s) for s in prices.columns]
+    returns_df = prices.pct_change(fill_method=None).iloc[1:]
+    returns = returns_df.to_numpy(dtype='float64')
+    scale = periods_per_year(interval)
+
+    def per_symbol(values):
+        return dict(zip(symbols, np.asarray(values, dtype='float64').tolist()))
+
+    results = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for key, name, options in parse_calculations(calculations):
+            annualized = options.get('annualized', False)
+            if name == 'MIN':
+                results[key] = per_symbol(np.nanmin(returns, axis=0))
+            elif name == 'MAX':
+                results[key] = per_symbol(np.nanmax(returns, axis=0))
+            elif name == 'MEAN':
+                results[key] = per_symbol(np.nanmean(returns, axis=0))
+            elif name == 'MEDIAN':
+                results[key] = per_symbol(np.nanmedian(returns, axis=0))
+            elif name == 'CUMULATIVE_RETURN':
+                results[key] = per_symbol(_cumulative_return(prices))
+            elif name == 'VARIANCE':
+                variance = np.nanvar(returns, axis=0)
+                results[key] = per_symbol(variance * scale if annualized else variance)
+            elif name == 'STDDEV':
+                std = np.nanstd(returns, axis=0)
+                results[key] = per_symbol(std * np.sqrt(scale) if annualized else std)
+            elif name == 'MAX_DRAWDOWN':
+                results[key] = _max_drawdown(prices)
+            elif name == 'HISTOGRAM':
+                results[key] = _histogram(returns, symbols, options.get('bins', 10))
+            elif name == 'AUTOCORRELATION':
+                results[key] = per_symbol(_autocorrelation(returns, options.get('lag', 1)))
+            elif name == 'COVARIANCE':
+                cov = covariance_matrix(returns)
+                results[key] = {'index': symbols, 'covariance': (cov * scale if annualized else cov).tolist()}
+            elif name == 'CORRELATION':
+                corr = correlation_matrix(returns, options.get('method', 'PEARSON'))
+                results[key] = {'index': symbols, 'correlation': corr.tolist()}
+
+    return {
+        'meta_data': {
+            'symbols': ','.join(symbols),
+            'min_dt': _date(prices.index.min()) if len(prices) else None,
+            'max_dt': _date(prices.index.max()) if len(prices) else None,
+            'ohlc': ohlc.capitalize(),
+            'interval': str(interval).upper(),
+        },
+        'payload': {'RETURNS_CALCULATIONS': _clean(results)},
+    }
+
+
+# ==================================================================================================================== #
+# Sliding window - O(n) running-sum updates: each new bar adds its terms and the bar leaving the window subtracts them
+# Returns are de-meaned by their full-sample mean first, so the running sums of squares stay small and cancel cleanly.
+# ==================================================================================================================== #
+
+MIN_WINDOW_SIZE = 10
+SLIDING_CALCULATIONS = tuple(c for c in CALCULATIONS if c != 'HISTOGRAM')
+
+
+def _check_window(window_size):
+    window_size = int(window_size)
+    if window_size < MIN_WINDOW_SIZE:
+        raise ValueError(f'WINDOW_SIZE must be at least {MIN_WINDOW_SIZE} (same hard lower bound as the API)')
+    return window_size
+
+
+def _running(values, window_size):
+    # Sum over each trailing window via cumulative-sum differences (NaN -> 0); rows before the first full window are NaN
+    zeros = np.zeros((1, values.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(np.nan_to_num(values), axis=0)])
+    out = np.full(values.shape, np.nan)
+    if window_size <= len(values):
+        out[window_size - 1:] = sums[window_size:] - sums[:-window_size]
+    return out
+
+
+def rolling_moments(returns, window_size):
+    # Rolling mean and population variance per column; windows with a missing bar come back NaN
+    window_size = _check_window(window_size)
+    valid = np.isfinite(returns)
+    center = np.nanmean(returns, axis=0)
+    shifted = np.where(valid, returns - center, np.nan)
+    count = _running(valid.astype('float64'), window_size)
+    full = count == window_size
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = _running(shifted, window_size) / window_size
+        variance = np.maximum(_running(shifted ** 2, window_size) / window_size - mean ** 2, 0.0)
+    return np.where(full, mean + center, np.nan), np.where(full, variance, np.nan)
+
+
+def rolling_autocorrelation(returns, window_size, lag=1):
+    # Correlation of r[t] with r[t - lag] over the lag pairs inside each window
+    window_size = _check_window(window_size)
+    lag = _check_lag(lag, window_size)
+    a = returns
+    b = np.full(returns.shape, np.nan)
+    b[lag:] = returns[:-lag]
+    both = np.isfinite(a) & np.isfinite(b)
+    a = np.where(both, a - np.nanmean(returns, axis=0), 0.0)
+    b = np.where(both, b - np.nanmean(returns, axis=0), 0.0)
+
+    pairs = window_size - lag
+    n = _running(both.astype('float64'), pairs)
+    sa, sb = _running(a, pairs), _running(b, pairs)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = _running(a * b, pairs) / n - (sa / n) * (sb / n)
+        var_a = _running(a * a, pairs) / n - (sa / n) ** 2
+        var_b = _running(b * b, pairs) / n - (sb / n) ** 2
+        result = cov / np.sqrt(var_a * var_b)
+    return np.where(n == pairs, result, np.nan)
+
+
+def _window_view(values, window_size):
+    # (windows, window_size, symbols) read-only view - no copy
+    return np.lib.stride_tricks.sliding_window_view(values, window_size, axis=0).transpose(0, 2, 1)
+
+
+def _pad(result, window_size, length):
+    out = np.full((length,) + result.shape[1:], np.nan)
+    out[window_size - 1:] = result
+    return out
+
+
+def iter_rolling_covariance(returns, window_size, correlation=False, method='PEARSON'):
+    # Yields (row, matrix) for every full window: the symbol x symbol covariance (or correlation) matrix. The window's
+    # cross-products are kept as symbols x symbols running sums and each bar is one rank-two matrix product (add the
+    # new row, drop the oldest) over the whole symbol matrix - O(symbols^2) per step instead of O(window * symbols^2).
+    # The sums are rebuilt from a full product once per window so rounding cannot drift. Missing bars are tracked
+    # pairwise with masked overlap counts, so a late-listed symbol does not blank the rest of the matrix.
+    window_size = _check_window(window_size)
+    if correlation and method.upper() != 'PEARSON':
+        raise ValueError(f"Sliding-window CORRELATION supports PEARSON only - {method.upper()} re-ranks every window")
+
+    valid = np.isfinite(returns)
+    x = np.where(valid, returns - np.nanmean(returns, axis=0), 0.0)
+    m = valid.astype('float64')
+    complete = bool(valid.all())
+    n_symbols = returns.shape[1]
+    diagonal = np.arange(n_symbols)
+
+    # Running sums of a[r] b[r]^T over the window. Complete data only needs x'x (the means are a rank-one correction);
+    # with gaps x'm and m'm give every pair the mean and count of the bars both symbols have, (x^2)'m the variances
+    if complete:
+        factors = [(x, x)]
+        means = _running(x, window_size) / window_size
+    else:
+        factors = [(x, x), (x, m), (m, m)] + ([(x * x, m)] if correlation else [])
+    sums = [np.empty((n_symbols, n_symbols)) for _ in factors]
+    update, work = np.empty((n_symbols, n_symbols)), np.empty((n_symbols, n_symbols))
+    signs = np.array([1.0, -1.0])
+
+    for t in range(window_size - 1, len(returns)):
+        start = t - window_size + 1
+        for (a, b), total in zip(factors, sums):
+            if start % window_size == 0:
+                np.matmul(a[start:t + 1].T, b[start:t + 1], out=total)
+            else:
+                rows = [t, start - 1]
+                np.matmul(a[rows].T * signs, b[rows], out=update)
+                total += update
+
+        # Scratch buffers keep the per-bar work to a few passes over the matrix; only the yielded matrix is allocated
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if complete:
+                np.multiply.outer(means[t], means[t], out=work)
+                cov = sums[0] / window_size
+                cov -= work
+                if correlation:
+                    std = np.sqrt(np.diag(cov))
+                    cov /= np.multiply.outer(std, std, out=work)
+            else:
+                # Full-window pairs have n == window_size, so the pair moments all scale by 1 / window_size. Like
+                # rolling_moments, a pair is only reported once both symbols have a full window of bars
+                sxy, sx, n = sums[:3]
+                np.multiply(sx, sx.T, out=work)
+                work /= window_size
+                cov = sxy - work
+                if correlation:
+                    np.multiply(sx, sx, out=work)
+                    work /= -window_size
+                    work += sums[3]
+                    np.multiply(work, work.T, out=update)
+                    cov /= np.sqrt(update, out=update)
+                else:
+                    cov /= window_size
+                cov[n < window_size - 0.5] = np.nan
+
+        if correlation:
+            cov[diagonal, diagonal] = np.where(np.isfinite(cov[diagonal, diagonal]), 1.0, np.nan)
+            np.clip(cov, -1.0, 1.0, out=cov)
+        yield t, cov
+
+
+def sliding_window(prices, calculations, window_size, interval='DAILY', ohlc='close'):
+    # prices: time x symbol DataFrame. Returns the API-shaped dict - every metric keyed RUNNING_<NAME>, one value per
+    # window end date. For hundreds of symbols use iter_rolling_covariance directly instead of a JSON payload.
+    window_size = _check_window(window_size)
+    prices = prices.sort_index()
+    symbols = [str(s) for s in prices.columns]
+    returns_df = prices.pct_change(fill_method=None).iloc[1:]
+    returns = returns_df.to_numpy(dtype='float64')
+    if len(returns) < window_size:
+        raise ValueError(f'Need at least {window_size + 1} bars for WINDOW_SIZE={window_size}, got {len(prices)}')
+    dates = [_date(t) for t in returns_df.index]
+    scale = periods_per_year(interval)
+    mean = variance = None
+
+    def per_symbol(values):
+        frame = pd.DataFrame(values, index=dates, columns=symbols).iloc[window_size - 1:]
+        return {symbol: frame[symbol].to_dict() for symbol in symbols}
+
+    results = {}
+    for key, name, options in parse_calculations(calculations):
+        if name not in SLIDING_CALCULATIONS:
+            raise ValueError(f"{name} is not available as a sliding-window calculation")
+        annualized = options.get('annualized', False)
+        running = f'RUNNING_{name}'
+
+        if name in ('MEAN', 'VARIANCE', 'STDDEV') and mean is None:
+            mean, variance = rolling_moments(returns, window_size)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if name == 'MEAN':
+                results[key] = {running: per_symbol(mean)}
+            elif name == 'VARIANCE':
+                results[key] = {running: per_symbol(variance * scale if annualized else variance)}
+            elif name == 'STDDEV':
+                std = np.sqrt(variance)
+                results[key] = {running: per_symbol(std * np.sqrt(scale) if annualized else std)}
+            elif name == 'MIN':
+                results[key] = {running: per_symbol(_pad(_window_view(returns, window_size).min(axis=1),
+                                                         window_size, len(returns)))}
+            elif name == 'MAX':
+                results[key] = {running: per_symbol(_pad(_window_view(returns, window_size).max(axis=1),
+                                                         window_size, len(returns)))}
+            elif name == 'MEDIAN':
+                results[key] = {running: per_symbol(_pad(np.median(_window_view(returns, window_size), axis=1),
+                                                         window_size, len(returns)))}
+            elif name == 'CUMULATIVE_RETURN':
+                # Compounded return over the window = price ratio across it
+                price_values = prices.to_numpy(dtype='float64')
+                cumulative = price_values[window_size:] / price_values[:-window_size] - 1
+                results[key] = {running: per_symbol(_pad(cumulative, window_size, len(returns)))}
+            elif name == 'MAX_DRAWDOWN':
+                # window_size returns span window_size + 1 prices
+                windows = _window_view(prices.to_numpy(dtype='float64'), window_size + 1)
+                drawdown = (windows / np.maximum.accumulate(windows, axis=1) - 1).min(axis=1)
+                results[key] = {running: per_symbol(_pad(drawdown, window_size, len(returns)))}
+            elif name == 'AUTOCORRELATION':
+                results[key] = {running: per_symbol(rolling_autocorrelation(returns, window_size,
+                                                                            options.get('lag', 1)))}
+            elif name in ('COVARIANCE', 'CORRELATION'):
+                is_corr = name == 'CORRELATION'
+                label = 'correlation' if is_corr else 'covariance'
+                series = {}
+                for t, matrix in iter_rolling_covariance(returns, window_size, correlation=is_corr,
+                                                         method=options.get('method', 'PEARSON')):
+                    if annualized and not is_corr:
+                        matrix = matrix * scale
+                    series[dates[t]] = {'index': symbols, label: matrix.tolist()}
+                results[key] = {running: series}
+
+    return {
+        'meta_data': {
+            'symbols': ','.join(symbols),
+            'window_size': window_size,
+            'min_dt': _date(prices.index.min()) if len(prices) else None,
+            'max_dt': _date(prices.index.max()) if len(prices) else None,
+            'ohlc': ohlc.capitalize(),
+            'interval': str(interval).upper(),
+        },
+        'payload': {'RETURNS_CALCULATIONS': _clean(results)},
+    }
+
+
+def resolve_range(time_range, latest):
+    # The API's RANGE values: 'full', '{N}day|week|month|year|hour|minute', 'YYYY-MM', 'YYYY-MM-DD', or a
+    # (start, end) pair of dates. Returns (start, end) timestamps, None meaning open-ended.
+    if time_range is None or (isinstance(time_range, str) and time_range.strip().lower() in ('', 'full')):
+        return None, None
+    if isinstance(time_range, (list, tuple)):
+        start = pd.Timestamp(time_range[0])
+        end = pd.Timestamp(time_range[1]) if len(time_range) > 1 and time_range[1] else None
+        return start, end
+
+    text = time_range.strip().lower()
+    match = re.fullmatch(r'(\d+)\s*(minute|hour|day|week|month|year)s?', text)
+    if match:
+        count, unit = int(match.group(1)), match.group(2)
+        offsets = {
+            'minute': pd.Timedelta(minutes=count), 'hour': pd.Timedelta(hours=count),
+            'day': pd.Timedelta(days=count), 'week': pd.Timedelta(weeks=count),
+            'month': pd.DateOffset(months=count), 'year': pd.DateOffset(years=count),
+        }
+        return pd.Timestamp(latest) - offsets[unit], None
+    if re.fullmatch(r'\d{4}-\d{2}', text):
+        start = pd.Timestamp(f'{text}-01')
+        return start, start + pd.offsets.MonthEnd(0) + pd.Timedelta(days=1) - pd.Timedelta(1)
+    if re.fullmatch(r'\d{4}-\d{2}-\d{2}', text):
+        start = pd.Timestamp(text)
+        return start, start + pd.Timedelta(days=1) - pd.Timedelta(1)
+    raise ValueError(f"Unsupported RANGE '{time_range}'")
+
+
+def load_prices(symbols, interval='DAILY', time_range='full', ohlc='close'):
+    # Time x symbol price matrix for the requested RANGE, read from the local store
+    if isinstance(symbols, str):
+        symbols = [s.strip().upper() for s in symbols.split(',') if s.strip()]
+    store_interval = str(interval).lower()
+    latest = [timeseries_store.last_timestamp(s, store_interval) for s in symbols]
+    latest = [t for t in latest if t is not None]
+    if not latest:
+        raise ValueError(f'No {store_interval} bars stored for {", ".join(symbols)} - fetch the time series first')
+
+    start, end = resolve_range(time_range, max(latest))
+    return timeseries_store.read_wide(symbols, store_interval, column=ohlc.lower(), start=start, end=end)
+
+
+def analytics_fixed_window(symbols, calculations, interval='DAILY', time_range='full', ohlc='close'):
+    # Local drop-in for function=ANALYTICS_FIXED_WINDOW: same inputs, same payload shape, no symbol cap
+    prices = load_prices(symbols, interval, time_range, ohlc)
+    return fixed_window(prices, calculations, interval=interval, ohlc=ohlc)
+
+
+def analytics_sliding_window(symbols, calculations, window_size, interval='DAILY', time_range='full', ohlc='close'):
+    # Local drop-in for function=ANALYTICS_SLIDING_WINDOW
+    prices = load_prices(symbols, interval, time_range, ohlc)
+    return sliding_window(prices, calculations, window_size, interval=interval, ohlc=ohlc)
+
+
+def save_payload(data, folder, fn):
+    Path(folder).mkdir(parents=True, exist_ok=True)
+    filename = Path(folder) / f'{fn}_{datetime.now():%Y%m%d_%H%M%S}.json'
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+    return filename
+
+
+if __name__ == '__main__':
+    tickers = input('Enter Ticker(s) (separated by commas, no limit - computed locally): ')
+    time_range = input('Enter Range (full, 5year, 2024-01 ...): ') or 'full'
+    time_interval = input('Select Interval (DAILY, WEEKLY, MONTHLY, 1min ... 60min): ') or 'DAILY'
+    window_size = input(f'Enter Window_Size for a sliding window (>= {MIN_WINDOW_SIZE}, blank for a fixed window): ')
+    calculation_metrics = input(f'Select Calculation Metrics ({", ".join(CALCULATIONS)}): ')
+
+    if window_size.strip():
+        data = analytics_sliding_window(tickers, calculation_metrics, int(window_size), interval=time_interval,
+                                        time_range=time_range)
+        # Timestamped name - successive runs no longer overwrite one fixed ANALYTICS_SLIDING_WINDOW.json
+        filename = save_payload(data, 'Analytics_JSON/Sliding_Window', 'ANALYTICS_SLIDING_WINDOW')
+        print(f'Successfully Saved Local Advanced Analytics - Sliding Window to {filename}')
+    else:
+        data = analytics_fixed_window(tickers, calculation_metrics, interval=time_interval, time_range=time_range)
+        filename = save_payload(data, 'Analytics_JSON/Fixed_Window', 'ANALYTICS_FIXED_WINDOW')
+        print(f'Successfully Saved Local Advanced Analytics - Fixed Window to {filename}')
@@ -0,0 +1,237 @@
+# ==================================================================================================================== #
+# Price Adjustments: Split / dividend adjusted series derived locally from the raw bars in the time series store.
+# Corporate actions (DIVIDENDS / SPLITS endpoints, or the dividend_amount / split_coefficient columns of an adjusted
+# download) are kept per symbol as a short event table with a running cumulative factor. Adjusting a series is then one
+# searchsorted + multiply over the raw OHLCV, and a new action only recomputes the events from its date onward.
+#   Adjustment_Factors/IBM.parquet  ->  timestamp, split_coefficient, dividend_amount, factor, cumulative, split_cumulative,
+#                                       fallback (dividend left unadjusted because no prior close was stored yet)
+# ==================================================================================================================== #
+
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.av_client import av_get
+
+load_dotenv()
+
+# ALPHA_VANTAGE_ADJUSTMENTS - folder holding the per-symbol event tables (default alpha_vantage_data/Adjustment_Factors)
+FACTORS_ROOT = Path(os.getenv('ALPHA_VANTAGE_ADJUSTMENTS', Path(__file__).resolve().parent / 'Adjustment_Factors'))
+
+EVENT_COLUMNS = ['timestamp', 'split_coefficient', 'dividend_amount', 'factor', 'cumulative', 'split_cumulative',
+                 'fallback']
+ACTION_COLUMNS = ['timestamp', 'split_coefficient', 'dividend_amount']
+
+
+# ==================================================================================================================== #
+# Corporate actions
+# ==================================================================================================================== #
+
+def _empty_actions():
+    return pd.DataFrame({'timestamp': pd.Series(dtype='datetime64[ns]'),
+                         'split_coefficient': pd.Series(dtype='float64'),
+                         'dividend_amount': pd.Series(dtype='float64')})
+
+
+def _combine_actions(frames):
+    # One row per date: splits multiply, dividends add (a split and a dividend can share an ex date)
+    actions = pd.concat([f for f in frames if not f.empty] or [_empty_actions()], ignore_index=True)
+    if actions.empty:
+        return _empty_actions()
+    actions['split_coefficient'] = actions['split_coefficient'].fillna(1.0)
+    actions['dividend_amount'] = actions['dividend_amount'].fillna(0.0)
+    return (actions.groupby('timestamp', as_index=False)
+            .agg(split_coefficient=('split_coefficient', 'prod'), dividend_amount=('dividend_amount', 'sum')))
+
+
+def fetch_actions(symbol, api_key=None):
+    # DIVIDENDS + SPLITS for one symbol -> timestamp (ex / effective date), split_coefficient, dividend_amount
+    api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
+    frames = []
+
+    dividends = av_get(params={'function': 'DIVIDENDS', 'symbol': symbol, 'apikey': api_key}).json().get('data') or []
+    if dividends:
+        df = pd.DataFrame(dividends)
+        frames.append(pd.DataFrame({
+            'timestamp': pd.to_datetime(df['ex_dividend_date'], errors='coerce'),
+            'split_coefficient': 1.0,
+            'dividend_amount': pd.to_numeric(df['amount'], errors='coerce'),
+        }))
+
+    splits = av_get(params={'function': 'SPLITS', 'symbol': symbol, 'apikey': api_key}).json().get('data') or []
+    if splits:
+        df = pd.DataFrame(splits)
+        frames.append(pd.DataFrame({
+            'timestamp': pd.to_datetime(df['effective_date'], errors='coerce'),
+            'split_coefficient': pd.to_numeric(df['split_factor'], errors='coerce'),
+            'dividend_amount': 0.0,
+        }))
+
+    actions = _combine_actions([f.dropna(subset=['timestamp']) for f in frames])
+    return actions[(actions['split_coefficient'] != 1.0) | (actions['dividend_amount'] != 0.0)]
+
+
+def actions_from_store(symbol, interval='daily'):
+    # Actions already sitting in the store from a TIME_SERIES_*_ADJUSTED download (no extra API calls)
+    bars = timeseries_store.read(symbol, interval, columns=['split_coefficient', 'dividend_amount'])
+    if bars.empty:
+        return _empty_actions()
+    flagged = (bars['dividend_amount'].fillna(0.0) != 0.0) | (bars['split_coefficient'].fillna(1.0) != 1.0)
+    return _combine_actions([bars.loc[flagged, ACTION_COLUMNS]])
+
+
+# ==================================================================================================================== #
+# Event tables - cumulative factors, recomputed from the earliest changed event onward
+# ==================================================================================================================== #
+
+def factors_path(symbol):
+    return FACTORS_ROOT / f'{symbol.upper()}.parquet'
+
+
+def load_events(symbol):
+    path = factors_path(symbol)
+    if not path.exists():
+        dtypes = {'timestamp': 'datetime64[ns]', 'fallback': 'bool'}
+        return pd.DataFrame({c: pd.Series(dtype=dtypes.get(c, 'float64')) for c in EVENT_COLUMNS})
+    return pd.read_parquet(path, columns=EVENT_COLUMNS)
+
+
+def _save_events(symbol, events):
+    FACTORS_ROOT.mkdir(parents=True, exist_ok=True)
+    path = factors_path(symbol)
+    tmp = path.with_suffix('.parquet.tmp')
+    events[EVENT_COLUMNS].to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _previous_closes(symbol, dates):
+    # Raw close of the last daily bar strictly before each ex date (NaN when the store has no such bar)
+    closes = timeseries_store.read(symbol, 'daily', end=dates.max(), columns=['close']).dropna(subset=['close'])
+    if closes.empty:
+        return np.full(len(dates), np.nan)
+    times = closes['timestamp'].to_numpy()
+    position = np.searchsorted(times, dates.to_numpy(), side='left') - 1
+    values = closes['close'].to_numpy()[np.maximum(position, 0)]
+    return np.where(position >= 0, values, np.nan)
+
+
+def update_events(symbol, actions, replace=True):
+    # Rebuild the symbol's event table from the full set of actions - stored events missing from `actions` are dropped
+    # (replace=False merges `actions` into the stored ones instead), and dividends stored with the 1.0 fallback are
+    # recomputed once a prior close is available. Events before the earliest difference keep their stored cumulative
+    # factors; only the tail from that date onward is recomputed. Returns the number of events recomputed.
+    events = load_events(symbol)
+    if not replace:
+        actions = pd.concat([events[ACTION_COLUMNS], actions[ACTION_COLUMNS]], ignore_index=True)
+    actions = actions[ACTION_COLUMNS].drop_duplicates('timestamp', keep='last').sort_values('timestamp', ignore_index=True)
+
+    # Compare on the union of dates so added, removed and corrected actions all count as changes
+    value_columns = ['split_coefficient', 'dividend_amount']
+    dates = pd.DatetimeIndex(events['timestamp']).union(pd.DatetimeIndex(actions['timestamp']))
+    stored = events.set_index('timestamp')[value_columns].reindex(dates).to_numpy()
+    incoming = actions.set_index('timestamp')[value_columns].reindex(dates).to_numpy()
+    changed = ~(stored == incoming).all(axis=1)
+
+    fallback = events.loc[events['fallback'].astype(bool), 'timestamp']
+    if len(fallback):
+        resolved = fallback[np.isfinite(_previous_closes(symbol, fallback))]
+        changed |= dates.isin(resolved)
+
+    if not changed.any():
+        return 0
+
+    start = dates[np.flatnonzero(changed)[0]]
+    head = events[events['timestamp'] < start]
+    tail = actions[actions['timestamp'] >= start].copy()
+    if tail.empty:
+        # Only trailing events were removed - the rest of the table stands as stored
+        _save_events(symbol, head[EVENT_COLUMNS])
+        return 0
+
+    # Event factor applied to every bar before the event: 1/split, times (1 - dividend / split-adjusted prior close)
+    split = tail['split_coefficient'].fillna(1.0).to_numpy()
+    prev_close = _previous_closes(symbol, tail['timestamp']) / split
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dividend_factor = 1.0 - tail['dividend_amount'].fillna(0.0).to_numpy() / prev_close
+    usable = np.isfinite(dividend_factor) & (dividend_factor > 0)
+    tail['fallback'] = (tail['dividend_amount'].to_numpy() != 0) & ~usable
+    if tail['fallback'].any():
+        print(f'WARNING: No stored close before some {symbol} ex-dividend dates - those dividends are not adjusted '
+              f'until the bars are stored')
+    tail['factor'] = np.where(usable, dividend_factor, 1.0) / split
+
+    # Running products continue from the last untouched event
+    seed = float(head['cumulative'].iloc[-1]) if len(head) else 1.0
+    split_seed = float(head['split_cumulative'].iloc[-1]) if len(head) else 1.0
+    tail['cumulative'] = seed * np.cumprod(tail['factor'].to_numpy())
+    tail['split_cumulative'] = split_seed / np.cumprod(split)
+
+    events = pd.concat([head[EVENT_COLUMNS], tail[EVENT_COLUMNS]], ignore_index=True) if len(head) else tail[EVENT_COLUMNS]
+    _save_events(symbol, events)
+    return len(tail)
+
+
+def refresh_actions(symbol, fetch=True, api_key=None):
+    # Pull the latest actions and update the event table. With fetch=True the DIVIDENDS / SPLITS history is the full
+    # record (only store actions newer than its last entry are added, in case the endpoints lag) and replaces the
+    # table; fetch=False only merges the store's adjusted columns into what is already there.
+    stored = actions_from_store(symbol)
+    frames = [stored]
+    if fetch:
+        fetched = fetch_actions(symbol, api_key=api_key)
+        if not fetched.empty:
+            stored = stored[stored['timestamp'] > fetched['timestamp'].max()]
+        frames = [fetched, stored]
+    actions = pd.concat([f for f in frames if not f.empty] or [_empty_actions()], ignore_index=True) \
+        .drop_duplicates('timestamp', keep='last')
+    recomputed = update_events(symbol, actions, replace=fetch)
+    print(f'{symbol.upper()}: {len(actions)} corporate actions, {recomputed} event factors recomputed')
+    return recomputed
+
+
+# ==================================================================================================================== #
+# Adjusting bars
+# ==================================================================================================================== #
+
+def adjust(bars, events):
+    # Back-adjust raw OHLCV bars (timestamp, open, high, low, close, volume) so the latest bar is unchanged:
+    # price * cumulative(last) / cumulative(at bar), volume scaled by the split ratio only. One vectorized pass.
+    out = bars.copy()
+    if events.empty or out.empty:
+        out['adjusted_close'] = out['close']
+        return out
+
+    position = np.searchsorted(events['timestamp'].to_numpy(), out['timestamp'].to_numpy(), side='right') - 1
+    cumulative = np.r_[1.0, events['cumulative'].to_numpy()][position + 1]
+    split_cumulative = np.r_[1.0, events['split_cumulative'].to_numpy()][position + 1]
+    price_scale = events['cumulative'].iloc[-1] / cumulative
+    volume_scale = split_cumulative / events['split_cumulative'].iloc[-1]
+
+    for column in ('open', 'high', 'low', 'close'):
+        if column in out.columns:
+            out[column] = out[column].to_numpy() * price_scale
+    if 'volume' in out.columns:
+        out['volume'] = out['volume'].to_numpy() * volume_scale
+    out['adjusted_close'] = out['close']
+    return out
+
+
+def read_adjusted(symbols, interval='daily', start=None, end=None):
+    # Long-format adjusted OHLCV straight from the raw store (same shape as timeseries_store.read)
+    long = timeseries_store.read(symbols, interval, start=start, end=end,
+                                 columns=['open', 'high', 'low', 'close', 'volume'])
+    if long.empty:
+        return long
+    parts = [adjust(rows, load_events(symbol)) for symbol, rows in long.groupby('symbol', sort=False)]
+    return pd.concat(parts, ignore_index=True)
+
+
+if __name__ == '__main__':
+    symbol = input('Enter Ticker to adjust: ').upper()
+    refresh_actions(symbol)
+    df = read_adjusted(symbol)
+    print(df.tail(10).to_string(index=False))
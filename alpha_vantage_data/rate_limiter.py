@@ -0,0 +1,158 @@
+# ==================================================================================================================== #
+# Rate Limiter: Cross-process token bucket that keeps every fetch path under the Alpha Vantage quota.
+# Bucket state lives in a small SQLite file, so run_pipeline.py jobs, the Streamlit explorers and one-off endpoint
+# scripts running at the same time all draw from the same per-minute and per-day budget.
+# ==================================================================================================================== #
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==== Tunables (override in .env) ==== #
+# ALPHA_VANTAGE_CALLS_PER_MINUTE - plan limit per minute, 0 disables the limiter (default 150)
+# ALPHA_VANTAGE_CALLS_PER_DAY    - plan limit per calendar day, 0 means no daily max (default 0)
+# ALPHA_VANTAGE_BURST            - calls allowed back-to-back before pacing kicks in (default 10% of the minute budget)
+# ALPHA_VANTAGE_RATE_DB          - SQLite file holding the shared bucket (default ~/.alpha_vantage/rate_limiter.db)
+CALLS_PER_MINUTE = int(os.getenv('ALPHA_VANTAGE_CALLS_PER_MINUTE', 150))
+CALLS_PER_DAY = int(os.getenv('ALPHA_VANTAGE_CALLS_PER_DAY', 0))
+BURST = int(os.getenv('ALPHA_VANTAGE_BURST', max(1, CALLS_PER_MINUTE // 10)))
+RATE_DB = Path(os.getenv('ALPHA_VANTAGE_RATE_DB', Path.home() / '.alpha_vantage' / 'rate_limiter.db'))
+
+BUCKET = 'alpha_vantage'
+
+# The daily-cap notice ("...our standard API rate limit is 25 requests per day...") - the per-minute notice also
+# mentions a daily figure ("...5 calls per minute and 500 calls per day") and must not match
+DAILY_QUOTA_NOTICE = re.compile(r'rate limit is [\d,]+ (?:api )?(?:requests|calls) per day')
+
+# One connection per thread (sqlite3 connections can't be shared across threads), opened on first use and reused for
+# every acquire; the tables are created once per database file
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = set()
+
+
+class RateLimitError(RuntimeError):
+    # Raised when the API keeps answering with a rate-limit notice
+    pass
+
+
+class DailyQuotaExceeded(RateLimitError):
+    # Raised when the day's budget is spent (local CALLS_PER_DAY or the API's per-day notice) - nothing more can be
+    # fetched until tomorrow, unlike a per-minute throttle
+    pass
+
+
+def _connect():
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.path == RATE_DB:
+        return conn
+    if conn is not None:
+        conn.close()  # RATE_DB was repointed since this thread connected
+    RATE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(RATE_DB, timeout=30, isolation_level=None)
+    with _schema_lock:
+        if RATE_DB not in _schema_ready:
+            conn.execute('CREATE TABLE IF NOT EXISTS bucket (name TEXT PRIMARY KEY, tokens REAL, updated REAL)')
+            conn.execute('CREATE TABLE IF NOT EXISTS daily (name TEXT, day TEXT, calls INTEGER, PRIMARY KEY (name, day))')
+            _schema_ready.add(RATE_DB)
+    _local.conn, _local.path = conn, RATE_DB
+    return conn
+
+
+def _refill_rate():
+    # Refill at (limit - burst) per minute so that burst + refill never exceeds the plan limit inside any 60s window
+    return max(CALLS_PER_MINUTE - BURST, 1) / 60.0
+
+
+def _take_token(conn, now):
+    # Returns 0 when a token was taken, otherwise the number of seconds to wait before the next one is available
+    # NOTE: BEGIN IMMEDIATE takes the database write lock, so the read-refill-write below is atomic across processes
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        row = conn.execute('SELECT tokens, updated FROM bucket WHERE name = ?', (BUCKET,)).fetchone()
+        tokens, updated = row if row else (float(BURST), now)
+        tokens = min(float(BURST), tokens + max(now - updated, 0) * _refill_rate())
+
+        today = date.today().isoformat()
+        if CALLS_PER_DAY > 0:
+            day_row = conn.execute('SELECT calls FROM daily WHERE name = ? AND day = ?', (BUCKET, today)).fetchone()
+            if day_row and day_row[0] >= CALLS_PER_DAY:
+                raise DailyQuotaExceeded(f'Daily Alpha Vantage budget of {CALLS_PER_DAY} calls is spent for {today}')
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+            conn.execute(
+                'INSERT INTO daily (name, day, calls) VALUES (?, ?, 1) '
+                'ON CONFLICT(name, day) DO UPDATE SET calls = calls + 1',
+                (BUCKET, today)
+            )
+        else:
+            wait = (1 - tokens) / _refill_rate()
+
+        conn.execute('INSERT OR REPLACE INTO bucket (name, tokens, updated) VALUES (?, ?, ?)', (BUCKET, tokens, now))
+        conn.execute('COMMIT')
+        return wait
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def acquire():
+    # Block until one call may be made under the shared budget
+    if CALLS_PER_MINUTE <= 0:
+        return
+    conn = _connect()
+    while True:
+        wait = _take_token(conn, time.time())
+        if wait <= 0:
+            return
+        time.sleep(wait)
+
+
+def penalize():
+    # The server rejected a call we thought was in budget (another key user, clock skew) - empty the bucket so
+    # every process backs off together instead of each one burning more calls on rejected requests
+    if CALLS_PER_MINUTE <= 0:
+        return
+    _connect().execute('INSERT OR REPLACE INTO bucket (name, tokens, updated) VALUES (?, 0, ?)', (BUCKET, time.time()))
+
+
+def calls_today():
+    row = _connect().execute(
+        'SELECT calls FROM daily WHERE name = ? AND day = ?', (BUCKET, date.today().isoformat())
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _notice(response):
+    # Lower-cased "Note" / "Information" message of a small JSON body ('' for anything else)
+    body = response.content
+    if len(body) > 2048 or not body.lstrip().startswith(b'{'):
+        return ''
+    try:
+        payload = response.json()
+    except ValueError:
+        return ''
+    if not isinstance(payload, dict):
+        return ''
+    return str(payload.get('Note') or payload.get('Information') or '').lower()
+
+
+def is_rate_limit_response(response):
+    # Alpha Vantage answers an over-quota call with HTTP 200 and a tiny JSON body such as
+    # {"Note": "...API call frequency..."} or {"Information": "...rate limit..."} - even for datatype=csv requests
+    message = _notice(response)
+    return any(phrase in message for phrase in ('rate limit', 'call frequency', 'requests per', 'calls per'))
+
+
+def is_daily_quota_response(response):
+    # The free-tier daily cap - retrying today only burns more attempts
+    return DAILY_QUOTA_NOTICE.search(_notice(response)) is not None
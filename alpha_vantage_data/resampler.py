@@ -0,0 +1,153 @@
+# ==================================================================================================================== #
+# Resampler: Weekly and monthly OHLCV bars derived locally from the daily bars in the Time Series Store, instead of
+# separate TIME_SERIES_WEEKLY(_ADJUSTED) / TIME_SERIES_MONTHLY(_ADJUSTED) calls. Bars follow the API's conventions -
+# calendar weeks (Mon-Sun) and calendar months, stamped with the last trading day in the period, volume summed,
+# adjusted close taken from price_adjustments, dividends summed. Every symbol is aggregated in one reduceat pass, and
+# refreshes only re-aggregate from the start of the last stored (possibly still open) period.
+# Resampled series are stored under their own interval keys (weekly_resampled / monthly_resampled) so they never mix
+# with bars the TIME_SERIES_WEEKLY / MONTHLY scripts store, and each keeps a signature of the corporate-action events it
+# was adjusted with - when the events change, the series is rebuilt on the next refresh.
+# ==================================================================================================================== #
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.price_adjustments import adjust, load_events
+
+RESAMPLE_INTERVALS = ('weekly', 'monthly')
+# Store interval each resampled series is written under
+STORE_INTERVALS = {'weekly': 'weekly_resampled', 'monthly': 'monthly_resampled'}
+
+
+def period_keys(timestamps, interval):
+    # Integer period id per bar: calendar week (weeks start Monday) or calendar month
+    days = pd.DatetimeIndex(timestamps).values.astype('datetime64[D]').astype('int64')
+    if interval == 'weekly':
+        return (days + 3) // 7  # 1970-01-01 was a Thursday - shift so every week starts on a Monday
+    if interval == 'monthly':
+        return pd.DatetimeIndex(timestamps).values.astype('datetime64[M]').astype('int64')
+    raise ValueError(f"interval must be one of {', '.join(RESAMPLE_INTERVALS)}")
+
+
+def period_start(timestamp, interval):
+    # First calendar day of the period containing `timestamp`
+    day = pd.Timestamp(timestamp).normalize()
+    return day - pd.Timedelta(days=day.weekday()) if interval == 'weekly' else day.replace(day=1)
+
+
+def resample(daily, interval='weekly'):
+    # daily: long-format bars (symbol, timestamp, open, high, low, close, volume [, adjusted_close, dividend_amount,
+    # split_coefficient]) -> one bar per (symbol, period), same columns
+    if daily.empty:
+        return daily
+    daily = daily.sort_values(['symbol', 'timestamp'], ignore_index=True)
+    symbols = daily['symbol'].to_numpy()
+    keys = period_keys(daily['timestamp'], interval)
+
+    # A new bar starts wherever the symbol or the period changes
+    boundary = np.r_[True, (symbols[1:] != symbols[:-1]) | (keys[1:] != keys[:-1])]
+    starts = np.flatnonzero(boundary)
+    ends = np.r_[starts[1:], len(daily)] - 1
+
+    def column(name):
+        return daily[name].to_numpy(dtype='float64') if name in daily.columns else np.full(len(daily), np.nan)
+
+    out = pd.DataFrame({
+        'symbol': symbols[starts],
+        'timestamp': daily['timestamp'].to_numpy()[ends],
+        'open': column('open')[starts],
+        'high': np.fmax.reduceat(column('high'), starts),
+        'low': np.fmin.reduceat(column('low'), starts),
+        'close': column('close')[ends],
+        'adjusted_close': column('adjusted_close')[ends],
+        'volume': np.add.reduceat(np.nan_to_num(column('volume')), starts),
+        'dividend_amount': np.add.reduceat(np.nan_to_num(column('dividend_amount')), starts),
+        'split_coefficient': np.multiply.reduceat(np.nan_to_num(column('split_coefficient'), nan=1.0), starts),
+    })
+    return out
+
+
+def _adjusted_daily(symbol, start=None, events=None):
+    # Raw daily bars plus adjusted_close from the symbol's corporate-action events (falls back to any adjusted_close
+    # already stored by an adjusted download when no events are on file, and to the raw close when neither exists -
+    # the same as price_adjustments.adjust with no events)
+    daily = timeseries_store.read(symbol, 'daily', start=start)
+    if daily.empty:
+        return daily
+    events = load_events(symbol) if events is None else events
+    if not events.empty:
+        daily['adjusted_close'] = adjust(daily[['timestamp', 'close']], events)['adjusted_close'].to_numpy()
+    else:
+        daily['adjusted_close'] = daily['adjusted_close'].fillna(daily['close'])
+    return daily
+
+
+def _events_signature(events):
+    digest = hashlib.sha1()
+    digest.update(events['timestamp'].to_numpy().astype('datetime64[ns]').astype('int64').tobytes())
+    for column in ('cumulative', 'split_cumulative'):
+        digest.update(np.ascontiguousarray(events[column].to_numpy(dtype='float64')).tobytes())
+    return digest.hexdigest()
+
+
+def _signature_path(symbol, interval):
+    return timeseries_store.partition_dir(symbol, STORE_INTERVALS[interval]) / 'events.sha1'
+
+
+def refresh_symbol(symbol, interval='weekly', full=False):
+    # Bring the stored weekly/monthly series up to date with the daily store. Incremental runs drop and rebuild only
+    # from the start of the last stored period (its bar may be stamped mid-week / mid-month). A changed event table
+    # moves the adjusted close of every bar before the changed event, so it rebuilds the whole series (one reduceat
+    # pass), as does full=True.
+    if interval not in STORE_INTERVALS:
+        raise ValueError(f"interval must be one of {', '.join(RESAMPLE_INTERVALS)}")
+    symbol = symbol.upper()
+    store_interval = STORE_INTERVALS[interval]
+    events = load_events(symbol)
+    signature = _events_signature(events)
+    signature_path = _signature_path(symbol, interval)
+    if not full and (not signature_path.exists() or signature_path.read_text() != signature):
+        full = True
+
+    last = None if full else timeseries_store.last_timestamp(symbol, store_interval)
+    start = period_start(last, interval) if last is not None else None
+
+    daily = _adjusted_daily(symbol, start=start, events=events)
+    if daily.empty:
+        return 0
+    bars = resample(daily, interval)
+    timeseries_store.truncate(symbol, store_interval, start if start is not None else bars['timestamp'].min())
+    timeseries_store.upsert(symbol, store_interval, bars.drop(columns='symbol'))
+    signature_path.write_text(signature)
+    return len(bars)
+
+
+def refresh(symbols=None, intervals=RESAMPLE_INTERVALS, full=False):
+    # Every stored daily symbol (or the given ones) for every interval: {(symbol, interval): bars written}
+    # Read the results back with timeseries_store.read(symbol, STORE_INTERVALS[interval])
+    symbols = symbols or timeseries_store.stored_symbols('daily')
+    written = {}
+    for symbol in symbols:
+        for interval in intervals:
+            written[(symbol.upper(), interval)] = refresh_symbol(symbol, interval, full=full)
+    return written
+
+
+def resample_frame(symbol, interval='weekly', start=None, end=None):
+    # One symbol on the fly (nothing written), API-style columns, newest first
+    daily = _adjusted_daily(symbol, start=start)
+    if end is not None and not daily.empty:
+        daily = daily[daily['timestamp'] <= pd.Timestamp(end)]
+    bars = resample(daily, interval)
+    return bars.drop(columns='symbol').iloc[::-1].reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    tickers = input('Enter Tickers separated by commas (blank = every stored daily symbol): ')
+    symbols = [t.strip().upper() for t in tickers.split(',') if t.strip()] or None
+    written = refresh(symbols)
+    for (symbol, interval), count in written.items():
+        print(f'{symbol} {interval}: {count} bars rebuilt from daily data')
@@ -0,0 +1,208 @@
+# ==================================================================================================================== #
+# Response Cache: Persistent on-disk cache of raw Alpha Vantage response bodies, shared by every fetch path.
+# Entries are keyed by `function` + the normalized request params (apikey excluded, so rotating keys keeps hits),
+# expire on a per-function TTL, and the least recently used entries are evicted once the cache passes its size cap.
+# ==================================================================================================================== #
+
+import os
+import time
+import json
+import hashlib
+import sqlite3
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qsl
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# ==== Tunables (override in .env) ==== #
+# ALPHA_VANTAGE_CACHE        - set to 0 to bypass the cache everywhere (default 1)
+# ALPHA_VANTAGE_CACHE_DB     - SQLite file holding cached bodies (default ~/.alpha_vantage/response_cache.db)
+# ALPHA_VANTAGE_CACHE_MAX_MB - size cap before LRU eviction kicks in (default 1024)
+CACHE_ENABLED = os.getenv('ALPHA_VANTAGE_CACHE', '1') not in ('0', 'false', 'False', 'no')
+CACHE_DB = Path(os.getenv('ALPHA_VANTAGE_CACHE_DB', Path.home() / '.alpha_vantage' / 'response_cache.db'))
+CACHE_MAX_BYTES = int(float(os.getenv('ALPHA_VANTAGE_CACHE_MAX_MB', 1024)) * 1024 * 1024)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+QUARTER = 91 * DAY
+
+# ==== TTL Policy (seconds) - how long a response for each API function stays fresh ==== #
+FUNCTION_TTLS = {
+    # Fundamentals - only change when a new filing lands
+    'INCOME_STATEMENT': QUARTER,
+    'BALANCE_SHEET': QUARTER,
+    'CASH_FLOW': QUARTER,
+    'OVERVIEW': DAY,
+    'EARNINGS': DAY,
+    'EARNINGS_ESTIMATES': DAY,
+    'EARNINGS_CALENDAR': DAY,
+    'IPO_CALENDAR': DAY,
+    'DIVIDENDS': DAY,
+    'SPLITS': DAY,
+    'ETF_PROFILE': DAY,
+    'INSIDER_TRANSACTIONS': DAY,
+    'LISTING_STATUS': DAY,
+    'SYMBOL_SEARCH': DAY,
+
+    # Economic indicators & commodities - monthly/quarterly releases
+    'REAL_GDP': DAY,
+    'REAL_GDP_PER_CAPITA': DAY,
+    'CPI': DAY,
+    'FEDERAL_FUNDS_RATE': DAY,
+    'TREASURY_YIELD': DAY,
+    'WTI': DAY,
+    'BRENT': DAY,
+
+    # End-of-day series
+    'TIME_SERIES_DAILY': 6 * HOUR,
+    'TIME_SERIES_DAILY_ADJUSTED': 6 * HOUR,
+    'TIME_SERIES_WEEKLY': 6 * HOUR,
+    'TIME_SERIES_WEEKLY_ADJUSTED': 6 * HOUR,
+    'TIME_SERIES_MONTHLY': 6 * HOUR,
+    'TIME_SERIES_MONTHLY_ADJUSTED': 6 * HOUR,
+    'DIGITAL_CURRENCY_DAILY': 6 * HOUR,
+    'DIGITAL_CURRENCY_WEEKLY': 6 * HOUR,
+    'DIGITAL_CURRENCY_MONTHLY': 6 * HOUR,
+    'HISTORICAL_OPTIONS': 6 * HOUR,
+
+    # Intraday & realtime - seconds to a minute
+    'TIME_SERIES_INTRADAY': MINUTE,
+    'CRYPTO_INTRADAY': MINUTE,
+    'FX_INTRADAY': MINUTE,
+    'NEWS_SENTIMENT': 5 * MINUTE,
+    'TOP_GAINERS_LOSERS': MINUTE,
+    'GLOBAL_QUOTE': 15,
+    'REALTIME_BULK_QUOTES': 15,
+    'REALTIME_OPTIONS': 15,
+    'CURRENCY_EXCHANGE_RATE': 15,
+}
+DEFAULT_TTL = HOUR
+INTRADAY_INTERVALS = {'1min', '5min', '15min', '30min', '60min'}
+
+
+def request_params(url, params=None):
+    # Merge query-string params from a fully built URL with an explicit params dict, dropping the apikey
+    merged = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+    if params:
+        merged.update({k: str(v) for k, v in params.items()})
+    return {k: v for k, v in merged.items() if k.lower() != 'apikey'}
+
+
+def cache_key(url, params=None):
+    normalized = request_params(url, params)
+    function = next((v for k, v in normalized.items() if k.lower() == 'function'), '').upper()
+    digest = hashlib.sha256(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+    return function, f'{function}:{digest}'
+
+
+def ttl_for(function, params):
+    lowered = {k.lower(): v for k, v in params.items()}
+
+    # A finished month of intraday bars or a past options date never changes again
+    month = lowered.get('month')
+    if month and month < date.today().strftime('%Y-%m'):
+        return 365 * DAY
+    if function == 'HISTORICAL_OPTIONS' and lowered.get('date') and lowered['date'] < date.today().isoformat():
+        return 365 * DAY
+
+    if function in FUNCTION_TTLS:
+        return FUNCTION_TTLS[function]
+
+    # Technical indicators and anything else keyed on an interval follow the bar size
+    if lowered.get('interval') in INTRADAY_INTERVALS:
+        return MINUTE
+    return DEFAULT_TTL
+
+
+def _connect():
+    CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB, timeout=30, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS responses ('
+        'key TEXT PRIMARY KEY, function TEXT, body BLOB, size INTEGER, expires REAL, accessed REAL)'
+    )
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed)')
+    return conn
+
+
+def get(key):
+    # Returns the cached body (bytes) if present and fresh, otherwise None
+    now = time.time()
+    conn = _connect()
+    try:
+        row = conn.execute('SELECT body, expires FROM responses WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] < now:
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            return None
+        conn.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+        return bytes(row[0])
+    finally:
+        conn.close()
+
+
+def put(key, function, body, ttl):
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute(
+            'INSERT OR REPLACE INTO responses (key, function, body, size, expires, accessed) VALUES (?, ?, ?, ?, ?, ?)',
+            (key, function, sqlite3.Binary(body), len(body), now + ttl, now)
+        )
+        _evict(conn)
+    finally:
+        conn.close()
+
+
+def _evict(conn):
+    # Drop expired entries, then least recently used ones until the cache is back under 90% of its cap
+    conn.execute('DELETE FROM responses WHERE expires < ?', (time.time(),))
+    total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+    if total <= CACHE_MAX_BYTES:
+        return
+
+    target = int(CACHE_MAX_BYTES * 0.9)
+    doomed = []
+    for key, size in conn.execute('SELECT key, size FROM responses ORDER BY accessed ASC'):
+        if total <= target:
+            break
+        doomed.append((key,))
+        total -= size
+    conn.executemany('DELETE FROM responses WHERE key = ?', doomed)
+
+
+def is_cacheable(response):
+    # Only successful data bodies are cached - never API error messages or empty payloads
+    if response.status_code != 200 or not response.content:
+        return False
+    head = response.content[:256].lstrip()
+    if head.startswith(b'{') and (b'"Error Message"' in head or b'"Information"' in head or b'"Note"' in head):
+        return False
+    return True
+
+
+def clear(function=None):
+    conn = _connect()
+    try:
+        if function:
+            conn.execute('DELETE FROM responses WHERE function = ?', (function.upper(),))
+        else:
+            conn.execute('DELETE FROM responses')
+    finally:
+        conn.close()
+
+
+def stats():
+    conn = _connect()
+    try:
+        rows = conn.execute(
+            'SELECT function, COUNT(*), COALESCE(SUM(size), 0) FROM responses GROUP BY function ORDER BY function'
+        ).fetchall()
+        return {function: {'entries': count, 'bytes': size} for function, count, size in rows}
+    finally:
+        conn.close()
@@ -0,0 +1,207 @@
+# ==================================================================================================================== #
+# Time Series Store: Local columnar (Parquet) store for OHLCV bars, hive-partitioned by symbol, interval and year.
+#   Time_Series_Store/symbol=IBM/interval=daily/year=2024/data.parquet
+# Typed columns, upserts that merge new bars into existing partitions (no more overwrite-per-run CSVs), and reads
+# that only open the partitions a date range touches, then push the timestamp filter down to Parquet row groups.
+# ==================================================================================================================== #
+
+import os
+import threading
+from pathlib import Path
+from dotenv import load_dotenv
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+load_dotenv()
+
+# ALPHA_VANTAGE_STORE - root folder of the store (default alpha_vantage_data/Time_Series_Store)
+STORE_ROOT = Path(os.getenv('ALPHA_VANTAGE_STORE', Path(__file__).resolve().parent / 'Time_Series_Store'))
+
+# Canonical typed schema - volume is float64 so fractional crypto volumes fit the same column
+OHLCV_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('ns')),
+    ('open', pa.float64()),
+    ('high', pa.float64()),
+    ('low', pa.float64()),
+    ('close', pa.float64()),
+    ('adjusted_close', pa.float64()),
+    ('volume', pa.float64()),
+    ('dividend_amount', pa.float64()),
+    ('split_coefficient', pa.float64()),
+])
+OHLCV_COLUMNS = OHLCV_SCHEMA.names
+PRICE_COLUMNS = [c for c in OHLCV_COLUMNS if c != 'timestamp']
+
+# Both the raw Alpha Vantage CSV headers and the renamed headers the endpoint scripts write map onto the schema
+COLUMN_ALIASES = {
+    'timestamp': 'timestamp', 'time': 'timestamp', 'date': 'timestamp',
+    'open': 'open', 'high': 'high', 'low': 'low', 'close': 'close',
+    'adjusted_close': 'adjusted_close', 'adjusted close': 'adjusted_close', 'adj close': 'adjusted_close',
+    'volume': 'volume',
+    'dividend_amount': 'dividend_amount', 'dividend amount': 'dividend_amount',
+    'split_coefficient': 'split_coefficient', 'split coefficient': 'split_coefficient',
+}
+
+_write_lock = threading.Lock()
+
+
+def normalize_ohlcv(df):
+    # Rename to canonical column names, coerce types, sort by time and drop duplicate timestamps (last one wins)
+    renamed = df.rename(columns=lambda c: COLUMN_ALIASES.get(str(c).strip().lower(), c))
+    if 'timestamp' not in renamed.columns:
+        raise ValueError(f'OHLCV frame needs a timestamp/date column, got {list(df.columns)}')
+
+    out = pd.DataFrame({'timestamp': pd.to_datetime(renamed['timestamp'])})
+    for column in PRICE_COLUMNS:
+        if column in renamed.columns:
+            out[column] = pd.to_numeric(renamed[column], errors='coerce').astype('float64')
+        else:
+            out[column] = float('nan')
+
+    out = out.dropna(subset=['timestamp'])
+    out = out.drop_duplicates(subset='timestamp', keep='last').sort_values('timestamp', ignore_index=True)
+    return out
+
+
+def partition_dir(symbol, interval, year=None):
+    path = STORE_ROOT / f'symbol={symbol.upper()}' / f'interval={interval}'
+    return path if year is None else path / f'year={int(year)}'
+
+
+def _partition_years(symbol, interval):
+    base = partition_dir(symbol, interval)
+    if not base.exists():
+        return []
+    return sorted(int(p.name.split('=', 1)[1]) for p in base.glob('year=*') if (p / 'data.parquet').exists())
+
+
+def _read_partition(path):
+    return pq.read_table(path, schema=OHLCV_SCHEMA).to_pandas()
+
+
+def _write_partition(path, df):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(df[OHLCV_COLUMNS], schema=OHLCV_SCHEMA, preserve_index=False)
+    tmp_path = path.with_suffix('.parquet.tmp')
+    pq.write_table(table, tmp_path, compression='zstd', row_group_size=64_000)
+    os.replace(tmp_path, path)
+
+
+def upsert(symbol, interval, df):
+    # Merge bars into the store. Existing timestamps are updated column-by-column (a raw series upserted after an
+    # adjusted one keeps the adjusted_close already stored), new timestamps are inserted.
+    # Returns the number of previously unseen bars.
+    new = normalize_ohlcv(df)
+    if new.empty:
+        return 0
+
+    inserted = 0
+    with _write_lock:
+        for year, chunk in new.groupby(new['timestamp'].dt.year):
+            path = partition_dir(symbol, interval, year) / 'data.parquet'
+            if path.exists():
+                old = _read_partition(path)
+                inserted += int((~chunk['timestamp'].isin(old['timestamp'])).sum())
+                merged = (
+                    chunk.set_index('timestamp')
+                    .combine_first(old.set_index('timestamp'))
+                    .reset_index()
+                    .sort_values('timestamp', ignore_index=True)
+                )
+            else:
+                inserted += len(chunk)
+                merged = chunk
+            _write_partition(path, merged)
+    return inserted
+
+
+def truncate(symbol, interval, start):
+    # Drop every bar at or after `start` - for series whose last bar gets re-stamped (e.g. a week still in progress)
+    # Returns the number of bars removed.
+    start = pd.Timestamp(start)
+    removed = 0
+    with _write_lock:
+        for year in _partition_years(symbol, interval):
+            if year < start.year:
+                continue
+            path = partition_dir(symbol, interval, year) / 'data.parquet'
+            old = _read_partition(path)
+            kept = old[old['timestamp'] < start]
+            removed += len(old) - len(kept)
+            if kept.empty:
+                path.unlink()
+            elif len(kept) < len(old):
+                _write_partition(path, kept)
+    return removed
+
+
+def read(symbols, interval, start=None, end=None, columns=None):
+    # Long-format read: one row per (symbol, timestamp). Only partitions for the requested symbols and the years the
+    # date range covers are opened; the timestamp filter is pushed down to Parquet row-group statistics.
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    files = []
+    for symbol in symbols:
+        for year in _partition_years(symbol, interval):
+            if (start is not None and year < start.year) or (end is not None and year > end.year):
+                continue
+            files.append(str(partition_dir(symbol, interval, year) / 'data.parquet'))
+
+    columns = list(columns) if columns else OHLCV_COLUMNS
+    if 'timestamp' not in columns:
+        columns = ['timestamp'] + columns
+    if not files:
+        return pd.DataFrame(columns=['symbol'] + columns)
+
+    partition_schema = pa.schema([('symbol', pa.string()), ('interval', pa.string()), ('year', pa.int32())])
+    partitioning = ds.partitioning(partition_schema, flavor='hive')
+    dataset_schema = pa.unify_schemas([OHLCV_SCHEMA, partition_schema])
+    dataset = ds.dataset(files, schema=dataset_schema, format='parquet',
+                         partitioning=partitioning, partition_base_dir=str(STORE_ROOT))
+
+    predicate = None
+    if start is not None:
+        predicate = ds.field('timestamp') >= pa.scalar(start.to_pydatetime(), type=pa.timestamp('ns'))
+    if end is not None:
+        upper = ds.field('timestamp') <= pa.scalar(end.to_pydatetime(), type=pa.timestamp('ns'))
+        predicate = upper if predicate is None else predicate & upper
+
+    table = dataset.to_table(columns=['symbol'] + columns, filter=predicate)
+    return table.to_pandas().sort_values(['symbol', 'timestamp'], ignore_index=True)
+
+
+def read_wide(symbols, interval, column='close', start=None, end=None):
+    # Time x symbol matrix of one column - the shape the local analytics / indicator engines consume
+    long = read(symbols, interval, start=start, end=end, columns=[column])
+    if long.empty:
+        return pd.DataFrame()
+    wide = long.pivot(index='timestamp', columns='symbol', values=column)
+    return wide.reindex(columns=[s.upper() for s in ([symbols] if isinstance(symbols, str) else symbols)])
+
+
+def last_timestamp(symbol, interval):
+    # Newest stored bar for a series (None when nothing is stored) - used by incremental refresh jobs
+    years = _partition_years(symbol, interval)
+    if not years:
+        return None
+    path = partition_dir(symbol, interval, years[-1]) / 'data.parquet'
+    timestamps = pq.read_table(path, columns=['timestamp']).column('timestamp')
+    return pd.Timestamp(pc.max(timestamps).as_py()) if len(timestamps) else None
+
+
+def stored_symbols(interval=None):
+    # Symbols that have data stored (optionally only those with the given interval)
+    if not STORE_ROOT.exists():
+        return []
+    found = []
+    for path in sorted(STORE_ROOT.glob('symbol=*')):
+        if interval is None or (path / f'interval={interval}').exists():
+            found.append(path.name.split('=', 1)[1])
+    return found
@@ -153,16 +153,8 @@ def extract_corporate_actions(dividends):
         'dividends': dividend_list 
     } 
 
-def extract_all_data(ticker):  
-    data_file = Path('data') / f'{ticker}_raw_data.json' 
-
-    if not data_file.exists(): 
-        raise FileNotFoundError(f'Data file not found: {data_file}') 
-    
-    with open(data_file, 'r') as f: 
-        raw_data = json.load(f) 
-
-    extracted = { 
+def extract_data(raw_data): 
+    return { 
         'company_info': extract_company_info(raw_data['overview']), 
         'financial_metrics': extract_financial_metrics(raw_data['overview']), 
         'valuation_metrics': extract_valuation_metrics(raw_data['overview']), 
@@ -176,11 +168,26 @@ def extract_all_data(ticker):
         'corporate_actions': extract_corporate_actions(raw_data['dividends']) 
     } 
 
-    output_file = Path('data')/f'{ticker}_extracted_data.json' 
-    with open(output_file, 'w') as f: 
-        json.dump(extracted, f, indent=2) 
+def extract_all_data(ticker, verbose=True, raw_data=None, save=True):  
+    # NOTE: Pass raw_data (the dict returned by fetch_all_data) to skip re-reading {ticker}_raw_data.json from disk 
+    if raw_data is None: 
+        data_file = Path('data') / f'{ticker}_raw_data.json' 
+
+        if not data_file.exists(): 
+            raise FileNotFoundError(f'Data file not found: {data_file}') 
+        
+        with open(data_file, 'r') as f: 
+            raw_data = json.load(f) 
+
+    extracted = extract_data(raw_data) 
+
+    if save: 
+        output_file = Path('data')/f'{ticker}_extracted_data.json' 
+        with open(output_file, 'w') as f: 
+            json.dump(extracted, f, indent=2) 
 
-    print(f'\n√ Extracted data saved to {output_file}') 
+        if verbose: 
+            print(f'\n√ Extracted data saved to {output_file}') 
     return extracted 
 
 if __name__ == '__main__': 
@@ -5,12 +5,14 @@
 
 import os 
 import json 
-import requests 
 from pathlib import Path 
+import repo_path  # repo root on sys.path for the shared alpha_vantage_data package
+from alpha_vantage_data.av_client import av_get
 from dotenv import load_dotenv
 from urllib.parse import urlencode  
 import csv 
 from io import StringIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Load API 
 load_dotenv() 
@@ -19,43 +21,43 @@ load_dotenv()
 def fetch_company_overview(ticker, api_key): 
     base_url = 'https://www.alphavantage.co/query' 
     params = {'function': 'OVERVIEW', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
 def fetch_income_statement(ticker, api_key): 
     base_url = 'https://www.alphavantage.co/query' 
     params = {'function': 'INCOME_STATEMENT', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json()  
 
 def fetch_balance_sheet(ticker, api_key): 
     base_url = "https://www.alphavantage.co/query" 
     params = {'function': 'BALANCE_SHEET', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
 def fetch_cash_flow(ticker, api_key): 
     base_url = "https://www.alphavantage.co/query" 
     params = {'function': 'CASH_FLOW', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
 def fetch_earnings_history(ticker, api_key): 
     base_url = "https://www.alphavantage.co/query" 
     params = {'function': 'EARNINGS', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
 def fetch_earnings_estimates(ticker, api_key): 
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'EARNINGS_ESTIMATES', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
 def fetch_earnings_calendar(ticker, api_key): 
     base_url = 'https://www.alphavantage.co/query' 
     params = {'function': 'EARNINGS_CALENDAR', 'symbol': ticker, 'horizon': '12month', 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
 
     # EARNINGS_CALENDAR returns CSV by default, not JSON
     # Parse CSV and convert to list of dictionaries 
@@ -66,17 +68,32 @@ def fetch_earnings_calendar(ticker, api_key):
 def fetch_dividends(ticker, api_key): 
     base_url = 'https://www.alphavantage.co/query' 
     params = {'function': 'DIVIDENDS', 'symbol': ticker, 'apikey': api_key} 
-    response = requests.get(f'{base_url}?{urlencode(params)}') 
+    response = av_get(f'{base_url}?{urlencode(params)}') 
     return response.json() 
 
-def fetch_all_data(ticker): 
+# Endpoint Registry: (all_data key, progress label, fetch function) - order matches the saved JSON layout 
+FETCH_STEPS = [ 
+    ('overview', 'Company Overview', fetch_company_overview), 
+    ('income_statement', 'Income Statement', fetch_income_statement), 
+    ('balance_sheet', 'Balance Sheet', fetch_balance_sheet), 
+    ('cash_flows', 'Statement of Cash Flows', fetch_cash_flow), 
+    ('earnings_history', 'Earnings History', fetch_earnings_history), 
+    ('earnings_estimates', 'Earnings Estimates', fetch_earnings_estimates), 
+    ('earnings_calendar', 'Earnings Calendar (Upcoming 12 Months)', fetch_earnings_calendar), 
+    ('dividends', 'Dividend Information (if applicable)', fetch_dividends), 
+] 
+
+def fetch_all_data(ticker, concurrent=True, max_workers=None, verbose=True, save=True): 
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY") 
     if not api_key: 
         raise ValueError("ERROR: Unable to Locate API Key. Please Make Sure All API Keys are stored in a .env file in the root directory") 
     
-    print(f"\n{'='*50}") 
-    print(f'Fetching data for {ticker}...') 
-    print(f"\n{'='*50}")  
+    # NOTE: verbose=False silences progress output (batch runs fetch many tickers at once) 
+    log = print if verbose else (lambda *args, **kwargs: None) 
+
+    log(f"\n{'='*50}") 
+    log(f'Fetching data for {ticker}...') 
+    log(f"\n{'='*50}")  
 
     data_dir = Path('data') 
     data_dir.mkdir(exist_ok=True) 
@@ -85,36 +102,39 @@ def fetch_all_data(ticker):
     # NOTE: Main storage structure that collects all API responses before saving them to a single .JSON file 
     all_data = {} 
 
-    print(f'[1/8] Fetching Company Overview...') 
-    all_data['overview'] = fetch_company_overview(ticker, api_key) 
-
-    print(f'[2/8] Fetching Income Statement...') 
-    all_data['income_statement'] = fetch_income_statement(ticker, api_key) 
-
-    print(f'[3/8] Fetching Balance Sheet...') 
-    all_data['balance_sheet'] = fetch_balance_sheet(ticker, api_key) 
-
-    print(f'[4/8] Fetching Statement of Cash Flows...') 
-    all_data['cash_flows'] = fetch_cash_flow(ticker, api_key) 
-
-    print(f'[5/8] Fetching Earnings History...') 
-    all_data['earnings_history'] = fetch_earnings_history(ticker, api_key) 
-
-    print(f'[6/8] Fetching Earnings Estimates...') 
-    all_data['earnings_estimates'] = fetch_earnings_estimates(ticker, api_key) 
-
-    print(f'[7/8] Fetching Earnings Calendar (Upcoming 12 Months)...') 
-    all_data['earnings_calendar'] = fetch_earnings_calendar(ticker, api_key) 
-
-    print(f'[8/8] Fetching Dividend Information (if applicable)...') 
-    all_data['dividends'] = fetch_dividends(ticker, api_key) 
+    if concurrent: 
+        # Fan out all endpoint calls at once - wall-clock is bound by the slowest call instead of the sum of all calls 
+        # NOTE: max_workers caps the number of requests in flight (defaults to ALPHA_VANTAGE_MAX_WORKERS or 8) 
+        if max_workers is None: 
+            max_workers = int(os.getenv('ALPHA_VANTAGE_MAX_WORKERS', len(FETCH_STEPS))) 
+        max_workers = max(1, min(max_workers, len(FETCH_STEPS))) 
+
+        log(f'Fetching {len(FETCH_STEPS)} endpoints concurrently (max {max_workers} in flight)...') 
+        with ThreadPoolExecutor(max_workers=max_workers) as executor: 
+            futures = { 
+                executor.submit(fetch_fn, ticker, api_key): (key, label) 
+                for key, label, fetch_fn in FETCH_STEPS 
+            } 
+            for done, future in enumerate(as_completed(futures), start=1): 
+                key, label = futures[future] 
+                all_data[key] = future.result() 
+                log(f'[{done}/{len(FETCH_STEPS)}] Fetched {label}') 
+
+        # Keep the same key order as the sequential mode so the saved JSON is unchanged 
+        all_data = {key: all_data[key] for key, _, _ in FETCH_STEPS} 
+    else: 
+        for step, (key, label, fetch_fn) in enumerate(FETCH_STEPS, start=1): 
+            log(f'[{step}/{len(FETCH_STEPS)}] Fetching {label}...') 
+            all_data[key] = fetch_fn(ticker, api_key) 
 
     # Save all_data as one JSON file 
-    filename = data_dir / f'{ticker}_raw_data.json' 
-    with open(filename, 'w') as f: 
-        json.dump(all_data, f, indent=2) 
+    # NOTE: save=False skips the write - the fused pipeline hands all_data straight to the extractor 
+    if save: 
+        filename = data_dir / f'{ticker}_raw_data.json' 
+        with open(filename, 'w') as f: 
+            json.dump(all_data, f, indent=2) 
 
-    print(f'\n√ All data saved to {filename}') 
+        log(f'\n√ All data saved to {filename}') 
     return all_data 
 
 
@@ -164,16 +164,8 @@ def format_corporate_actions(data):
         'Dividends': dividends
     }
 
-def format_all_data(ticker):
-    input_file = Path('data') / f'{ticker}_extracted_data.json'
-    
-    if not input_file.exists():
-        raise FileNotFoundError(f"Extracted data file not found: {input_file}")
-    
-    with open(input_file, 'r') as f:
-        extracted_data = json.load(f)
-    
-    formatted = {
+def format_data(extracted_data):
+    return {
         'company_info': format_company_info(extracted_data['company_info']),
         'financial_metrics': format_financial_metrics(extracted_data['financial_metrics']),
         'valuation_metrics': format_valuation_metrics(extracted_data['valuation_metrics']),
@@ -185,12 +177,27 @@ def format_all_data(ticker):
         'earnings': format_earnings(extracted_data['earnings']),
         'corporate_actions': format_corporate_actions(extracted_data['corporate_actions'])
     }
+
+def format_all_data(ticker, verbose=True, extracted_data=None, save=True):
+    # NOTE: Pass extracted_data (the dict returned by extract_all_data) to skip re-reading {ticker}_extracted_data.json
+    if extracted_data is None:
+        input_file = Path('data') / f'{ticker}_extracted_data.json'
+        
+        if not input_file.exists():
+            raise FileNotFoundError(f"Extracted data file not found: {input_file}")
+        
+        with open(input_file, 'r') as f:
+            extracted_data = json.load(f)
     
-    output_file = Path('data') / f'{ticker}_formatted_data.json'
-    with open(output_file, 'w') as f:
-        json.dump(formatted, f, indent=2)
+    formatted = format_data(extracted_data)
     
-    print(f"\n✓ Formatted data saved to {output_file}")
+    if save:
+        output_file = Path('data') / f'{ticker}_formatted_data.json'
+        with open(output_file, 'w') as f:
+            json.dump(formatted, f, indent=2)
+        
+        if verbose:
+            print(f"\n✓ Formatted data saved to {output_file}")
     return formatted
 
 if __name__ == '__main__':
@@ -1,7 +1,8 @@
 import os
 import json
-import requests
 from pathlib import Path
+import repo_path  # repo root on sys.path for the shared alpha_vantage_data package
+from alpha_vantage_data.av_client import av_get
 from dotenv import load_dotenv
 from urllib.parse import urlencode
 
@@ -10,43 +11,43 @@ load_dotenv()
 def fetch_company_overview(ticker, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'OVERVIEW', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_income_statement(ticker, api_key):
     base_url = 'https://alphavantage.co/query'
     params = {'function': 'INCOME_STATEMENT', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_balance_sheet(ticker, api_key):
     base_url = 'https://alphavantage.co/query'
     params = {'function': 'BALANCE_SHEET', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_cash_flow(ticker, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'CASH_FLOW', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_earnings(ticker, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'EARNINGS', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_dividends(ticker, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'DIVIDENDS', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_splits(ticker, api_key):
     base_url = 'https://www.alphavantage.co/query'
     params = {'function': 'SPLITS', 'symbol': ticker, 'apikey': api_key}
-    response = requests.get(f'{base_url}?{urlencode(params)}')
+    response = av_get(f'{base_url}?{urlencode(params)}')
     return response.json()
 
 def fetch_all_data(ticker):
@@ -0,0 +1,12 @@
+# ==================================================================================================================== #
+# Repo Path: Puts the repository root on sys.path once, so the pipeline scripts (run from this folder) can import the
+# shared alpha_vantage_data package. Import it before any alpha_vantage_data import.
+# ==================================================================================================================== #
+
+import sys
+from pathlib import Path
+
+ROOT = str(Path(__file__).resolve().parents[1])
+
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
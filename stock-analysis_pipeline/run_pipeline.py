@@ -3,14 +3,25 @@
 # fetches data, extracts metrics, formats values, and prepares data for dashboard display 
 # ==================================================================================================================== # 
 
+import os 
 import sys 
+import json 
+import time 
+import argparse 
+import threading 
 from pathlib import Path 
+from datetime import datetime 
+from concurrent.futures import ThreadPoolExecutor, as_completed 
 
 # Import all Modules 
 import data_fetcher as step1 
 import data_extractor as step2 
 import data_formatter as step3 
 
+import repo_path  # repo root on sys.path for the shared alpha_vantage_data package
+from alpha_vantage_data import av_client, rate_limiter, fundamentals_warehouse 
+from alpha_vantage_data.rate_limiter import DailyQuotaExceeded 
+
 
 def run_full_pipeline(ticker): 
     """ 
@@ -55,10 +66,231 @@ def run_full_pipeline(ticker):
         return False 
     
 
+# ==================================================================================================================== # 
+# Fused Mode: fetch -> extract -> format pass Python objects straight through - no JSON round trips between stages 
+# - Only the final {ticker}_formatted_data.json (read by the dashboard) is written on the critical path 
+# - Raw / extracted intermediates are an optional side output written by a background writer, compact (no indent) 
+# ==================================================================================================================== # 
+
+def save_json(path, obj, indent=None): 
+    # Write to a temp file then swap it in, so the dashboard never reads a half-written file 
+    path = Path(path) 
+    tmp_path = path.with_suffix(path.suffix + '.tmp') 
+    with open(tmp_path, 'w') as f: 
+        json.dump(obj, f, indent=indent) 
+    os.replace(tmp_path, path) 
+    return path 
+
+def save_intermediates(data_dir, ticker, raw_data, extracted): 
+    save_json(data_dir / f'{ticker}_raw_data.json', raw_data) 
+    save_json(data_dir / f'{ticker}_extracted_data.json', extracted) 
+
+def run_fused_pipeline(ticker, keep_intermediates=True, writer=None, verbose=True, warehouse=False): 
+    # Returns (formatted data, side-output future) - the future is None unless the intermediates went to `writer` 
+    data_dir = Path('data') 
+    data_dir.mkdir(exist_ok=True) 
+
+    raw_data = step1.fetch_all_data(ticker, verbose=verbose, save=False) 
+    extracted = step2.extract_all_data(ticker, raw_data=raw_data, save=False) 
+    formatted = step3.format_all_data(ticker, extracted_data=extracted, save=False) 
+
+    save_json(data_dir / f'{ticker}_formatted_data.json', formatted, indent=2) 
+
+    if warehouse: 
+        # Typed rows into the SQLite fundamentals warehouse - screens across tickers query it instead of the JSON files 
+        fundamentals_warehouse.ingest_raw_data(ticker, raw_data) 
+
+    # NOTE: Batch runs pass a shared background writer (ThreadPoolExecutor) and get its future back; without one the 
+    # side outputs are simply written inline 
+    written = None 
+    if keep_intermediates: 
+        if writer is None: 
+            save_intermediates(data_dir, ticker, raw_data, extracted) 
+        else: 
+            written = writer.submit(save_intermediates, data_dir, ticker, raw_data, extracted) 
+
+    if verbose: 
+        print(f'\n√ {ticker} formatted data saved to {data_dir / f"{ticker}_formatted_data.json"}') 
+    return formatted, written 
+
+
+# ==================================================================================================================== # 
+# Batch Mode: runs fetch -> extract -> format for a whole universe of symbols in one process 
+# - Worker pool is capped by the API quota (each ticker costs len(FETCH_STEPS) calls) 
+# - One failing ticker never stops the batch; its error is recorded in the manifest 
+# - Checkpoint manifest (JSON Lines, one record per finished ticker) lets an interrupted batch resume where it stopped 
+# ==================================================================================================================== # 
+
+def load_universe(universe_file): 
+    # One symbol per line (or comma separated); blank lines and '#' comments are ignored, duplicates dropped 
+    symbols = [] 
+    with open(universe_file, 'r') as f: 
+        for line in f: 
+            line = line.split('#', 1)[0] 
+            symbols.extend(s.strip().upper() for s in line.split(',') if s.strip()) 
+    return list(dict.fromkeys(symbols)) 
+
+def load_manifest(manifest_file): 
+    # Latest record per ticker wins, so a ticker that failed and later succeeded counts as done 
+    records = {} 
+    if Path(manifest_file).exists(): 
+        with open(manifest_file, 'r') as f: 
+            for line in f: 
+                line = line.strip() 
+                if not line: 
+                    continue 
+                try: 
+                    record = json.loads(line) 
+                except json.JSONDecodeError: 
+                    continue  # Partially written last line from an interrupted run 
+                records[record['ticker']] = record 
+    return records 
+
+def run_ticker(ticker, keep_intermediates=True, writer=None, warehouse=False): 
+    # Quiet, exception-raising variant of run_full_pipeline used by the batch workers - returns the side-output future 
+    _, written = run_fused_pipeline(ticker, keep_intermediates=keep_intermediates, writer=writer, verbose=False, 
+                                    warehouse=warehouse) 
+    return written 
+
+def run_batch_pipeline(universe_file, max_workers=4, manifest_file=None, retry_failed=False, keep_intermediates=True, 
+                       warehouse=False): 
+    symbols = load_universe(universe_file) 
+    if manifest_file is None: 
+        manifest_file = Path('data') / f'{Path(universe_file).stem}_manifest.jsonl' 
+    manifest_file = Path(manifest_file) 
+    manifest_file.parent.mkdir(parents=True, exist_ok=True) 
+
+    # Resume: skip tickers already completed (and previously failed ones unless retry_failed=True) 
+    previous = load_manifest(manifest_file) 
+    skip_status = {'done'} if retry_failed else {'done', 'failed'} 
+    pending = [t for t in symbols if previous.get(t, {}).get('status') not in skip_status] 
+
+    # More workers than the per-minute budget can feed would only queue on the rate limiter 
+    calls_per_ticker = len(step1.FETCH_STEPS) 
+    if rate_limiter.CALLS_PER_MINUTE > 0: 
+        max_workers = min(max_workers, max(1, rate_limiter.CALLS_PER_MINUTE // calls_per_ticker)) 
+    max_workers = max(1, max_workers) 
+    av_client.configure(pool_size=max_workers * calls_per_ticker) 
+
+    print('='*70) 
+    print(f"   BATCH PIPELINE: {universe_file}") 
+    print(f"   Universe: {len(symbols)} | Already Done: {len(symbols) - len(pending)} | Pending: {len(pending)}") 
+    print(f"   Workers: {max_workers} | Manifest: {manifest_file}") 
+    print('='*70) 
+
+    stop = threading.Event() 
+    counts = {'done': 0, 'failed': 0} 
+    failures = [] 
+    batch_start = time.time() 
+
+    def worker(ticker): 
+        if stop.is_set(): 
+            return ticker, 'skipped', None, 0.0, None 
+        start = time.time() 
+        try: 
+            written = run_ticker(ticker, keep_intermediates=keep_intermediates, writer=writer, warehouse=warehouse) 
+            return ticker, 'done', None, time.time() - start, written 
+        except DailyQuotaExceeded as e: 
+            # Daily budget spent - stop handing out work; unfinished tickers stay pending for the next run. A per-minute 
+            # throttle that outlasted the retries only fails this ticker (recorded below, --retry-failed picks it up) 
+            stop.set() 
+            return ticker, 'stopped', e, time.time() - start, None 
+        except Exception as e: 
+            return ticker, 'failed', e, time.time() - start, None 
+
+    manifest_lock = threading.Lock() 
+
+    def record(manifest, ticker, status, error, seconds): 
+        # One manifest line - called from the writer thread once a ticker's side outputs are on disk, so a resumed 
+        # batch never skips a ticker whose raw / extracted files were lost mid-write 
+        line = json.dumps({ 
+            'ticker': ticker, 
+            'status': status, 
+            'error': str(error) if error else None, 
+            'seconds': round(seconds, 2), 
+            'finished_at': datetime.now().isoformat(timespec='seconds') 
+        }) 
+        with manifest_lock: 
+            manifest.write(line + '\n') 
+            manifest.flush() 
+
+    def record_when_written(manifest, ticker, seconds): 
+        def callback(future): 
+            # Side outputs are best-effort - a failed write is reported and the ticker is recorded as failed so a 
+            # --retry-failed run rewrites them 
+            if future.exception() is not None: 
+                print(f'⚠️  Failed to write intermediate files for {ticker}: {future.exception()}') 
+                record(manifest, ticker, 'failed', future.exception(), seconds) 
+                with manifest_lock: 
+                    counts['done'] -= 1 
+                    counts['failed'] += 1 
+                    failures.append(ticker) 
+            else: 
+                record(manifest, ticker, 'done', None, seconds) 
+        return callback 
+
+    # Background writer for raw/extracted side outputs - joined when the with-block exits, before the manifest closes 
+    writer = ThreadPoolExecutor(max_workers=2) 
+
+    with open(manifest_file, 'a') as manifest, writer, ThreadPoolExecutor(max_workers=max_workers) as executor: 
+        futures = [executor.submit(worker, t) for t in pending] 
+        for finished, future in enumerate(as_completed(futures), start=1): 
+            ticker, status, error, seconds, written = future.result() 
+            if status == 'skipped': 
+                continue 
+            if status == 'stopped': 
+                print(f'[{finished}/{len(pending)}] ⏸  {ticker}: {error} - stopping batch, rerun to resume') 
+                continue 
+
+            counts[status] += 1 
+            if written is not None: 
+                written.add_done_callback(record_when_written(manifest, ticker, seconds)) 
+            else: 
+                record(manifest, ticker, status, error, seconds) 
+
+            if error: 
+                failures.append(ticker) 
+                print(f'[{finished}/{len(pending)}] ❌ {ticker} ({seconds:.1f}s): {error}') 
+            else: 
+                print(f'[{finished}/{len(pending)}] √ {ticker} ({seconds:.1f}s)') 
+
+    elapsed = time.time() - batch_start 
+    print('-'*70) 
+    print(f'✅ Batch Complete in {elapsed:.1f}s - Done: {counts["done"]} | Failed: {counts["failed"]} | ' 
+          f'Remaining: {len(pending) - counts["done"] - counts["failed"]}') 
+    if failures: 
+        print(f'Failed tickers: {", ".join(failures)}') 
+        print('-> Rerun with --retry-failed to try them again') 
+    print('-'*70) 
+
+    return counts 
+
+
 if __name__ == '__main__': 
-    if len(sys.argv) > 1: 
-        ticker = sys.argv[1].upper() 
+    parser = argparse.ArgumentParser(description='Stock fundamental analysis pipeline') 
+    parser.add_argument('ticker', nargs='?', help='Single symbol to run (prompted for if omitted)') 
+    parser.add_argument('--universe', help='Universe file of symbols (one per line) for batch mode') 
+    parser.add_argument('--workers', type=int, default=4, help='Tickers processed in parallel in batch mode') 
+    parser.add_argument('--manifest', help='Checkpoint manifest path (default: data/<universe>_manifest.jsonl)') 
+    parser.add_argument('--retry-failed', action='store_true', help='Re-run tickers that failed in a previous batch') 
+    parser.add_argument('--fused', action='store_true', help='Single ticker: pass data between stages in memory') 
+    parser.add_argument('--no-intermediates', action='store_true', 
+                        help='Fused/batch mode: skip writing raw and extracted JSON side outputs') 
+    parser.add_argument('--warehouse', action='store_true', 
+                        help='Fused/batch mode: also load fundamentals into the SQLite warehouse') 
+    args = parser.parse_args() 
+
+    if args.universe: 
+        run_batch_pipeline(args.universe, max_workers=args.workers, manifest_file=args.manifest, 
+                           retry_failed=args.retry_failed, keep_intermediates=not args.no_intermediates, 
+                           warehouse=args.warehouse) 
     else: 
-        ticker = input("Enter Symbol: ").upper() 
+        if args.ticker: 
+            ticker = args.ticker.upper() 
+        else: 
+            ticker = input("Enter Symbol: ").upper() 
 
-    run_full_pipeline(ticker)
\ No newline at end of file
+        if args.fused: 
+            run_fused_pipeline(ticker, keep_intermediates=not args.no_intermediates, warehouse=args.warehouse) 
+        else: 
+            run_full_pipeline(ticker) 
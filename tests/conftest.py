@@ -0,0 +1,30 @@
+# ==================================================================================================================== #
+# Shared fixtures: every on-disk store the modules write to is pointed at a fresh temp folder per test.
+# Run from the repo root with `python -m pytest tests`.
+# ==================================================================================================================== #
+
+import pandas as pd
+import pytest
+
+from alpha_vantage_data import price_adjustments, timeseries_store
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # Empty Time Series Store + adjustment factor folder
+    monkeypatch.setattr(timeseries_store, 'STORE_ROOT', tmp_path / 'Time_Series_Store')
+    monkeypatch.setattr(price_adjustments, 'FACTORS_ROOT', tmp_path / 'Adjustment_Factors')
+    return tmp_path
+
+
+def daily_bars(dates, closes, volume=1000):
+    # Raw daily bars with open = close and a 1.0 high / low spread
+    closes = pd.Series(closes, dtype='float64')
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(dates),
+        'open': closes,
+        'high': closes + 1.0,
+        'low': closes - 1.0,
+        'close': closes,
+        'volume': float(volume),
+    })
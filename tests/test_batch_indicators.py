@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data.Technical_Indicators import batch_indicators
+from tests.conftest import daily_bars
+
+rng = np.random.default_rng(5)
+CLOSE = 100 + np.cumsum(rng.normal(size=90))
+HIGH = CLOSE + rng.uniform(0.1, 2.0, size=90)
+LOW = CLOSE - rng.uniform(0.1, 2.0, size=90)
+
+
+def reference_adx(high, low, close, n):
+    # Plain-loop Wilder ADX (TA-Lib layout): sums of the first n - 1 moves, DX from bar n, ADX from bar 2n - 1
+    tr, plus, minus = [np.nan], [np.nan], [np.nan]
+    for i in range(1, len(close)):
+        up, down = high[i] - high[i - 1], low[i - 1] - low[i]
+        plus.append(up if up > down and up > 0 else 0.0)
+        minus.append(down if down > up and down > 0 else 0.0)
+        tr.append(max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])))
+    s_tr, s_plus, s_minus = sum(tr[1:n]), sum(plus[1:n]), sum(minus[1:n])
+    dx = [np.nan] * len(close)
+    for i in range(n, len(close)):
+        s_tr += tr[i] - s_tr / n
+        s_plus += plus[i] - s_plus / n
+        s_minus += minus[i] - s_minus / n
+        di_plus, di_minus = 100 * s_plus / s_tr, 100 * s_minus / s_tr
+        dx[i] = 100 * abs(di_plus - di_minus) / (di_plus + di_minus)
+    out = np.full(len(close), np.nan)
+    out[2 * n - 1] = np.mean(dx[n:2 * n])
+    for i in range(2 * n, len(close)):
+        out[i] = (out[i - 1] * (n - 1) + dx[i]) / n
+    return out
+
+
+def test_adx_matches_reference_loop():
+    np.testing.assert_allclose(batch_indicators.adx(HIGH, LOW, CLOSE, 14)['ADX'], reference_adx(HIGH, LOW, CLOSE, 14),
+                               rtol=1e-10)
+
+
+def test_adx_late_listing_starts_from_its_first_bar():
+    # Regression: leading NaNs must not leak a true range or a seed DX into a later-listed symbol
+    late = 30
+    pad = lambda x: np.r_[np.full(late, np.nan), x[:-late]]
+    result = batch_indicators.adx(np.column_stack([HIGH, pad(HIGH)]), np.column_stack([LOW, pad(LOW)]),
+                                  np.column_stack([CLOSE, pad(CLOSE)]), 14)['ADX']
+    expected = reference_adx(HIGH[:-late], LOW[:-late], CLOSE[:-late], 14)
+    np.testing.assert_allclose(result[late:, 1], expected, rtol=1e-10)
+    assert np.isnan(result[:late + 27, 1]).all() and np.isfinite(result[late + 27, 1])
+
+
+def test_bbands_reference_values():
+    bands = batch_indicators.bbands(np.array([1.0, 2.0, 3.0, 5.0]), time_period=3, nbdevup=2, nbdevdn=1)
+    std = np.sqrt([2 / 3, 14 / 9])  # population std of (1, 2, 3) and (2, 3, 5)
+    np.testing.assert_allclose(bands['Real Middle Band'][2:], [2.0, 10 / 3])
+    np.testing.assert_allclose(bands['Real Upper Band'][2:], [2.0, 10 / 3] + 2 * std)
+    np.testing.assert_allclose(bands['Real Lower Band'][2:], [2.0, 10 / 3] - std)
+
+
+def test_willr_and_stoch_reference_values():
+    high, low, close = np.array([3.0, 4.0, 5.0, 5.0]), np.array([1.0, 2.0, 3.0, 4.0]), np.array([2.0, 3.0, 4.0, 4.5])
+    # Windows of 3: highest 5 / lowest 1, then highest 5 / lowest 2
+    np.testing.assert_allclose(batch_indicators.willr(high, low, close, 3)['WILLR'],
+                               [np.nan, np.nan, -25.0, -100 * 0.5 / 3])
+    stoch = batch_indicators.stoch(high, low, close, fastkperiod=3, slowkperiod=2, slowdperiod=1)
+    np.testing.assert_allclose(stoch['SlowK'], [np.nan, np.nan, np.nan, (75.0 + 250 / 3) / 2])
+    np.testing.assert_allclose(stoch['SlowD'], stoch['SlowK'])
+
+
+def test_frames_keep_labels():
+    index = pd.date_range('2024-01-01', periods=90)
+    close = pd.DataFrame({'AAA': CLOSE, 'BBB': CLOSE[::-1]}, index=index)
+    result = batch_indicators.stochrsi(close)
+    assert list(result['FastK'].columns) == ['AAA', 'BBB'] and result['FastD'].index.equals(index)
+    values = result['FastK'].to_numpy()
+    values = values[~np.isnan(values)]
+    assert len(values) and ((values >= 0) & (values <= 100 + 1e-9)).all()
+
+
+def test_scan_reads_the_store(store):
+    dates = pd.bdate_range('2024-01-01', periods=90)
+    batch_indicators.timeseries_store.upsert('AAA', 'daily', daily_bars(dates, CLOSE))
+    results = batch_indicators.scan(['AAA'], time_period=14)
+    assert set(results) == {'Real Upper Band', 'Real Middle Band', 'Real Lower Band', 'SlowK', 'SlowD',
+                            'FastK', 'FastD', 'WILLR', 'ADX'}
+    np.testing.assert_allclose(results['ADX']['AAA'], reference_adx(CLOSE + 1, CLOSE - 1, CLOSE, 14), rtol=1e-10)
+    with pytest.raises(ValueError):
+        batch_indicators.scan(['ZZZ'])
+
+
+def test_bbands_stay_precise_on_long_high_priced_series():
+    prices = 60_000 + np.cumsum(np.random.default_rng(1).normal(scale=5.0, size=300_000))
+    bands = batch_indicators.bbands(prices, time_period=20, nbdevup=1, nbdevdn=1)
+    std = bands['Real Upper Band'] - bands['Real Middle Band']
+    # pandas' own online rolling std drifts by ~1e-6 here; the running E[x^2] - E[x]^2 was off by ~0.4%
+    expected = pd.Series(prices).rolling(20).std(ddof=0).to_numpy()
+    np.testing.assert_allclose(std[19:], expected[19:], rtol=1e-5)
+    direct = np.lib.stride_tricks.sliding_window_view(prices, 20).std(axis=-1)
+    np.testing.assert_allclose(std[19:], direct, rtol=1e-10)
+    assert np.isnan(std[:19]).all()
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data import csv_normalizer
+
+BODY = (b'timestamp,open,high,low,close,volume\n'
+        b'2024-01-03,10.5,11.0,10.0,10.75,1200\n'
+        b'2024-01-02,10.0,10.5,9.5,.,\n')
+
+
+def test_parse_csv_body_types():
+    df = csv_normalizer.parse_csv_body(BODY)
+    assert pd.api.types.is_datetime64_any_dtype(df['timestamp'])
+    assert str(df['volume'].dtype) == 'Int64'
+    assert df['volume'].tolist()[0] == 1200 and df['volume'].isna().tolist() == [False, True]
+    np.testing.assert_array_equal(df['close'], [10.75, np.nan])  # '.' is a missing observation
+
+
+def test_fractional_volume_override():
+    body = b'timestamp,close,volume\n2024-01-02,42000.5,12.34567\n'
+    df = csv_normalizer.parse_csv_body(body, dtypes=csv_normalizer.FRACTIONAL_VOLUME)
+    assert df['volume'].dtype == 'float64'
+    assert df['volume'].tolist() == [12.34567]
+
+
+def test_json_error_body_raises():
+    with pytest.raises(ValueError, match='Expected CSV'):
+        csv_normalizer.parse_csv_body(b'{"Error Message": "Invalid API call."}')
+
+
+def test_normalize_csv_file_batches_and_renames(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_normalizer, 'CSV_BATCH_ROWS', 1)
+    source = tmp_path / 'raw.csv'
+    source.write_bytes(BODY)
+    batches = []
+    rows, path = csv_normalizer.normalize_csv_file(source, tmp_path / 'out' / 'IBM.csv',
+                                                   column_mapping={'close': 'Close'}, fmt='csv',
+                                                   on_batch=batches.append)
+    assert rows == 2 and len(batches) == 2
+    assert 'close' in batches[0].columns  # on_batch sees the raw column names
+    written = pd.read_csv(path)
+    assert list(written.columns) == ['timestamp', 'open', 'high', 'low', 'Close', 'volume']
+    assert written['Close'].tolist()[0] == 10.75
+
+    rows, path = csv_normalizer.normalize_csv_file(source, tmp_path / 'out' / 'IBM.csv', fmt='parquet')
+    assert rows == 2 and path.suffix == '.parquet'
+    assert pd.read_parquet(path)['volume'].isna().tolist() == [False, True]
+
+
+def test_normalize_csv_file_header_only_and_empty(tmp_path):
+    header_only = tmp_path / 'header.csv'
+    header_only.write_bytes(b'timestamp,close\n')
+    rows, path = csv_normalizer.normalize_csv_file(header_only, tmp_path / 'out.csv', fmt='csv')
+    assert rows == 0 and path.read_text().strip() == 'timestamp,close'
+
+    # An empty body leaves no stale artifact from an earlier run behind
+    empty = tmp_path / 'empty.csv'
+    empty.write_bytes(b'')
+    rows, path = csv_normalizer.normalize_csv_file(empty, tmp_path / 'out.csv', fmt='csv')
+    assert rows == 0 and not path.exists()
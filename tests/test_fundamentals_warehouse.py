@@ -0,0 +1,84 @@
+import pytest
+
+from alpha_vantage_data import fundamentals_warehouse
+
+
+@pytest.fixture
+def warehouse(tmp_path, monkeypatch):
+    monkeypatch.setattr(fundamentals_warehouse, 'WAREHOUSE_DB', tmp_path / 'fundamentals.db')
+    return tmp_path / 'fundamentals.db'
+
+
+def balance_sheet(symbol, reports):
+    return {'balance_sheet': {'symbol': symbol, 'annualReports': reports}}
+
+
+def test_column_first_seen_as_none_still_screens_numerically(warehouse):
+    # Regression: a field whose first batch only held 'None' must not become a TEXT column - text compares
+    # '900' > '1000' and would screen the wrong symbols
+    fundamentals_warehouse.ingest_raw_data('AAA', balance_sheet('AAA', [
+        {'fiscalDateEnding': '2023-12-31', 'reportedCurrency': 'USD', 'totalAssets': 'None'},
+    ]))
+    fundamentals_warehouse.ingest_raw_data('BBB', balance_sheet('BBB', [
+        {'fiscalDateEnding': '2023-12-31', 'reportedCurrency': 'USD', 'totalAssets': '900'},
+    ]))
+    fundamentals_warehouse.ingest_raw_data('CCC', balance_sheet('CCC', [
+        {'fiscalDateEnding': '2023-12-31', 'reportedCurrency': 'USD', 'totalAssets': '1000'},
+    ]))
+
+    types = dict(fundamentals_warehouse.query('SELECT name, type FROM pragma_table_info("balance_sheet_annual")')
+                 .itertuples(index=False))
+    assert types['totalAssets'] == 'NUMERIC'
+    assert types['reportedCurrency'] == 'TEXT'
+
+    passed = fundamentals_warehouse.screen('balance_sheet_annual', 'totalAssets', '>', 950)
+    assert passed['symbol'].tolist() == ['CCC']
+    assert fundamentals_warehouse.query(
+        'SELECT totalAssets FROM balance_sheet_annual WHERE symbol = ?', ('AAA',))['totalAssets'].isna().all()
+
+
+def test_screen_uses_latest_report_per_symbol(warehouse):
+    fundamentals_warehouse.ingest_raw_data('AAA', balance_sheet('AAA', [
+        {'fiscalDateEnding': '2023-12-31', 'totalAssets': '500'},
+        {'fiscalDateEnding': '2022-12-31', 'totalAssets': '2000'},
+    ]))
+    fundamentals_warehouse.ingest_raw_data('BBB', balance_sheet('BBB', [
+        {'fiscalDateEnding': '2023-12-31', 'totalAssets': '3000'},
+        {'fiscalDateEnding': '2022-12-31', 'totalAssets': '100'},
+    ]))
+    latest = fundamentals_warehouse.screen('balance_sheet_annual', 'totalAssets', '>=', 1000)
+    assert latest['symbol'].tolist() == ['BBB']
+
+    every = fundamentals_warehouse.screen('balance_sheet_annual', 'totalAssets', '>=', 1000, latest_only=False,
+                                          columns=['totalAssets'])
+    assert list(zip(every['symbol'], every['totalAssets'])) == [('BBB', 3000), ('AAA', 2000)]
+
+
+def test_reingest_replaces_rows_and_grows_schema(warehouse):
+    fundamentals_warehouse.ingest_raw_data('AAA', balance_sheet('AAA', [
+        {'fiscalDateEnding': '2023-12-31', 'totalAssets': '500'},
+    ]))
+    fundamentals_warehouse.ingest_raw_data('AAA', balance_sheet('AAA', [
+        {'fiscalDateEnding': '2023-12-31', 'totalAssets': '600', 'goodwill': '-'},
+    ]))
+    rows = fundamentals_warehouse.query('SELECT * FROM balance_sheet_annual')
+    assert len(rows) == 1
+    assert rows['totalAssets'].tolist() == [600]
+    assert rows['goodwill'].isna().all()
+
+
+def test_screen_rejects_unknown_names(warehouse):
+    with pytest.raises(ValueError):
+        fundamentals_warehouse.screen('balance_sheet_annual', 'totalAssets', 'LIKE', 1)
+    with pytest.raises(ValueError):
+        fundamentals_warehouse.screen('not_a_table', 'totalAssets', '>', 1)
+
+
+def test_text_fields_keep_their_digits(warehouse):
+    fundamentals_warehouse.ingest_raw_data('IBM', {'overview': {
+        'Symbol': 'IBM', 'CIK': '0000051143', 'FiscalYearEnd': 'December', 'MarketCapitalization': '1000', 'PERatio': '-',
+    }})
+    overview = fundamentals_warehouse.query('SELECT CIK, MarketCapitalization, PERatio FROM overview')
+    assert overview['CIK'].tolist() == ['0000051143']
+    assert overview['MarketCapitalization'].tolist() == [1000]
+    assert overview['PERatio'].isna().all()
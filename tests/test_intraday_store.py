@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from alpha_vantage_data import csv_normalizer, timeseries_store
+from alpha_vantage_data.Core_Stock import intraday, intraday_backfill, intraday_refresh
+
+RAW = [('2024-01-02 09:31:00', 100.0), ('2024-01-02 09:32:00', 101.0), ('2024-01-02 09:33:00', 102.0)]
+
+
+def fake_body(params):
+    # Adjusted bars are on a different (post-split) price basis than the raw ones
+    scale = 0.5 if params.get('adjusted') == 'true' else 1.0
+    lines = ['timestamp,open,high,low,close,volume']
+    lines += [f'{t},{p * scale},{(p + 1) * scale},{(p - 1) * scale},{p * scale},1000' for t, p in reversed(RAW)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def fake_av_get(url=None, params=None, **kwargs):
+    return SimpleNamespace(content=fake_body(params))
+
+
+def fake_av_download(path, url=None, params=None, **kwargs):
+    query = {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(fake_body({**query, **(params or {})}))
+    return path
+
+
+def test_interactive_script_and_backfill_store_the_same_bars(store, monkeypatch):
+    monkeypatch.setattr(intraday, 'av_get', fake_av_get)
+    monkeypatch.setattr(csv_normalizer, 'av_download', fake_av_download)
+    monkeypatch.setattr(intraday, 'INTRADAY_DIR', store / 'Intraday_Data')
+    monkeypatch.setattr(intraday_backfill, 'BACKFILL_DB', store / 'backfill.db')
+    monkeypatch.setenv('ALPHA_VANTAGE_API_KEY', 'demo')
+
+    answers = iter(['IBM', '1', '1'])  # ticker, 1min, compact
+    monkeypatch.setattr('builtins.input', lambda prompt='': next(answers))
+    intraday.fetch_intraday_stocks()
+    interactive = timeseries_store.read('IBM', '1min')
+
+    monkeypatch.setattr(timeseries_store, 'STORE_ROOT', store / 'Backfill_Store')
+    intraday_backfill.backfill_partition('IBM', '1min', '2024-01')
+    backfilled = timeseries_store.read('IBM', '1min')
+
+    pd.testing.assert_frame_equal(interactive, backfilled)
+    assert interactive['close'].tolist() == [p for _, p in RAW]
+
+
+def test_tail_refresh_bypasses_the_response_cache(store, monkeypatch):
+    calls = []
+
+    def recording_av_get(url=None, params=None, use_cache=True, **kwargs):
+        calls.append(use_cache)
+        return fake_av_get(url, params)
+
+    monkeypatch.setattr(intraday, 'av_get', recording_av_get)
+    assert intraday_refresh.refresh_symbol('IBM', '1min', api_key='demo') == 3
+    assert intraday_refresh.refresh_symbol('IBM', '1min', api_key='demo') == 0
+    assert calls == [False, False]
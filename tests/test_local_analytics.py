@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data import local_analytics
+
+RETURNS = np.random.default_rng(9).normal(scale=0.01, size=(60, 2))
+
+
+def test_covariance_and_correlation_reference_values():
+    np.testing.assert_allclose(local_analytics.covariance_matrix(RETURNS), np.cov(RETURNS.T, ddof=0), rtol=1e-10)
+    np.testing.assert_allclose(local_analytics.correlation_matrix(RETURNS), np.corrcoef(RETURNS.T), rtol=1e-10)
+    np.testing.assert_allclose(local_analytics.correlation_matrix(RETURNS, 'SPEARMAN'),
+                               pd.DataFrame(RETURNS).corr(method='spearman').to_numpy(), rtol=1e-10)
+
+
+def test_autocorrelation_reference_values():
+    for lag in (1, 5):
+        expected = [np.corrcoef(RETURNS[:-lag, i], RETURNS[lag:, i])[0, 1] for i in range(2)]
+        np.testing.assert_allclose(local_analytics._autocorrelation(RETURNS, lag), expected, rtol=1e-10)
+
+
+def test_rolling_moments_match_pandas():
+    mean, variance = local_analytics.rolling_moments(RETURNS, 20)
+    rolling = pd.DataFrame(RETURNS).rolling(20)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-9)
+    np.testing.assert_allclose(variance, rolling.var(ddof=0).to_numpy(), rtol=1e-7)
+
+
+def test_rolling_autocorrelation_matches_last_window():
+    window, lag = 20, 3
+    result = local_analytics.rolling_autocorrelation(RETURNS, window, lag)
+    last = RETURNS[-window:, 0]
+    np.testing.assert_allclose(result[-1, 0], np.corrcoef(last[:-lag], last[lag:])[0, 1], rtol=1e-8)
+    assert np.isnan(result[:window - 1]).all()
+
+
+@pytest.mark.parametrize('lag', [0, -1, 20, 25])
+def test_lags_outside_the_window_are_rejected(lag):
+    with pytest.raises(ValueError, match='lag'):
+        local_analytics.rolling_autocorrelation(RETURNS, 20, lag)
+
+
+def test_autocorrelation_lag_bounds():
+    with pytest.raises(ValueError, match='lag'):
+        local_analytics._autocorrelation(RETURNS, 0)
+    with pytest.raises(ValueError, match='lag'):
+        local_analytics._autocorrelation(RETURNS, len(RETURNS))
+
+
+@pytest.mark.parametrize('correlation', [False, True])
+def test_rolling_covariance_matches_each_window(correlation):
+    # Long enough to cross several re-anchors; gaps at the start, inside, and a symbol listed late
+    returns = np.random.default_rng(15).normal(scale=0.01, size=(80, 5))
+    returns[:25, 3] = np.nan
+    returns[[30, 51], 1] = np.nan
+    window = 12
+
+    rows = list(local_analytics.iter_rolling_covariance(returns, window, correlation=correlation))
+    assert [t for t, _ in rows] == list(range(window - 1, len(returns)))
+    for t, matrix in rows:
+        values = returns[t - window + 1:t + 1]
+        full = np.isfinite(values).all(axis=0)
+        expected = np.full(matrix.shape, np.nan)
+        block = np.corrcoef(values[:, full].T) if correlation else np.cov(values[:, full].T, ddof=0)
+        expected[np.ix_(full, full)] = block
+        np.testing.assert_allclose(matrix, expected, rtol=1e-9, atol=1e-15)
+
+    complete = returns[:, [0, 2, 4]]
+    for t, matrix in local_analytics.iter_rolling_covariance(complete, window, correlation=correlation):
+        values = complete[t - window + 1:t + 1].T
+        expected = np.corrcoef(values) if correlation else np.cov(values, ddof=0)
+        np.testing.assert_allclose(matrix, expected, rtol=1e-9, atol=1e-15)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from alpha_vantage_data.Technical_Indicators import moving_averages
+from tests.conftest import daily_bars
+
+PRICES = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 4.0])
+
+
+def test_sma_ema_wma_reference_values():
+    np.testing.assert_allclose(moving_averages.sma(PRICES, 3), [np.nan, np.nan, 2.0, 3.0, 4.0, 13 / 3])
+    # Seeded with SMA(1, 2, 3) = 2, then alpha = 2 / (3 + 1) = 0.5
+    np.testing.assert_allclose(moving_averages.ema(PRICES, 3), [np.nan, np.nan, 2.0, 3.0, 4.0, 4.0])
+    # Weights 1, 2, 3 over each window / 6
+    np.testing.assert_allclose(moving_averages.wma(PRICES, 3), [np.nan, np.nan, 14 / 6, 20 / 6, 26 / 6, 26 / 6])
+
+
+def test_trima_and_dema_reference_values():
+    # TRIMA(4) = SMA(2) of SMA(3)
+    np.testing.assert_allclose(moving_averages.trima(PRICES, 4), [np.nan] * 3 + [2.5, 3.5, (4.0 + 13 / 3) / 2])
+    # DEMA(2): e1 = EMA(2), e2 = EMA(2) of e1, value = 2 * e1 - e2
+    e1 = [np.nan, 1.5, 1.5 + 2 / 3 * 1.5, None, None, None]
+    e1[3] = e1[2] + 2 / 3 * (4.0 - e1[2])
+    e1[4] = e1[3] + 2 / 3 * (5.0 - e1[3])
+    e1[5] = e1[4] + 2 / 3 * (4.0 - e1[4])
+    e2 = [np.nan, np.nan, (e1[1] + e1[2]) / 2, None, None, None]
+    for t in range(3, 6):
+        e2[t] = e2[t - 1] + 2 / 3 * (e1[t] - e2[t - 1])
+    expected = [np.nan, np.nan] + [2 * e1[t] - e2[t] for t in range(2, 6)]
+    np.testing.assert_allclose(moving_averages.dema(PRICES, 2), expected)
+
+
+@pytest.mark.parametrize('function', moving_averages.MOVING_AVERAGES)
+def test_matrix_columns_match_single_series_and_late_listings(function):
+    rng = np.random.default_rng(7)
+    a = 100 + np.cumsum(rng.normal(size=80))
+    b = 50 + np.cumsum(rng.normal(size=80))
+    b[:10] = np.nan  # listed 10 bars later
+
+    matrix = moving_averages.moving_average(function, np.column_stack([a, b]), 5)
+    np.testing.assert_allclose(matrix[:, 0], moving_averages.moving_average(function, a, 5))
+    # A late listing just starts later: same values as the series computed from its first bar
+    np.testing.assert_allclose(matrix[10:, 1], moving_averages.moving_average(function, b[10:], 5))
+    assert np.isnan(matrix[:10, 1]).all()
+
+
+@pytest.mark.parametrize('function', ['SMA', 'EMA', 'WMA', 'TRIMA', 'KAMA', 'T3'])
+def test_sweep_matches_single_calls(function):
+    prices = 100 + np.cumsum(np.random.default_rng(3).normal(size=60))
+    periods = [3, 8, 13]
+    result = moving_averages.sweep(function, prices, periods)
+    for k, period in enumerate(periods):
+        np.testing.assert_allclose(result[:, k], moving_averages.moving_average(function, prices, period))
+
+
+def test_matype_codes_and_bad_input():
+    np.testing.assert_allclose(moving_averages.moving_average(1, PRICES, 3), moving_averages.ema(PRICES, 3))
+    with pytest.raises(ValueError):
+        moving_averages.moving_average('MAMA', PRICES, 3)
+    with pytest.raises(ValueError):
+        moving_averages.sma(PRICES, 0)
+
+
+def test_indicator_frame_reads_the_store(store):
+    moving_averages.timeseries_store.upsert('IBM', 'daily', daily_bars(
+        ['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05'], [1.0, 2.0, 3.0, 4.0]))
+    frame = moving_averages.indicator_frame('sma', 'IBM', 3)
+    assert list(frame.columns) == ['Date', 'SMA_3']
+    assert frame['SMA_3'].tolist() == [3.0, 2.0]  # newest first, warm-up dropped
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data.Economic_Indicators import risk_free_rate_data_fetch
+from alpha_vantage_data.Options import option_pricing
+
+# Textbook case: S = K = 100, T = 1y, r = 5%, vol = 20%, no dividends
+CALL, PUT = 10.450583572185565, 5.573526022256971
+
+
+def test_norm_cdf_reference_values():
+    np.testing.assert_allclose(option_pricing.norm_cdf([0.0, 1.96, -1.0, 8.0, -40.0]),
+                               [0.5, 0.9750021048517795, 0.15865525393145707, 1.0 - 6.22096057427178e-16, 0.0],
+                               rtol=1e-13, atol=1e-300)
+
+
+def test_bs_price_and_greeks_reference_values():
+    prices = option_pricing.bs_price(100.0, 100.0, 1.0, 0.05, 0.2, np.array([True, False]))
+    np.testing.assert_allclose(prices, [CALL, PUT], rtol=1e-12)
+
+    greeks = option_pricing.greeks(100.0, 100.0, 1.0, 0.05, 0.2, np.array([True, False]))
+    np.testing.assert_allclose(greeks['delta'], [0.6368306511756191, 0.6368306511756191 - 1.0], rtol=1e-12)
+    np.testing.assert_allclose(greeks['gamma'], 0.018762017345846895, rtol=1e-12)
+    np.testing.assert_allclose(greeks['vega'], 0.3752403469169379, rtol=1e-12)   # per vol point
+    np.testing.assert_allclose(greeks['theta'][0], -0.01757267820941972, rtol=1e-12)  # per calendar day
+    np.testing.assert_allclose(greeks['rho'][0], 0.5323248154537634, rtol=1e-12)  # per 1% rate move
+
+
+def test_put_call_parity_with_dividend_yield():
+    strikes = np.linspace(60, 140, 9)
+    call = option_pricing.bs_price(100.0, strikes, 0.5, 0.03, 0.35, True, dividend_yield=0.02)
+    put = option_pricing.bs_price(100.0, strikes, 0.5, 0.03, 0.35, False, dividend_yield=0.02)
+    np.testing.assert_allclose(call - put, 100.0 * np.exp(-0.02 * 0.5) - strikes * np.exp(-0.03 * 0.5), atol=1e-10)
+
+
+def test_implied_volatility_round_trip():
+    strikes = np.repeat(np.linspace(50, 200, 16), 2)
+    is_call = np.tile([True, False], 16)
+    tenors = np.resize([0.02, 0.25, 1.0, 2.5], 32)
+    vols = np.resize([0.08, 0.2, 0.45, 1.2], 32)
+    prices = option_pricing.bs_price(100.0, strikes, tenors, 0.04, vols, is_call)
+    solved = option_pricing.implied_volatility(prices, 100.0, strikes, tenors, 0.04, is_call)
+    # Contracts with no time value left (deep ITM or far OTM, short-dated) carry no vol information and can't be
+    # inverted - the rest must round-trip
+    discounted = strikes * np.exp(-0.04 * tenors)
+    intrinsic = np.where(is_call, np.maximum(100.0 - discounted, 0.0), np.maximum(discounted - 100.0, 0.0))
+    meaningful = prices - intrinsic > 1e-8
+    np.testing.assert_allclose(solved[meaningful], vols[meaningful], rtol=1e-6)
+
+
+def test_implied_volatility_outside_no_arbitrage_bounds_is_nan():
+    # Below intrinsic value, above the spot, expired, and a missing quote
+    solved = option_pricing.implied_volatility([15.0, 120.0, 5.0, np.nan], 100.0, [80.0, 100.0, 100.0, 100.0],
+                                               [1.0, 1.0, 0.0, 1.0], 0.0, True)
+    assert np.isnan(solved).all()
+
+
+def test_unconverged_contracts_stay_nan(monkeypatch):
+    monkeypatch.setattr(option_pricing, 'IV_MAX_ITERATIONS', 1)
+    solved = option_pricing.implied_volatility(CALL, 100.0, 100.0, 1.0, 0.05, True)
+    assert np.isnan(solved)
+
+
+def test_price_chain_recovers_spot_and_vols():
+    strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+    expiration = pd.Timestamp('2024-07-01')
+    t = option_pricing.years_to_expiry(expiration, '2024-01-01')
+    rows = []
+    for kind, is_call in (('call', True), ('put', False)):
+        marks = option_pricing.bs_price(100.0, strikes, t, 0.05, 0.25, is_call)
+        rows += [{'contractID': f'X{kind}{k:g}', 'strike': k, 'type': kind, 'mark': m, 'expiration': expiration,
+                  'date': pd.Timestamp('2024-01-01')} for k, m in zip(strikes, marks)]
+    chain = pd.DataFrame(rows)
+
+    assert option_pricing.implied_spot(chain, 0.05) == pytest.approx(100.0, abs=1e-9)
+    priced = option_pricing.price_chain(chain, rate=0.05)
+    np.testing.assert_allclose(priced['implied_volatility'], 0.25, rtol=1e-7)
+    assert list(priced.columns[-6:]) == option_pricing.GREEK_COLUMNS
+
+
+def test_risk_free_rate_converts_the_semiannual_yield(monkeypatch):
+    series = pd.Series([0.0525, 0.0433], index=pd.to_datetime(['2024-01-02', '2024-06-03']))
+    monkeypatch.setattr(risk_free_rate_data_fetch, 'treasury_yield_series', lambda **kwargs: series)
+    assert risk_free_rate_data_fetch.risk_free_rate() == pytest.approx(2 * np.log(1 + 0.0433 / 2), rel=1e-15)
+    assert risk_free_rate_data_fetch.risk_free_rate(as_of='2024-03-01') == pytest.approx(0.0518227635690018, rel=1e-12)
+    with pytest.raises(ValueError):
+        risk_free_rate_data_fetch.risk_free_rate(as_of='2023-12-01')
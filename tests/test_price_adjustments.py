@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import price_adjustments, timeseries_store
+from tests.conftest import daily_bars
+
+DATES = ['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05', '2024-01-08', '2024-01-09']
+CLOSES = [100.0, 102.0, 104.0, 52.0, 53.0, 54.0]
+
+
+def actions(*rows):
+    return pd.DataFrame({'timestamp': pd.to_datetime([r[0] for r in rows]),
+                         'split_coefficient': [r[1] for r in rows], 'dividend_amount': [r[2] for r in rows]})
+
+
+SPLIT_AND_DIVIDEND = actions(('2024-01-05', 2.0, 0.0), ('2024-01-09', 1.0, 1.0))
+
+
+def test_split_and_dividend_reference_values(store):
+    timeseries_store.upsert('IBM', 'daily', daily_bars(DATES, CLOSES))
+    assert price_adjustments.update_events('IBM', SPLIT_AND_DIVIDEND) == 2
+
+    events = price_adjustments.load_events('IBM')
+    # 2:1 split -> 1/2; $1 dividend on a 53.00 prior close -> 1 - 1/53
+    np.testing.assert_allclose(events['factor'], [0.5, 52 / 53])
+    np.testing.assert_allclose(events['cumulative'], [0.5, 0.5 * 52 / 53])
+    np.testing.assert_allclose(events['split_cumulative'], [0.5, 0.5])
+    assert not events['fallback'].any()
+
+    adjusted = price_adjustments.read_adjusted('IBM')
+    scale = np.array([0.5 * 52 / 53] * 3 + [52 / 53] * 2 + [1.0])
+    np.testing.assert_allclose(adjusted['close'], np.array(CLOSES) * scale)
+    np.testing.assert_allclose(adjusted['adjusted_close'], adjusted['close'])
+    np.testing.assert_allclose(adjusted['volume'], [2000.0] * 3 + [1000.0] * 3)
+    assert adjusted['close'].iloc[-1] == 54.0  # the latest bar is never changed
+
+
+def test_no_events_leaves_bars_unchanged(store):
+    timeseries_store.upsert('IBM', 'daily', daily_bars(DATES, CLOSES))
+    adjusted = price_adjustments.read_adjusted('IBM')
+    np.testing.assert_array_equal(adjusted['adjusted_close'], CLOSES)
+
+
+def test_fallback_dividend_is_recomputed_once_prior_close_is_stored(store):
+    timeseries_store.upsert('IBM', 'daily', daily_bars(DATES[3:], CLOSES[3:]))
+    early_dividend = actions(('2024-01-04', 1.0, 2.08))
+    price_adjustments.update_events('IBM', early_dividend)
+    events = price_adjustments.load_events('IBM')
+    assert events['fallback'].tolist() == [True] and events['factor'].tolist() == [1.0]
+
+    # Nothing new arrived - the fallback stays as it is
+    assert price_adjustments.update_events('IBM', early_dividend) == 0
+
+    timeseries_store.upsert('IBM', 'daily', daily_bars(DATES[:3], CLOSES[:3]))
+    assert price_adjustments.update_events('IBM', early_dividend) == 1
+    events = price_adjustments.load_events('IBM')
+    assert events['fallback'].tolist() == [False]
+    np.testing.assert_allclose(events['factor'], [1 - 2.08 / 102.0])
+
+
+def test_replace_drops_removed_actions_and_picks_up_corrections(store):
+    timeseries_store.upsert('IBM', 'daily', daily_bars(DATES, CLOSES))
+    price_adjustments.update_events('IBM', SPLIT_AND_DIVIDEND)
+
+    # A corrected amount is a change even though the date set is the same
+    corrected = actions(('2024-01-05', 2.0, 0.0), ('2024-01-09', 1.0, 0.53))
+    assert price_adjustments.update_events('IBM', corrected) == 1
+    np.testing.assert_allclose(price_adjustments.load_events('IBM')['factor'], [0.5, 0.99])
+
+    # The trailing dividend disappears from the full record -> only the split is left, stored factors kept
+    assert price_adjustments.update_events('IBM', actions(('2024-01-05', 2.0, 0.0))) == 0
+    assert price_adjustments.load_events('IBM')['timestamp'].tolist() == [pd.Timestamp('2024-01-05')]
+
+    # replace=False merges instead of replacing
+    price_adjustments.update_events('IBM', actions(('2024-01-09', 1.0, 1.0)), replace=False)
+    np.testing.assert_allclose(price_adjustments.load_events('IBM')['cumulative'], [0.5, 0.5 * 52 / 53])
+
+
+def test_actions_from_store(store):
+    bars = daily_bars(DATES, CLOSES).assign(split_coefficient=[1.0, 1.0, 1.0, 2.0, 1.0, 1.0],
+                                            dividend_amount=[0.0, 0.0, 0.0, 0.0, 0.0, 1.0])
+    timeseries_store.upsert('IBM', 'daily', bars)
+    found = price_adjustments.actions_from_store('IBM')
+    pd.testing.assert_frame_equal(found.reset_index(drop=True),
+                                  SPLIT_AND_DIVIDEND.astype({'timestamp': 'datetime64[ns]'}))
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from alpha_vantage_data import rate_limiter
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+
+DAILY = {'Information': 'We have detected your API key as DEMO and our standard API rate limit is 25 requests per '
+                        'day. Please subscribe to any of the premium plans to instantly remove all daily rate limits.'}
+PER_MINUTE = {'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute and '
+                      '500 calls per day. Please visit https://www.alphavantage.co/premium/ if you would like to '
+                      'target a higher API call frequency.'}
+
+
+def test_daily_quota_notice():
+    assert rate_limiter.is_rate_limit_response(FakeResponse(DAILY))
+    assert rate_limiter.is_daily_quota_response(FakeResponse(DAILY))
+
+
+def test_per_minute_notice_is_not_a_daily_quota():
+    assert rate_limiter.is_rate_limit_response(FakeResponse(PER_MINUTE))
+    assert not rate_limiter.is_daily_quota_response(FakeResponse(PER_MINUTE))
+
+
+@pytest.mark.parametrize('body', [b'timestamp,close\n2024-01-02,1.0\n', {'Error Message': 'Invalid API call.'}])
+def test_data_and_errors_are_not_rate_limits(body):
+    assert not rate_limiter.is_rate_limit_response(FakeResponse(body))
+    assert not rate_limiter.is_daily_quota_response(FakeResponse(body))
+
+
+def test_local_daily_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'RATE_DB', tmp_path / 'rate_limiter.db')
+    monkeypatch.setattr(rate_limiter, 'CALLS_PER_MINUTE', 600)
+    monkeypatch.setattr(rate_limiter, 'BURST', 10)
+    monkeypatch.setattr(rate_limiter, 'CALLS_PER_DAY', 3)
+    for _ in range(3):
+        rate_limiter.acquire()
+    assert rate_limiter.calls_today() == 3
+    with pytest.raises(rate_limiter.DailyQuotaExceeded):
+        rate_limiter.acquire()
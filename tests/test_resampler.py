@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import price_adjustments, resampler, timeseries_store
+from tests.conftest import daily_bars
+
+# Thu 2024-01-04 .. Wed 2024-01-17 trading days: weeks of Jan 1, Jan 8 and Jan 15
+DATES = pd.bdate_range('2024-01-04', '2024-01-17')
+CLOSES = np.arange(10.0, 10.0 + len(DATES))
+
+
+def long_bars(symbol, dates, closes):
+    return daily_bars(dates, closes).assign(symbol=symbol)
+
+
+def test_period_keys_weeks_start_on_monday():
+    keys = resampler.period_keys(pd.to_datetime(['2024-01-07', '2024-01-08', '2024-01-14', '2024-01-15']), 'weekly')
+    assert keys[0] != keys[1] and keys[1] == keys[2] and keys[2] != keys[3]
+    assert resampler.period_start('2024-01-10', 'weekly') == pd.Timestamp('2024-01-08')
+    assert resampler.period_start('2024-02-29', 'monthly') == pd.Timestamp('2024-02-01')
+
+
+def test_weekly_reference_values():
+    daily = pd.concat([long_bars('BBB', DATES[:2], [5.0, 6.0]), long_bars('AAA', DATES, CLOSES)])
+    daily.loc[daily['timestamp'] == '2024-01-09', 'high'] = 99.0
+    weekly = resampler.resample(daily, 'weekly')
+
+    aaa = weekly[weekly['symbol'] == 'AAA']
+    assert aaa['timestamp'].tolist() == list(pd.to_datetime(['2024-01-05', '2024-01-12', '2024-01-17']))
+    np.testing.assert_array_equal(aaa['open'], [10.0, 12.0, 17.0])
+    np.testing.assert_array_equal(aaa['close'], [11.0, 16.0, 19.0])
+    np.testing.assert_array_equal(aaa['high'], [12.0, 99.0, 20.0])
+    np.testing.assert_array_equal(aaa['low'], [9.0, 11.0, 16.0])
+    np.testing.assert_array_equal(aaa['volume'], [2000.0, 5000.0, 3000.0])
+
+    bbb = weekly[weekly['symbol'] == 'BBB']
+    assert bbb['close'].tolist() == [6.0] and bbb['volume'].tolist() == [2000.0]
+
+
+def test_monthly_sums_dividends_and_multiplies_splits():
+    dates = pd.to_datetime(['2024-01-30', '2024-01-31', '2024-02-01', '2024-02-02'])
+    daily = long_bars('AAA', dates, [1.0, 2.0, 3.0, 4.0]).assign(
+        dividend_amount=[0.1, 0.2, 0.0, 0.0], split_coefficient=[1.0, 1.0, 2.0, 3.0])
+    monthly = resampler.resample(daily, 'monthly')
+    assert monthly['timestamp'].tolist() == list(pd.to_datetime(['2024-01-31', '2024-02-02']))
+    np.testing.assert_allclose(monthly['dividend_amount'], [0.3, 0.0])
+    np.testing.assert_allclose(monthly['split_coefficient'], [1.0, 6.0])
+
+
+def test_incremental_refresh_matches_full_rebuild(store):
+    timeseries_store.upsert('AAA', 'daily', daily_bars(DATES[:7], CLOSES[:7]))
+    assert resampler.refresh_symbol('AAA', 'weekly') == 2
+    # The open week (Jan 8 - Jan 12) is re-aggregated once its later days arrive
+    timeseries_store.upsert('AAA', 'daily', daily_bars(DATES[7:], CLOSES[7:]))
+    resampler.refresh_symbol('AAA', 'weekly')
+
+    stored = timeseries_store.read('AAA', resampler.STORE_INTERVALS['weekly'])
+    expected = resampler.resample(long_bars('AAA', DATES, CLOSES), 'weekly')
+    np.testing.assert_array_equal(stored['timestamp'], expected['timestamp'])
+    np.testing.assert_array_equal(stored['close'], expected['close'])
+    np.testing.assert_array_equal(stored['volume'], expected['volume'])
+    # Resampled bars never land in the interval the TIME_SERIES_WEEKLY scripts write
+    assert timeseries_store.read('AAA', 'weekly').empty
+
+
+def test_changed_events_rebuild_earlier_adjusted_closes(store):
+    timeseries_store.upsert('AAA', 'daily', daily_bars(DATES, CLOSES))
+    resampler.refresh_symbol('AAA', 'weekly')
+    first = timeseries_store.read('AAA', 'weekly_resampled')
+    np.testing.assert_array_equal(first['adjusted_close'], [11.0, 16.0, 19.0])
+
+    # A 2:1 split on the last day back-adjusts every earlier week, not just the open one
+    price_adjustments.update_events('AAA', pd.DataFrame({
+        'timestamp': [DATES[-1]], 'split_coefficient': [2.0], 'dividend_amount': [0.0]}))
+    resampler.refresh_symbol('AAA', 'weekly')
+    rebuilt = timeseries_store.read('AAA', 'weekly_resampled')
+    np.testing.assert_array_equal(rebuilt['adjusted_close'], [5.5, 8.0, 19.0])
+    np.testing.assert_array_equal(rebuilt['close'], [11.0, 16.0, 19.0])
+
+
+def test_resample_frame_is_newest_first(store):
+    timeseries_store.upsert('AAA', 'daily', daily_bars(DATES, CLOSES))
+    frame = resampler.resample_frame('AAA', 'monthly', end='2024-01-12')
+    assert frame['timestamp'].tolist() == [pd.Timestamp('2024-01-12')]
+    assert frame['open'].tolist() == [10.0] and frame['close'].tolist() == [16.0]
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data import timeseries_store
+from alpha_vantage_data.Technical_Indicators import session_vwap
+
+# Two trading days of 30min bars with pre-market and after-hours bars on both
+TIMESTAMPS = pd.DatetimeIndex([*pd.date_range('2024-03-04 07:00', '2024-03-04 18:00', freq='30min'),
+                               *pd.date_range('2024-03-05 07:00', '2024-03-05 18:00', freq='30min')])
+SYMBOLS = ['AAA', 'BBB', 'CCC']
+
+rng = np.random.default_rng(17)
+CLOSE = 100 + np.cumsum(rng.normal(size=(len(TIMESTAMPS), len(SYMBOLS))), axis=0)
+HIGH = CLOSE + rng.uniform(0, 1, CLOSE.shape)
+LOW = CLOSE - rng.uniform(0, 1, CLOSE.shape)
+VOLUME = rng.integers(100, 10000, CLOSE.shape).astype('float64')
+CLOSE[[3, 30], 1] = np.nan   # BBB misses a bar on each day
+CLOSE[:25, 2] = np.nan       # CCC only trades on the second day
+
+
+def reference_vwap(regular_hours):
+    # Plain loop: restart the sums on every new trading day, skip missing / out-of-hours bars
+    regular = (TIMESTAMPS.hour * 60 + TIMESTAMPS.minute >= 570) & (TIMESTAMPS.hour < 16)
+    out = np.full(CLOSE.shape, np.nan)
+    for j in range(len(SYMBOLS)):
+        day, pv, v = None, 0.0, 0.0
+        for i, timestamp in enumerate(TIMESTAMPS):
+            if np.isnan(CLOSE[i, j]) or (regular_hours and not regular[i]):
+                continue
+            if timestamp.date() != day:
+                day, pv, v = timestamp.date(), 0.0, 0.0
+            pv += (HIGH[i, j] + LOW[i, j] + CLOSE[i, j]) / 3 * VOLUME[i, j]
+            v += VOLUME[i, j]
+            out[i, j] = pv / v
+    return out
+
+
+@pytest.mark.parametrize('regular_hours', [False, True])
+def test_batch_matches_reference(regular_hours):
+    batch = session_vwap.session_vwap(HIGH, LOW, CLOSE, VOLUME, TIMESTAMPS, regular_hours=regular_hours)
+    np.testing.assert_allclose(batch, reference_vwap(regular_hours), rtol=1e-12)
+
+
+@pytest.mark.parametrize('regular_hours', [False, True])
+def test_streaming_matches_batch(regular_hours):
+    batch = session_vwap.session_vwap(HIGH, LOW, CLOSE, VOLUME, TIMESTAMPS, regular_hours=regular_hours)
+
+    many = session_vwap.StreamingVWAPBatch(SYMBOLS, regular_hours=regular_hours)
+    streamed = np.array([many.update(t, HIGH[i], LOW[i], CLOSE[i], VOLUME[i]) for i, t in enumerate(TIMESTAMPS)])
+    # The lock-step stream keeps the session value through a gap bar - compare on the bars each symbol has
+    np.testing.assert_allclose(np.where(np.isfinite(batch), streamed, np.nan), batch, rtol=1e-12)
+
+    for j, symbol in enumerate(SYMBOLS):
+        single = session_vwap.StreamingVWAP(regular_hours=regular_hours)
+        values = []
+        for i, timestamp in enumerate(TIMESTAMPS):
+            if np.isnan(CLOSE[i, j]):
+                continue
+            value = single.update({'timestamp': timestamp, 'high': HIGH[i, j], 'low': LOW[i, j],
+                                   'close': CLOSE[i, j], 'volume': VOLUME[i, j]})
+            values.append(np.nan if value is None else value)
+        expected = batch[~np.isnan(CLOSE[:, j]), j]
+        if regular_hours:
+            # Out-of-hours bars return the last in-session value instead of NaN
+            mask = ~np.isnan(expected)
+            np.testing.assert_allclose(np.array(values)[mask], expected[mask], rtol=1e-12)
+        else:
+            np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+
+def test_session_resets_at_the_day_boundary():
+    vwap = session_vwap.session_vwap(HIGH[:, 0], LOW[:, 0], CLOSE[:, 0], VOLUME[:, 0], TIMESTAMPS)
+    first_of_day = [0, int(np.flatnonzero(TIMESTAMPS.date == TIMESTAMPS[-1].date())[0])]
+    typical = (HIGH[:, 0] + LOW[:, 0] + CLOSE[:, 0]) / 3
+    np.testing.assert_allclose(vwap[first_of_day], typical[first_of_day], rtol=1e-12)
+
+    single = session_vwap.StreamingVWAP()
+    single.update({'timestamp': '2024-03-04 15:30', 'high': 11, 'low': 9, 'close': 10, 'volume': 500})
+    assert single.update({'timestamp': '2024-03-05 09:30', 'high': 21, 'low': 19, 'close': 20, 'volume': 1}) == 20
+
+
+def test_regular_hours_excludes_extended_session_bars():
+    vwap = session_vwap.session_vwap(HIGH[:, 0], LOW[:, 0], CLOSE[:, 0], VOLUME[:, 0], TIMESTAMPS, regular_hours=True)
+    time_of_day = TIMESTAMPS - TIMESTAMPS.normalize()
+    outside = (time_of_day < pd.Timedelta(hours=9, minutes=30)) | (time_of_day >= pd.Timedelta(hours=16))
+    assert np.isnan(vwap[outside]).all()
+    assert np.isfinite(vwap[~outside]).all()
+
+    # The 09:30 bar starts the session - pre-market volume is not carried into it
+    opens = np.flatnonzero(time_of_day == pd.Timedelta(hours=9, minutes=30))
+    typical = (HIGH[:, 0] + LOW[:, 0] + CLOSE[:, 0]) / 3
+    np.testing.assert_allclose(vwap[opens], typical[opens], rtol=1e-12)
+
+    single = session_vwap.StreamingVWAP(regular_hours=True)
+    assert single.update({'timestamp': '2024-03-04 08:00', 'high': 51, 'low': 49, 'close': 50, 'volume': 1e6}) is None
+    assert single.update({'timestamp': '2024-03-04 09:30', 'high': 11, 'low': 9, 'close': 10, 'volume': 1}) == 10
+    assert single.update({'timestamp': '2024-03-04 16:00', 'high': 51, 'low': 49, 'close': 50, 'volume': 1e6}) == 10
+
+
+def test_vwap_from_store(store):
+    for j, symbol in enumerate(SYMBOLS):
+        keep = ~np.isnan(CLOSE[:, j])
+        timeseries_store.upsert(symbol, '30min', pd.DataFrame({
+            'timestamp': TIMESTAMPS[keep], 'open': CLOSE[keep, j], 'high': HIGH[keep, j], 'low': LOW[keep, j],
+            'close': CLOSE[keep, j], 'volume': VOLUME[keep, j]}))
+
+    frame = session_vwap.vwap_from_store(SYMBOLS, '30min')
+    assert list(frame.columns) == SYMBOLS
+    np.testing.assert_allclose(frame.to_numpy(), reference_vwap(False), rtol=1e-12)
+
+    api_style = session_vwap.vwap_frame('bbb', '30min')
+    assert api_style['Date'].is_monotonic_decreasing
+    assert len(api_style) == np.isfinite(CLOSE[:, 1]).sum()
+
+    with pytest.raises(ValueError):
+        session_vwap.vwap_from_store(SYMBOLS, 'daily')
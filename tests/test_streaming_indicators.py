@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from alpha_vantage_data.Technical_Indicators import batch_indicators, moving_averages, streaming_indicators
+
+PRICES = 100 + np.cumsum(np.random.default_rng(11).normal(size=120))
+
+
+def stream(indicator, prices):
+    return np.array([np.nan if v is None else v for v in (indicator.update(p) for p in prices)])
+
+
+@pytest.mark.parametrize('function', moving_averages.MOVING_AVERAGES)
+def test_streaming_moving_averages_match_batch(function):
+    streamed = stream(streaming_indicators.streaming_ma(function, 7), PRICES)
+    np.testing.assert_allclose(streamed, moving_averages.moving_average(function, PRICES, 7), rtol=1e-10)
+
+
+def test_streaming_rsi_matches_batch():
+    np.testing.assert_allclose(stream(streaming_indicators.StreamingRSI(14), PRICES),
+                               batch_indicators._rsi(PRICES[:, None], 14)[:, 0], rtol=1e-10)
+
+
+def values(outputs):
+    # MACD values are dicts - compare on the MACD line
+    return np.array([np.nan if v is None else v['MACD'] if isinstance(v, dict) else v for v in outputs])
+
+
+@pytest.mark.parametrize('make', [
+    *[lambda function=function: streaming_indicators.streaming_ma(function, 5) for function in moving_averages.MOVING_AVERAGES],
+    lambda: streaming_indicators.StreamingRSI(5),
+    lambda: streaming_indicators.StreamingMACD(3, 6, 4),
+])
+def test_nan_bars_are_skipped_and_the_value_recovers(make):
+    gappy = PRICES.copy()
+    gappy[[20, 21, 50]] = np.nan
+    gappy[70] = np.inf
+    missing = ~np.isfinite(gappy)
+    gap_indicator, clean_indicator = make(), make()
+    streamed = values(gap_indicator.update(p) for p in gappy)
+    clean = values(clean_indicator.update(p) for p in gappy[~missing])
+    # Values at the remaining bars equal a stream that never saw the gaps; a gap repeats the last value
+    np.testing.assert_allclose(streamed[~missing], clean, rtol=1e-12)
+    np.testing.assert_array_equal(streamed[[20, 21, 50, 70]], streamed[[19, 19, 49, 69]])
+    assert np.isfinite(streamed[-1])
+
+
+def test_volume_indicators_skip_missing_bars():
+    bar = {'high': 11.0, 'low': 9.0, 'close': 10.0, 'volume': 100.0}
+    for indicator in (streaming_indicators.StreamingOBV(), streaming_indicators.StreamingAD()):
+        indicator.update(bar)
+        before = indicator.value
+        assert indicator.update({**bar, 'close': float('nan')}) == before
+        assert np.isfinite(indicator.update({**bar, 'close': 10.5}))
+
+
+@pytest.mark.parametrize('cls', [streaming_indicators.StreamingSMA, streaming_indicators.StreamingWMA])
+def test_running_sums_resync_without_changing_values(cls, monkeypatch):
+    monkeypatch.setattr(streaming_indicators, 'RESYNC_EVERY', 4)
+    indicator = cls(5)
+    streamed = stream(indicator, PRICES)
+    np.testing.assert_allclose(streamed, moving_averages.moving_average(cls.__name__[9:], PRICES, 5), rtol=1e-12)
+    assert indicator.total == pytest.approx(sum(PRICES[-5:]), abs=0)  # last update was a resync (120 % 4 == 0)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    indicators = {'macd': streaming_indicators.StreamingMACD(), 'sma': streaming_indicators.StreamingSMA(10),
+                  't3': streaming_indicators.StreamingT3(5)}
+    for indicator in indicators.values():
+        indicator.seed(PRICES[:80])
+    streaming_indicators.save_checkpoint(tmp_path / 'state.json', indicators)
+    restored = streaming_indicators.load_checkpoint(tmp_path / 'state.json')
+    for name, indicator in indicators.items():
+        for price in PRICES[80:]:
+            assert restored[name].update(price) == indicator.update(price)
+
+
+def test_obv_and_ad_reference_values():
+    bars = [
+        {'high': 11.0, 'low': 9.0, 'close': 10.0, 'volume': 100.0},
+        {'high': 12.0, 'low': 10.0, 'close': 12.0, 'volume': 50.0},
+        {'high': 12.0, 'low': 10.0, 'close': 10.5, 'volume': 40.0},
+    ]
+    obv, ad = streaming_indicators.StreamingOBV(), streaming_indicators.StreamingAD()
+    assert [obv.update(b) for b in bars] == [100.0, 150.0, 110.0]
+    # Money-flow multipliers 0, 1, -0.5
+    assert [ad.update(b) for b in bars] == [0.0, 50.0, 30.0]
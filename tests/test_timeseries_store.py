@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from alpha_vantage_data import timeseries_store
+from tests.conftest import daily_bars
+
+
+def test_upsert_counts_only_new_bars_and_merges_columns(store):
+    first = daily_bars(['2023-12-28', '2023-12-29', '2024-01-02'], [10.0, 11.0, 12.0])
+    assert timeseries_store.upsert('ibm', 'daily', first) == 3
+
+    # One overlapping bar (new close) and one new bar; adjusted_close only arrives with the second batch
+    second = daily_bars(['2024-01-02', '2024-01-03'], [12.5, 13.0]).assign(adjusted_close=[12.4, 12.9])
+    assert timeseries_store.upsert('IBM', 'daily', second) == 1
+
+    bars = timeseries_store.read('IBM', 'daily')
+    assert bars['timestamp'].tolist() == list(pd.to_datetime(['2023-12-28', '2023-12-29', '2024-01-02', '2024-01-03']))
+    np.testing.assert_array_equal(bars['close'], [10.0, 11.0, 12.5, 13.0])
+    np.testing.assert_array_equal(bars['adjusted_close'], [np.nan, np.nan, 12.4, 12.9])
+    assert (timeseries_store.partition_dir('IBM', 'daily', 2023) / 'data.parquet').exists()
+    assert (timeseries_store.partition_dir('IBM', 'daily', 2024) / 'data.parquet').exists()
+
+
+def test_raw_upsert_keeps_stored_adjusted_close(store):
+    adjusted = daily_bars(['2024-01-02'], [12.0]).assign(adjusted_close=[11.5])
+    timeseries_store.upsert('IBM', 'daily', adjusted)
+    assert timeseries_store.upsert('IBM', 'daily', daily_bars(['2024-01-02'], [12.0])) == 0
+    assert timeseries_store.read('IBM', 'daily')['adjusted_close'].tolist() == [11.5]
+
+
+def test_normalize_ohlcv_aliases_and_duplicates():
+    raw = pd.DataFrame({
+        'Date': ['2024-01-03', '2024-01-02', '2024-01-03'],
+        'Close': ['1.5', '2.5', '3.5'],
+        'volume': ['10', '20', 'x'],
+    })
+    out = timeseries_store.normalize_ohlcv(raw)
+    assert out['timestamp'].tolist() == list(pd.to_datetime(['2024-01-02', '2024-01-03']))
+    np.testing.assert_array_equal(out['close'], [2.5, 3.5])      # last duplicate wins
+    np.testing.assert_array_equal(out['volume'], [20.0, np.nan])  # unparseable -> NaN
+    assert list(out.columns) == timeseries_store.OHLCV_COLUMNS
+
+
+def test_range_reads_wide_matrix_and_last_timestamp(store):
+    timeseries_store.upsert('AAA', 'daily', daily_bars(['2023-06-01', '2024-01-02', '2024-01-03'], [1.0, 2.0, 3.0]))
+    timeseries_store.upsert('BBB', 'daily', daily_bars(['2024-01-03', '2024-01-04'], [30.0, 40.0]))
+
+    ranged = timeseries_store.read(['AAA', 'BBB'], 'daily', start='2024-01-01', end='2024-01-03')
+    assert list(zip(ranged['symbol'], ranged['close'])) == [('AAA', 2.0), ('AAA', 3.0), ('BBB', 30.0)]
+
+    wide = timeseries_store.read_wide(['BBB', 'AAA'], 'daily', start='2024-01-01')
+    assert list(wide.columns) == ['BBB', 'AAA']
+    np.testing.assert_array_equal(wide['AAA'], [2.0, 3.0, np.nan])
+    np.testing.assert_array_equal(wide['BBB'], [np.nan, 30.0, 40.0])
+
+    assert timeseries_store.last_timestamp('AAA', 'daily') == pd.Timestamp('2024-01-03')
+    assert timeseries_store.last_timestamp('CCC', 'daily') is None
+    assert sorted(timeseries_store.stored_symbols('daily')) == ['AAA', 'BBB']
+
+
+def test_truncate_removes_bars_from_start(store):
+    timeseries_store.upsert('AAA', 'weekly', daily_bars(['2023-12-29', '2024-01-05', '2024-01-12'], [1.0, 2.0, 3.0]))
+    assert timeseries_store.truncate('AAA', 'weekly', '2024-01-01') == 2
+    assert timeseries_store.read('AAA', 'weekly')['close'].tolist() == [1.0]
+    assert not (timeseries_store.partition_dir('AAA', 'weekly', 2024) / 'data.parquet').exists()
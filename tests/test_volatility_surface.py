@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpha_vantage_data.Options import option_pricing, volatility_surface
+
+DATE = '2024-01-02'
+NEAR, FAR = '2024-02-01', '2024-04-01'
+STRIKES = np.arange(80.0, 121.0, 5.0)
+
+
+def smile(expiration, strike):
+    # Near expiry: linear skew 0.2 + 0.002 * (K - 100); far expiry: flat 0.3
+    return 0.2 + 0.002 * (strike - 100.0) if expiration == NEAR else 0.3
+
+
+def make_chain(near_shift=0.0):
+    rows = [{'symbol': 'IBM', 'date': DATE, 'expiration': expiration, 'strike': k, 'type': kind, 'mark': 1.0,
+             'implied_volatility': smile(expiration, k) + (near_shift if expiration == NEAR else 0.0)}
+            for expiration in (NEAR, FAR) for k in STRIKES for kind in ('call', 'put')]
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def surface_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(volatility_surface, 'SURFACE_DIR', tmp_path / 'Surface_Cache')
+    monkeypatch.setattr(volatility_surface, '_SURFACES', {})
+    return tmp_path / 'Surface_Cache'
+
+
+def tenor(expiration):
+    return float(option_pricing.years_to_expiry(expiration, DATE))
+
+
+def test_lookup_reference_values():
+    surface = volatility_surface.VolatilitySurface('IBM', DATE, 100.0)
+    assert surface.update(make_chain()) == [NEAR, FAR]
+    t1, t2 = tenor(NEAR), tenor(FAR)
+
+    np.testing.assert_allclose(surface.lookup([90.0, 105.0], t1), [0.18, 0.21], rtol=1e-12)
+    # Between strike columns (107 / 108) the total variance is interpolated, not the vol
+    np.testing.assert_allclose(surface.lookup(107.5, t1), np.sqrt((0.214 ** 2 + 0.216 ** 2) / 2), rtol=1e-12)
+    np.testing.assert_allclose(surface.lookup_expiry(105.0, FAR), 0.3, rtol=1e-12)
+    # Flat beyond the quoted strikes and tenors
+    np.testing.assert_allclose(surface.lookup([60.0, 400.0], t1), [0.16, 0.24], rtol=1e-12)
+    np.testing.assert_allclose(surface.lookup(100.0, [0.001, 5.0]), [0.2, 0.3], rtol=1e-12)
+    # Linear in total variance between expirations
+    t = (t1 + t2) / 2
+    expected = np.sqrt((0.2 ** 2 * t1 + 0.3 ** 2 * t2) / 2 / t)
+    np.testing.assert_allclose(surface.lookup(100.0, t), expected, rtol=1e-12)
+
+
+def test_new_spot_refits_nothing_and_moneyness_follows_it():
+    surface = volatility_surface.VolatilitySurface('IBM', DATE, 100.0)
+    surface.update(make_chain())
+    assert surface.update(make_chain()) == []
+    assert surface.update(make_chain(), spot=110.0) == []
+
+    t1 = tenor(NEAR)
+    np.testing.assert_allclose(surface.lookup(105.0, t1), 0.21, rtol=1e-12)
+    np.testing.assert_allclose(surface.lookup_moneyness(1.0, t1), 0.22, rtol=1e-12)
+    np.testing.assert_allclose(surface.to_frame().columns, surface.strikes / 110.0)
+
+    # Only the expiration whose quotes moved is refitted
+    assert surface.update(make_chain(near_shift=0.01)) == [NEAR]
+    np.testing.assert_allclose(surface.lookup(105.0, t1), 0.22, rtol=1e-12)
+
+
+def test_save_load_round_trip(surface_dir):
+    surface = volatility_surface.VolatilitySurface('IBM', DATE, 100.0)
+    surface.update(make_chain())
+    volatility_surface.save_surface(surface)
+
+    loaded = volatility_surface.load_surface('IBM', DATE)
+    np.testing.assert_array_equal(loaded.strikes, surface.strikes)
+    assert loaded.signatures == surface.signatures
+    assert loaded.update(make_chain()) == []
+    np.testing.assert_allclose(loaded.lookup(105.0, tenor(NEAR)), 0.21, rtol=1e-12)
+
+
+def test_build_surface_defaults_rate_to_treasury_yield(surface_dir, monkeypatch):
+    calls = []
+
+    def fake_rate(as_of=None):
+        calls.append(as_of)
+        return 0.05
+
+    monkeypatch.setattr(volatility_surface, 'risk_free_rate', fake_rate)
+    # Marks consistent with a 100 spot at r = 5%, so implied_spot has real put-call pairs to work with
+    chain = make_chain()
+    t = option_pricing.years_to_expiry(chain['expiration'], DATE)
+    chain['mark'] = option_pricing.bs_price(100.0, chain['strike'].to_numpy(), t, 0.05,
+                                            chain['implied_volatility'].to_numpy(), chain['type'].eq('call').to_numpy())
+    surfaces = volatility_surface.build_surface(chain)
+
+    assert calls == [DATE]
+    assert surfaces[DATE].spot == pytest.approx(100.0, abs=1e-9)
+    assert volatility_surface.surface_path('IBM', DATE).exists()
+    assert volatility_surface.get_surface('ibm', DATE) is surfaces[DATE]